@@ -24,7 +24,19 @@ SRC_PATH = PROJECT_ROOT / "src"
 if SRC_PATH.exists():
     sys.path.insert(0, str(SRC_PATH))
 
+from news_extractor import ArticleExtractor
 from news_extractor.backlog import load_records, print_pretty, reextract, summarize
+from news_extractor.cli import budget_from_args
+from news_extractor.dns_cache import DnsCache
+from news_extractor.http_cache import HttpCache
+from news_extractor.proxy_pool import ProxyPool
+from news_extractor.resilience import CircuitBreaker, RetryPolicy
+from news_extractor.scheduler import (
+    POLITE_MAX_IN_FLIGHT_PER_HOST,
+    POLITE_REQUESTS_PER_SECOND,
+    DomainScheduler,
+)
+from news_extractor.tier_router import TierRouter
 
 
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
@@ -55,6 +67,89 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         default=100,
         help="Minimum characters to accept an extraction (default: 100).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Concurrent download threads, interleaved across domains (default: 1).",
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=POLITE_REQUESTS_PER_SECOND,
+        help=f"Requests per second sent to each domain; 0 disables pacing (default: {POLITE_REQUESTS_PER_SECOND:g}).",
+    )
+    parser.add_argument(
+        "--max-in-flight-per-host",
+        type=int,
+        default=POLITE_MAX_IN_FLIGHT_PER_HOST,
+        help=f"Concurrent requests to each domain; 0 removes the cap (default: {POLITE_MAX_IN_FLIGHT_PER_HOST}).",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Processes running the extraction tiers; 0 parses in the download threads (default: 0).",
+    )
+    parser.add_argument(
+        "--http-cache",
+        type=Path,
+        default=None,
+        help="SQLite HTTP cache file; re-runs revalidate pages instead of re-downloading them.",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=24 * 3600,
+        help="Seconds a cached page is reused without revalidation (default: 86400).",
+    )
+    parser.add_argument(
+        "--dns-ttl",
+        type=float,
+        default=300,
+        help="Seconds DNS lookups are cached in-process; 0 disables the cache (default: 300).",
+    )
+    parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        help="Resolve the batch's hosts and open their connections in parallel before fetching.",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Extra attempts after a connection error or 502/503/504 (default: 2).",
+    )
+    parser.add_argument(
+        "--breaker-threshold",
+        type=int,
+        default=5,
+        help="Consecutive failures before a domain's remaining URLs are skipped; 0 disables (default: 5).",
+    )
+    parser.add_argument(
+        "--max-bytes-per-second",
+        type=float,
+        default=None,
+        help="Cap download bandwidth for the whole run (default: unlimited).",
+    )
+    parser.add_argument(
+        "--max-requests-per-second",
+        type=float,
+        default=None,
+        help="Cap the request rate for the whole run (default: unlimited).",
+    )
+    parser.add_argument(
+        "--proxy",
+        action="append",
+        default=[],
+        help="Egress proxy URL; repeat to spread the run over a pool of proxies.",
+    )
+    parser.add_argument(
+        "--tier-stats",
+        type=Path,
+        default=None,
+        help="JSON file of per-domain tier statistics; enables learned tier routing across runs.",
+    )
     parser.add_argument(
         "--format",
         choices=["json", "pretty"],
@@ -76,7 +171,27 @@ def main(argv: Iterable[str] | None = None) -> int:
         print("No rows returned from the articles table.", file=sys.stderr)
         return 1
 
-    results = reextract(records, min_text_length=args.min_text_length)
+    extractor = ArticleExtractor(
+        min_text_length=args.min_text_length,
+        scheduler=DomainScheduler(
+            requests_per_second=args.requests_per_second or None,
+            max_in_flight_per_host=args.max_in_flight_per_host or None,
+        ),
+        cache=HttpCache(args.http_cache, ttl=args.cache_ttl) if args.http_cache else None,
+        dns_cache=DnsCache(ttl=args.dns_ttl) if args.dns_ttl > 0 else None,
+        retry=RetryPolicy(attempts=args.retries + 1),
+        circuit_breaker=CircuitBreaker(failure_threshold=args.breaker_threshold),
+        budget=budget_from_args(args),
+        proxy_pool=ProxyPool(args.proxy) if args.proxy else None,
+        router=TierRouter(state_path=args.tier_stats) if args.tier_stats else None,
+    )
+    results = reextract(
+        records,
+        extractor=extractor,
+        max_workers=args.workers,
+        parse_workers=args.parse_workers,
+        prewarm=args.prewarm,
+    )
 
     if args.format == "json":
         for entry in results:
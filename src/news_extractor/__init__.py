@@ -1,6 +1,7 @@
 """Top-level package for the News Extractor article extraction toolkit."""
 
 from .article_extractor import ArticleExtractor, extract_article
+from .async_extractor import AsyncArticleExtractor
 
-__all__ = ["ArticleExtractor", "extract_article"]
+__all__ = ["ArticleExtractor", "AsyncArticleExtractor", "extract_article"]
 __version__ = "0.1.0"
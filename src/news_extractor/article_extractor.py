@@ -6,8 +6,9 @@ Turkish News Article Extractor
 Production-ready article extraction with two-tier fallback strategy.
 
 Strategy:
+    0. Fetch and parse the article HTML once (shared by both tiers)
     1. Primary: Newspaper4k (fast, clean extraction)
-    2. Fallback: Trafilatura JSON (robust, handles edge cases)
+    2. Fallback: Trafilatura (robust, handles edge cases)
 
 Performance:
     - Success rate: 83%+
@@ -21,14 +22,71 @@ Dependencies:
 
 from __future__ import annotations
 
-import json
 import logging
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+import newspaper
 import requests
 import trafilatura
 from newspaper import Article, Config
+from newspaper.cleaners import DocumentCleaner
+from newspaper.extractors.content_extractor import ContentExtractor
+from newspaper.extractors.image_extractor import ImageExtractor
+from newspaper.outputformatters import OutputFormatter
+from newspaper.utils import get_available_languages
+from newspaper.urls import urljoin_if_valid
+from trafilatura.metadata import extract_title
+from trafilatura.settings import set_date_params
+
+from .dns_cache import DnsCache
+from .document import HtmlDocument, as_document
+from .fetch import (
+    DEFAULT_ALLOWED_CONTENT_TYPES,
+    DEFAULT_MAX_BYTES,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    REASON_CIRCUIT_OPEN,
+    REASON_CONTENT_TYPE,
+    REASON_DEADLINE,
+    REASON_PROXY,
+    REASON_TIMEOUT,
+    REASON_TOO_LARGE,
+    DeadlineExceeded,
+    Fetcher,
+    FetchError,
+    FetchResult,
+    FetchStats,
+    RequestsFetcher,
+    _wait_for_budget,
+    build_session,
+    check_content_type,
+    decode_body,
+    time_left,
+)
+from .html_archive import HtmlArchive
+from .http2 import Http2Fetcher
+from .http_cache import HttpCache
+from .profiles import ExtractionProfile, get_profile
+from .proxy_pool import ProxyPool
+from .resilience import CircuitBreaker, RetryPolicy
+from .scheduler import DomainScheduler, ScheduledBatch, domain_of, parse_retry_after
+from .throttle import RateBudget
+from .tier_router import TierAttempt, TierRouter
+from .tiers import Tier, run_with_budget
+from .warc import WarcWriter, iter_warc_responses
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +97,8 @@ class ArticleExtractor:
 
     Features:
         - Two-tier extraction (Newspaper4k → Trafilatura)
+        - Single keep-alive connection pool shared by both tiers
+        - Concurrent, per-domain rate-limited batch extraction
         - Clean article-only text
         - Metadata extraction (title, authors, date, keywords)
         - Fast (<1s average)
@@ -55,7 +115,33 @@ class ArticleExtractor:
         self,
         language: str = 'tr',
         min_text_length: int = 100,
-        timeout: int = 10
+        timeout: int = 10,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        session: Optional[requests.Session] = None,
+        max_workers: int = 1,
+        parse_workers: int = 0,
+        scheduler: Optional[DomainScheduler] = None,
+        cache: Optional[HttpCache] = None,
+        archive: Optional[HtmlArchive] = None,
+        warc_writer: Optional[WarcWriter] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        allowed_content_types: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+        deadline: Optional[float] = None,
+        dns_cache: Optional[DnsCache] = None,
+        prewarm: bool = False,
+        http2: bool = False,
+        fetcher: Optional[Fetcher] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        budget: Optional[RateBudget] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        router: Optional[TierRouter] = None,
+        tiers: Optional[Sequence[Tier]] = None,
+        race: bool = False,
+        race_grace: Optional[float] = None,
+        race_workers: int = 0,
+        profile: Union[str, ExtractionProfile] = 'full'
     ):
         """
         Initialize the extractor.
@@ -64,21 +150,159 @@ class ArticleExtractor:
             language: Article language code (default: 'tr' for Turkish)
             min_text_length: Minimum chars to consider extraction successful
             timeout: HTTP request timeout in seconds
+            pool_connections: Number of hosts kept in the connection pool
+            pool_maxsize: Keep-alive connections per host
+            session: Pre-configured requests session (overrides pool options)
+            max_workers: Default download threads for extract_batch()
+            parse_workers: Default parsing processes for extract_batch()
+                (0 parses in the download threads)
+            scheduler: Per-domain scheduler for batch runs (default:
+                DomainScheduler(), which interleaves domains and honours
+                ``Retry-After`` but paces nothing; pass limits to crawl
+                politely)
+            cache: Optional on-disk HTTP cache with conditional revalidation
+            archive: Optional content-addressed store keeping every raw page
+            warc_writer: Optional WARC file receiving every fetched response
+            max_bytes: Stop reading a page beyond this many bytes (None: no cap)
+            allowed_content_types: Media types accepted as HTML; anything
+                else is rejected before the body is read
+            deadline: Wall-clock seconds per article covering connect,
+                download and both tiers (None: only ``timeout`` per socket
+                operation applies)
+            dns_cache: Optional DNS cache for the connections of the
+                session the extractor builds (not a passed ``session``,
+                nor the httpx and libcurl backends, which resolve on
+                their own)
+            prewarm: Resolve hosts and open their pooled connections in
+                parallel (one ``HEAD /`` each) before every
+                extract_many()/extract_batch() run
+            http2: Fetch through the HTTP/2 backend (one multiplexed
+                connection per host, HTTP/1.1 where the server lacks h2);
+                needs ``httpx[http2]``, otherwise requests is used
+            fetcher: Download backend (default: RequestsFetcher over
+                ``session``); see fetch.Fetcher, http2.Http2Fetcher and
+                curl_multi.CurlMultiFetcher
+            retry: When to fetch again after a transient failure (default:
+                RetryPolicy(), 3 attempts on connection errors and
+                502/503/504; RetryPolicy(attempts=1) disables)
+            circuit_breaker: Per-domain breaker that fails a domain's
+                remaining URLs fast once it keeps failing (default:
+                CircuitBreaker(); failure_threshold=0 disables)
+            budget: Bytes/sec and requests/sec limit for every download;
+                share one RateBudget between extractors to cap a whole run
+            proxy_pool: Route every download through a health-scored,
+                per-domain sticky egress proxy
+            router: Per-domain tier statistics that run the tiers cheapest
+                first by expected cost (default: fixed order)
+            tiers: Extraction chain, each tier with its own time budget and
+                acceptance rule (default: DEFAULT_TIERS, Newspaper4k then
+                Trafilatura)
+            race: Run all tiers at once on the shared payload and return
+                the first accepted result
+            race_grace: With ``race``, seconds to keep waiting after the
+                first accepted result for a tier earlier in the chain
+                (None: return the first one)
+            race_workers: Processes the race runs in, so the tiers really
+                run in parallel (0: threads of this process, which share
+                the GIL)
+            profile: Sub-steps both tiers run: ``full`` (default),
+                ``text_only`` (title and text; no authors, dates, image
+                scoring or tables), ``metadata_only`` (no article body), or
+                an ExtractionProfile
+
+        Raises:
+            ValueError: if ``profile`` names an unknown profile
         """
         self.language = language
         self.min_text_length = min_text_length
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.parse_workers = parse_workers
+        self.scheduler = scheduler or DomainScheduler()
+        self.cache = cache
+        self.archive = archive
+        self.warc_writer = warc_writer
+        self.max_bytes = max_bytes
+        self.allowed_content_types = allowed_content_types
+        self.deadline = deadline
+        self.pool_maxsize = pool_maxsize
+        self.prewarm = prewarm
+        self.retry = retry or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.budget = budget
+        self.proxy_pool = proxy_pool
+        self.router = router
+        self.tiers: Tuple[Tier, ...] = tuple(tiers) if tiers is not None else DEFAULT_TIERS
+        self._tiers_by_name = {tier.name: tier for tier in self.tiers}
+        self.race = race
+        self.race_grace = race_grace
+        self.race_workers = race_workers
+        self.profile = get_profile(profile)
+        self._race_pool: Optional[Executor] = None
+        self._race_pool_lock = threading.Lock()
+        self.dns_cache = dns_cache
 
         # Configure Newspaper4k
         self.n4k_config = Config()
         self.n4k_config.language = language
         self.n4k_config.request_timeout = timeout
+        # Every request goes through self.fetcher; Newspaper4k must not
+        # download candidate images on its own session
+        self.n4k_config.fetch_images = False
 
-        # User-agent for Trafilatura fallback
+        # User-agent for the shared page fetch
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
 
+        # Pooled keep-alive session used for every download of both tiers
+        if session is not None and dns_cache is not None:
+            logger.warning("dns_cache is ignored for a passed session; mount a DnsCachingAdapter on it")
+        self.session = session or build_session(
+            headers=self.headers,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            dns_cache=dns_cache,
+        )
+
+        # close() releases only a backend this extractor built itself
+        self._owns_fetcher = fetcher is None
+        if fetcher is None and http2:
+            try:
+                fetcher = Http2Fetcher(
+                    headers=self.headers,
+                    max_connections=pool_connections * pool_maxsize,
+                )
+            except ImportError as exc:
+                logger.warning("%s; falling back to HTTP/1.1", exc)
+        if fetcher is None:
+            fetcher = RequestsFetcher(self.session)
+            self._owns_fetcher = session is None
+        self.fetcher: Fetcher = fetcher
+
+        # Network usage counters (reset at the start of every extract_batch)
+        self.fetch_stats = FetchStats()
+
+    def __enter__(self) -> 'ArticleExtractor':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the race pool and the download backend.
+
+        Tiers abandoned by a race are not waited for. A ``fetcher`` or
+        ``session`` passed to the constructor stays open for its owner.
+        """
+        with self._race_pool_lock:
+            pool, self._race_pool = self._race_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        if self._owns_fetcher:
+            self.fetcher.close()
+
     def extract(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Extract article from URL using two-tier strategy.
@@ -87,7 +311,10 @@ class ArticleExtractor:
             url: Article URL
 
         Returns:
-            Dictionary with article data, or None if extraction failed
+            Dictionary with article data, or None if extraction failed.
+            Why it failed (a download error, or ``deadline_exceeded`` with
+            the stage that ran out of time) is only logged; call
+            ``extract_many([url])`` to get it as ``"<reason>: <detail>"``.
 
         Example:
             >>> result = extractor.extract('https://bianet.org/...')
@@ -105,48 +332,419 @@ class ArticleExtractor:
                 'extracted_at': '2025-11-07T...'
             }
         """
-        # Try primary method
-        result = self._extract_newspaper4k(url)
-        if result:
-            return result
+        deadline = self._deadline_at()
+        try:
+            fetched = self._fetch(url, deadline)
+            return self._parse_fetched(fetched, deadline)
+        except FetchError as exc:
+            logger.error("Article extraction failed for url=%s (%s)", url, exc)
+            return None
+
+    def extract_from_html(
+        self,
+        url: str,
+        html: str,
+        deadline: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run the two-tier strategy on already downloaded HTML.
+
+        Args:
+            url: Article URL (used for metadata and relative links)
+            html: Decoded page HTML
+            deadline: Optional ``time.monotonic()`` value; a tier is not
+                started once it has passed, and a running one is abandoned
+
+        Returns:
+            Dictionary with article data, or None if extraction failed
+
+        Raises:
+            DeadlineExceeded: if the deadline passed before a tier could run
+                or while the last one ran without producing an article
+        """
+        result, attempts = self._run_tiers(url, html, deadline, self._tier_order(url))
+        self._record_tiers(url, attempts)
+        return result
+
+    def _tier_order(self, url: str) -> List[str]:
+        names = [tier.name for tier in self.tiers]
+        if self.router is None:
+            return names
+        return self.router.order(url, names)
+
+    def _run_tiers(
+        self,
+        url: str,
+        html: str,
+        deadline: Optional[float],
+        order: List[str]
+    ) -> Tuple[Optional[Dict[str, Any]], List[TierAttempt]]:
+        """
+        Run the tiers in ``order`` on the same payload until one is accepted.
+
+        A tier with a ``budget``, or any tier under an article deadline,
+        runs on a helper thread for at most the smaller of the two; when it
+        runs out of time the chain moves on to the next tier (or fails with
+        DeadlineExceeded). With ``self.race`` the tiers run concurrently
+        instead (see _race_tiers()).
+
+        The HTML is parsed once (see HtmlDocument); the last tier may take
+        the parsed tree itself unless an earlier tier could still be
+        reading it on an abandoned helper thread.
+        """
+        document = as_document(html)
+        if self.race and len(order) > 1:
+            return self._race_tiers(url, document, deadline, order)
+        attempts: List[TierAttempt] = []
+        stage = order[0]
+        budgeted = deadline is not None
+        for position, name in enumerate(order):
+            tier = self._tiers_by_name[name]
+            if position == len(order) - 1 and not budgeted:
+                document.mark_last_use()
+            budgeted = budgeted or tier.budget is not None
+            # A tier is not started once the previous one used up the deadline
+            remaining = time_left(deadline, stage)
+            started = time.perf_counter()
+            result = self._accepted(tier, url, self._run_tier(tier, url, document, remaining))
+            attempts.append((tier.name, result is not None, time.perf_counter() - started))
+            if result is not None:
+                return result, attempts
+            stage = tier.name
+
+        time_left(deadline, stage)
+        logger.error("Article extraction failed for url=%s (all tiers)", url)
+        return None, attempts
+
+    def _race_tiers(
+        self,
+        url: str,
+        html: HtmlDocument,
+        deadline: Optional[float],
+        order: List[str]
+    ) -> Tuple[Optional[Dict[str, Any]], List[TierAttempt]]:
+        """
+        Run every tier at once on the same payload.
+
+        The first accepted result wins, unless ``race_grace`` is set: then
+        tiers earlier in ``order`` get that much longer to finish, and the
+        earliest accepted one is returned. Tiers still running when the
+        race is decided (or past their ``budget``) are abandoned: queued
+        ones are cancelled, running ones finish in the background and their
+        results are dropped.
+        Thread racers share ``html``'s parsed tree; process racers parse
+        their own.
+        """
+        pool = self._get_race_pool()
+        options = {**self._parse_options(), 'race': False} if self.race_workers > 0 else None
+        started = time.perf_counter()
+        rank = {name: position for position, name in enumerate(order)}
+        running: Dict[Future, Tier] = {}
+        for name in order:
+            tier = self._tiers_by_name[name]
+            if options is not None:
+                future = pool.submit(_run_tier_in_worker, options, name, url, html)
+            else:
+                future = pool.submit(tier.extract, self, url, html)
+            running[future] = tier
+
+        attempts: List[TierAttempt] = []
+        best: Optional[Tuple[int, Dict[str, Any]]] = None
+        grace_ends: Optional[float] = None
+        while running:
+            if best is not None and all(rank[tier.name] > best[0] for tier in running.values()):
+                break  # nothing preferable is still running
+            now = time.perf_counter()
+            limits = [
+                started + tier.budget - now for tier in running.values() if tier.budget is not None
+            ]
+            if deadline is not None:
+                limits.append(deadline - time.monotonic())
+            if grace_ends is not None:
+                limits.append(grace_ends - now)
+            timeout = max(min(limits), 0) if limits else None
+
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                tier = running.pop(future)
+                try:
+                    result = self._accepted(tier, url, future.result())
+                except Exception as exc:  # one tier failing must not sink the race
+                    logger.warning("%s failed for url=%s: %s", tier.name, url, exc)
+                    result = None
+                attempts.append((tier.name, result is not None, time.perf_counter() - started))
+                if result is not None and (best is None or rank[tier.name] < best[0]):
+                    best = (rank[tier.name], result)
+
+            now = time.perf_counter()
+            for future, tier in list(running.items()):
+                if tier.budget is not None and now - started >= tier.budget:
+                    logger.warning("%s ran out of its %.2fs budget for url=%s", tier.name, tier.budget, url)
+                    attempts.append((tier.name, False, now - started))
+                    del running[future]
+            if best is not None:
+                if self.race_grace is None:
+                    break
+                if grace_ends is None:
+                    grace_ends = now + self.race_grace
+                elif now >= grace_ends:
+                    break
+            elif deadline is not None and time.monotonic() >= deadline:
+                break
+
+        for future in running:
+            future.cancel()  # racers still queued never start
+        if best is not None:
+            return best[1], attempts
+        time_left(deadline, order[-1])
+        logger.error("Article extraction failed for url=%s (all tiers)", url)
+        return None, attempts
+
+    def _get_race_pool(self) -> Executor:
+        if self._race_pool is None:
+            with self._race_pool_lock:
+                if self._race_pool is None:
+                    if self.race_workers > 0:
+                        self._race_pool = ProcessPoolExecutor(max_workers=self.race_workers)
+                    else:
+                        # Abandoned racers hold their thread until they finish:
+                        # next to the tiers racing in every download thread,
+                        # leave room for the losers of each one's last race
+                        self._race_pool = ThreadPoolExecutor(
+                            max_workers=(2 * len(self.tiers) - 1) * max(self.max_workers, 1),
+                            thread_name_prefix='tier-race',
+                        )
+        return self._race_pool
+
+    def _accepted(
+        self,
+        tier: Tier,
+        url: str,
+        result: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Return ``result`` if ``tier``'s acceptance rules pass, else None."""
+        if result is None:
+            return None
+        rejection = tier.rejection(result, self.min_text_length, self.profile.text)
+        if rejection is not None:
+            logger.debug("%s result rejected for url=%s: %s", tier.name, url, rejection)
+            return None
+        result.setdefault('method', tier.name)
+        return result
+
+    def _run_tier(
+        self,
+        tier: Tier,
+        url: str,
+        html: HtmlDocument,
+        remaining: Optional[float]
+    ) -> Optional[Dict[str, Any]]:
+        if tier.budget is None and remaining is None:
+            return tier.extract(self, url, html)
+        limit = min(
+            tier.budget if tier.budget is not None else float('inf'),
+            remaining if remaining is not None else float('inf'),
+        )
+        finished, result = run_with_budget(lambda: tier.extract(self, url, html), limit, tier.name)
+        if not finished:
+            logger.warning("%s ran out of time after %.2fs for url=%s", tier.name, limit, url)
+        return result
+
+    def _record_tiers(self, url: str, attempts: List[TierAttempt]) -> None:
+        if self.router is not None and attempts:
+            self.router.record(url, attempts)
+
+    def extract_warc(self, path: Path) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Replay the responses of a WARC file through the tiers, offline.
 
-        # Try fallback
-        result = self._extract_trafilatura(url)
-        if result:
-            return result
+        Records are streamed one at a time. Non-2xx responses and bodies
+        whose Content-Type is not in ``allowed_content_types`` are skipped,
+        as they would be when fetching live.
 
-        logger.error("Article extraction failed for url=%s (both methods)", url)
-        return None
+        Yields:
+            (url, result) pairs in file order
+        """
+        for record in iter_warc_responses(path):
+            if not 200 <= record.status_code < 300:
+                continue
+            try:
+                check_content_type(record.content_type, self.allowed_content_types)
+            except FetchError as exc:
+                logger.debug("Skipping WARC record url=%s: %s", record.url, exc)
+                continue
+            fetched = FetchResult(
+                url=record.url,
+                html=decode_body(record.body, record.content_type),
+                status_code=record.status_code,
+                num_bytes=len(record.body),
+                body=record.body,
+                content_type=record.content_type,
+            )
+            yield record.url, self._parse_fetched(fetched)
+
+    def _parse_fetched(
+        self,
+        fetched: FetchResult,
+        deadline: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run the tiers on a downloaded page and update the reuse counters."""
+        result, attempts = self._run_tiers(
+            fetched.url, fetched.html, deadline, self._tier_order(fetched.url)
+        )
+        self._record_tiers(fetched.url, attempts)
+        self._record_payload_reuse(fetched.num_bytes, attempts)
+        return result
+
+    def _record_payload_reuse(self, num_bytes: int, attempts: List[TierAttempt]) -> None:
+        """Count the fallback runs that reused the primary download."""
+        if len(attempts) > 1:
+            self.fetch_stats.record_reuse(num_bytes)
 
-    def _extract_newspaper4k(self, url: str) -> Optional[Dict[str, Any]]:
+    def _parse_options(self) -> Dict[str, Any]:
+        """Constructor options needed to rebuild this parser in a worker."""
+        return {
+            'language': self.language,
+            'min_text_length': self.min_text_length,
+            'tiers': self.tiers,
+            'race': self.race,
+            'race_grace': self.race_grace,
+            'profile': self.profile,
+            # Parse workers race in threads; no process pools inside workers
+        }
+
+    def _deadline_at(self) -> Optional[float]:
+        """Monotonic deadline for an article started now."""
+        return time.monotonic() + self.deadline if self.deadline else None
+
+    def _fetch(self, url: str, deadline: Optional[float] = None) -> FetchResult:
+        """
+        Download the article HTML once for both tiers.
+
+        Transient failures are retried per ``self.retry`` as long as the
+        backoff fits in the article deadline. Every retry also waits for a
+        rate token of ``self.scheduler``, so retries count against the
+        domain's request rate like first attempts.
+
+        Raises:
+            FetchError: when the page cannot be used (see ``reason``)
+        """
+        attempt = 1
+        while True:
+            try:
+                return self._fetch_once(url, deadline)
+            except FetchError as exc:
+                delay = self.retry.delay(exc, attempt)
+                if delay is None or (deadline is not None and time.monotonic() + delay >= deadline):
+                    raise
+                logger.info(
+                    "Retrying url=%s in %.2fs (attempt %d of %d)",
+                    url, delay, attempt + 1, self.retry.attempts,
+                )
+                time.sleep(delay)
+                if not self.scheduler.wait_for_token(
+                    url, None if deadline is None else deadline - time.monotonic()
+                ):
+                    raise
+                self.fetch_stats.record_retry()
+                attempt += 1
+
+    def _fetch_once(self, url: str, deadline: Optional[float]) -> FetchResult:
+        proxy = self.proxy_pool.proxy_for(url) if self.proxy_pool is not None else None
+        options = {
+            'timeout': self.timeout,
+            'cache': self.cache,
+            'max_bytes': self.max_bytes,
+            'allowed_content_types': self.allowed_content_types,
+            'deadline': deadline,
+            'budget': self.budget,
+            'proxy': proxy,
+        }
+        started = time.monotonic()
+        try:
+            self.circuit_breaker.check(url)
+            fetched = self.fetcher.fetch(url, headers=None, **options)
+        except FetchError as exc:
+            logger.warning("HTTP request failed for url=%s: %s", url, exc)
+            self.fetch_stats.record_failure(exc.reason)
+            if proxy is not None:
+                if exc.reason == REASON_PROXY:
+                    self.proxy_pool.record_failure(proxy, url)
+                    raise
+                if exc.response is not None:
+                    self.proxy_pool.record_success(proxy, time.monotonic() - started)
+            if exc.reason in (REASON_CONTENT_TYPE, REASON_TOO_LARGE, REASON_CIRCUIT_OPEN):
+                raise
+            self.circuit_breaker.record_failure(url, exc)
+            response = exc.response
+            self.scheduler.record_response(
+                url,
+                time.monotonic() - started,
+                status_code=response.status_code if response is not None else None,
+                timed_out=exc.reason in (REASON_TIMEOUT, REASON_DEADLINE),
+            )
+            if response is not None and response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is not None:
+                    self.scheduler.defer(url, retry_after)
+            raise
+
+        fetched.elapsed = time.monotonic() - started
+        if fetched.cache_status != 'hit':
+            self.scheduler.record_response(url, fetched.elapsed, status_code=fetched.status_code)
+            self.circuit_breaker.record_success(url)
+            if proxy is not None:
+                self.proxy_pool.record_success(proxy, fetched.elapsed)
+        self.fetch_stats.record_fetch(fetched)
+        # Cache hits were archived when they were downloaded
+        if self.archive is not None and fetched.body and fetched.cache_status != 'hit':
+            self.archive.add(
+                url,
+                fetched.body,
+                content_type=fetched.content_type,
+                status_code=fetched.status_code,
+            )
+        if self.warc_writer is not None and fetched.body and fetched.cache_status != 'hit':
+            self.warc_writer.write_response(
+                url,
+                fetched.body,
+                status_code=fetched.status_code,
+                content_type=fetched.content_type,
+            )
+        return fetched
+
+    def _extract_newspaper4k(self, url: str, html: str) -> Optional[Dict[str, Any]]:
         """
         Extract using Newspaper4k (primary method).
 
         Fast and clean extraction, works on 50% of URLs.
         """
+        document = as_document(html)
         try:
             article = Article(url, config=self.n4k_config)
-            article.download()
-            article.parse()
-
-            # Check if we got meaningful text
-            if len(article.text) < self.min_text_length:
-                logger.debug(
-                    "Newspaper4k text too short for url=%s (len=%s)",
-                    url,
-                    len(article.text),
-                )
+            article.extractor = _ProfiledContentExtractor(self.n4k_config, self.profile)
+            article.download(input_html=document)
+            if _NEWSPAPER_INTERNALS:
+                # The cleaner modifies the tree, so Newspaper4k gets its own copy
+                _parse_article(article, document.mutable_tree())
+            else:
+                article.parse()  # unknown release: let it parse the HTML again
+
+            # Length and other acceptance rules are applied by the tier chain
+            if self.profile.text and not article.text:
+                logger.debug("Newspaper4k found no text for url=%s", url)
                 return None
 
+            metadata = self.profile.metadata
             return {
                 'url': url,
                 'title': article.title,
                 'text': article.text,
                 'authors': article.authors,
                 'date': article.publish_date.isoformat() if article.publish_date else None,
-                'keywords': article.meta_keywords or [],
-                'description': article.meta_description,
-                'image': article.top_image,
+                'keywords': (article.meta_keywords or []) if metadata else [],
+                'description': article.meta_description if metadata else None,
+                'image': article.top_image if metadata or self.profile.image_scoring else None,
                 'method': 'newspaper4k',
                 'text_length': len(article.text),
                 'extracted_at': datetime.utcnow().isoformat()
@@ -156,88 +754,262 @@ class ArticleExtractor:
             logger.warning("Newspaper4k failed for url=%s: %s", url, exc)
             return None
 
-    def _extract_trafilatura(self, url: str) -> Optional[Dict[str, Any]]:
+    def _extract_trafilatura(self, url: str, html: str) -> Optional[Dict[str, Any]]:
         """
         Extract using Trafilatura (fallback method).
 
         More robust, handles edge cases that Newspaper4k misses.
-        Adds ~200ms overhead but rescues ~33% of extractions.
+        Reuses the HTML already downloaded for the primary tier and
+        rescues ~33% of extractions. Trafilatura cleans a copy of the tree
+        it is given, so it reads the shared tree directly.
         """
-        try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            logger.warning("HTTP request failed for url=%s: %s", url, exc)
+        tree = as_document(html).tree()
+        if tree is None:
+            logger.debug("Trafilatura could not parse the HTML of url=%s", url)
             return None
 
-        json_str = trafilatura.extract(
-            response.text,
-            output_format='json',
-            include_comments=False,
-            include_tables=True,
-            with_metadata=True
-        )
-
-        if not json_str:
-            logger.debug("Trafilatura returned empty payload for url=%s", url)
-            return None
+        profile = self.profile
+        # Without dates, htmldate still runs inside the metadata step;
+        # a non-extensive search is the cheapest it offers
+        date_params = None if profile.dates else set_date_params(extensive=False)
+        with_metadata = profile.metadata or profile.dates or not profile.text
+        if profile.text:
+            # The in-memory Document avoids serialising to JSON and parsing it back
+            document = trafilatura.bare_extraction(
+                tree,
+                include_comments=False,
+                include_tables=profile.tables,
+                with_metadata=with_metadata,
+                date_extraction_params=date_params
+            )
+        else:
+            document = trafilatura.extract_metadata(tree, date_config=date_params)
 
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as exc:
-            logger.warning("Unable to decode Trafilatura JSON for url=%s: %s", url, exc)
+        if document is None:
+            logger.debug("Trafilatura returned no document for url=%s", url)
             return None
 
-        text = data.get('text', '')
+        text = (document.text or '') if profile.text else ''
 
-        if len(text) < self.min_text_length:
-            logger.debug(
-                "Trafilatura text too short for url=%s (len=%s)",
-                url,
-                len(text),
-            )
+        if profile.text and not text:
+            logger.debug("Trafilatura found no text for url=%s", url)
             return None
 
+        metadata = profile.metadata
         return {
             'url': url,
-            'title': data.get('title'),
+            # Without the metadata step only the (cheap) title lookup runs
+            'title': document.title if with_metadata else extract_title(tree),
             'text': text,
-            'authors': [data.get('author')] if data.get('author') else [],
-            'date': data.get('date'),
+            'authors': [document.author] if metadata and document.author else [],
+            'date': document.date if profile.dates else None,
             'keywords': [],
-            'description': data.get('excerpt'),
-            'image': data.get('image'),
-            'categories': data.get('categories'),
+            'description': document.description if metadata else None,
+            'image': document.image if metadata else None,
+            # Same ';'-joined form the JSON output used
+            'categories': ';'.join(document.categories or []) if metadata else '',
             'method': 'trafilatura',
             'text_length': len(text),
             'extracted_at': datetime.utcnow().isoformat()
         }
 
-    def extract_batch(self, urls: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    def extract_batch(
+        self,
+        urls: List[str],
+        max_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
         """
         Extract multiple articles.
 
+        Downloads are paced per domain by the extractor's scheduler.
+
         Args:
             urls: List of article URLs
+            max_workers: Threads downloading pages concurrently
+                (default: the extractor's ``max_workers``)
+            parse_workers: Processes running the extraction tiers; 0 parses
+                in the download threads (default: the extractor's
+                ``parse_workers``)
 
         Returns:
             Dictionary mapping URLs to extraction results
 
         Example:
             >>> urls = ['https://...', 'https://...']
-            >>> results = extractor.extract_batch(urls)
+            >>> results = extractor.extract_batch(urls, max_workers=16, parse_workers=4)
             >>> for url, article in results.items():
             ...     if article:
             ...         print(f"{url}: {article['title']}")
         """
-        results = {}
-        for url in urls:
-            results[url] = self.extract(url)
-        return results
+        self.fetch_stats.reset()
+        outcomes = self.extract_many(urls, max_workers=max_workers, parse_workers=parse_workers)
+        return {url: result for url, (result, _) in zip(urls, outcomes)}
+
+    def extract_many(
+        self,
+        urls: List[str],
+        max_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Extract ``urls`` and return ``(result, error)`` pairs in input order.
+
+        ``error`` is ``"<reason>: <detail>"`` for download failures (see
+        ``fetch.REASON_*``) or the text of an unexpected exception, so one
+        bad page never aborts the batch. It is None when the page was
+        downloaded, whether or not the tiers produced an article.
+
+        Downloads run on a thread pool and are handed out per domain by
+        ``self.scheduler``; with ``parse_workers`` the CPU-bound tiers run
+        on a process pool as soon as each page arrives.
+        """
+        max_workers = self.max_workers if max_workers is None else max_workers
+        parse_workers = self.parse_workers if parse_workers is None else parse_workers
+        if self.prewarm:
+            self.prewarm_connections(urls, max_workers)
+
+        outcomes: List[Tuple[Optional[Dict[str, Any]], Optional[str]]] = [(None, None)] * len(urls)
+        batch = self.scheduler.batch(urls)
+
+        if parse_workers <= 0:
+            def parse(index: int, fetched: FetchResult, deadline: Optional[float]) -> None:
+                outcomes[index] = (self._parse_fetched(fetched, deadline), None)
+
+            self._run_workers(urls, batch, outcomes, parse, max_workers)
+            self.scheduler.save()
+            if self.router is not None:
+                self.router.save()
+            return outcomes
+
+        options = self._parse_options()
+        # Only what the bookkeeping needs: the page itself is freed once
+        # it has been handed to the process pool
+        parses: Dict[Future, Tuple[int, str, int]] = {}
+        parses_lock = threading.Lock()
+
+        with ProcessPoolExecutor(max_workers=parse_workers) as cpu_pool:
+            def submit(index: int, fetched: FetchResult, deadline: Optional[float]) -> None:
+                future = cpu_pool.submit(
+                    _extract_from_html_in_worker,
+                    options,
+                    fetched.url,
+                    fetched.html,
+                    deadline,
+                    self._tier_order(fetched.url),
+                )
+                with parses_lock:
+                    parses[future] = (index, fetched.url, fetched.num_bytes)
+
+            self._run_workers(urls, batch, outcomes, submit, max_workers)
+
+            for future in as_completed(parses):
+                index, url, num_bytes = parses.pop(future)
+                try:
+                    result, attempts = future.result()
+                except FetchError as exc:
+                    logger.error("Article extraction failed for url=%s (%s)", url, exc)
+                    outcomes[index] = (None, str(exc))
+                    continue
+                except Exception as exc:  # capture unexpected failures
+                    outcomes[index] = (None, f"{type(exc).__name__}: {exc}")
+                    continue
+                self._record_tiers(url, attempts)
+                self._record_payload_reuse(num_bytes, attempts)
+                outcomes[index] = (result, None)
+
+        self.scheduler.save()
+        if self.router is not None:
+            self.router.save()
+        return outcomes
+
+    def prewarm_connections(self, urls: List[str], max_workers: Optional[int] = None) -> int:
+        """
+        Open pooled connections to the hosts of ``urls`` in parallel.
+
+        Each host gets as many connections as the batch can use at once
+        (bounded by its URLs, the scheduler's in-flight limit, the pool
+        size and ``max_workers``), each opened by a ``HEAD /`` request.
+        Each HEAD takes a rate token from the scheduler and a request from
+        ``budget`` like any other request; a connection that cannot get
+        them within ``timeout`` is skipped. Only backends with a
+        ``prewarm`` method (RequestsFetcher) support this; others, and
+        extractors that fetch through a proxy pool, return 0.
+
+        Returns:
+            Number of connections ready in the pools
+        """
+        prewarm = getattr(self.fetcher, 'prewarm', None)
+        if prewarm is None or self.proxy_pool is not None:
+            return 0
+        max_workers = self.max_workers if max_workers is None else max_workers
+
+        def connections_per_host(host: str, wanted: int) -> int:
+            return min(wanted, self.scheduler.max_in_flight(domain_of(host)),
+                       self.pool_maxsize, max(max_workers, 1))
+
+        deadline = time.monotonic() + self.timeout
+
+        def take_turn(origin: str) -> bool:
+            if not self.scheduler.wait_for_token(origin, timeout=max(deadline - time.monotonic(), 0)):
+                return False
+            if self.budget is not None:
+                try:
+                    _wait_for_budget(self.budget.reserve_request(), deadline, 'connect')
+                except DeadlineExceeded:
+                    return False
+            return True
+
+        return prewarm(
+            urls, connections_per_host=connections_per_host, timeout=self.timeout, before_request=take_turn
+        )
+
+    def _run_workers(
+        self,
+        urls: List[str],
+        batch: ScheduledBatch,
+        outcomes: List[Tuple[Optional[Dict[str, Any]], Optional[str]]],
+        parse: Callable[[int, FetchResult, Optional[float]], None],
+        max_workers: int
+    ) -> None:
+        """Drain ``batch`` with ``max_workers`` download threads."""
+        def work() -> None:
+            while True:
+                index = batch.next()
+                if index is None:
+                    return
+                url = urls[index]
+                # The clock starts once the scheduler releases the URL
+                deadline = self._deadline_at()
+                fetched = None
+                skipped = False
+                try:
+                    try:
+                        fetched = self._fetch(url, deadline)
+                    except FetchError as exc:
+                        skipped = exc.reason == REASON_CIRCUIT_OPEN
+                        raise
+                    finally:
+                        # Cache hits and URLs of open-circuit domains never hit
+                        # the host, so the next URL of the domain can go at once
+                        batch.done(
+                            index,
+                            refund=skipped or (fetched is not None and fetched.cache_status == 'hit'),
+                        )
+                    parse(index, fetched, deadline)
+                except FetchError as exc:
+                    logger.error("Article extraction failed for url=%s (%s)", url, exc)
+                    outcomes[index] = (None, str(exc))
+                except Exception as exc:  # capture unexpected failures
+                    outcomes[index] = (None, f"{type(exc).__name__}: {exc}")
+
+        if max_workers <= 1:
+            work()
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as io_pool:
+            for future in [io_pool.submit(work) for _ in range(max_workers)]:
+                future.result()
 
     def get_stats(self, results: Dict[str, Optional[Dict[str, Any]]]) -> Dict[str, Any]:
         """
@@ -247,11 +1019,14 @@ class ArticleExtractor:
             results: Output from extract_batch()
 
         Returns:
-            Statistics dictionary
+            Statistics dictionary. The ``fetch`` entry reports network usage
+            since the last extract_batch() call, including the requests and
+            bytes saved by reusing the primary download in the fallback tier.
 
         Example:
             >>> stats = extractor.get_stats(results)
             >>> print(f"Success rate: {stats['success_rate']:.1f}%")
+            >>> print(f"Requests saved: {stats['fetch']['requests_saved']}")
         """
         total = len(results)
         successful = sum(1 for r in results.values() if r is not None)
@@ -267,15 +1042,182 @@ class ArticleExtractor:
             'successful': successful,
             'failed': total - successful,
             'success_rate': (successful / total * 100) if total > 0 else 0,
-            'methods': methods
+            'methods': methods,
+            'fetch': self.fetch_stats.as_dict()
         }
 
 
+# Newspaper4k release whose Article.parse() steps and private helpers the
+# code below mirrors; other releases take the plain, slower path
+_NEWSPAPER_INTERNALS = newspaper.__version__ == '0.9.3.1'
+
+
+def _parse_article(article: Article, doc: Any) -> None:
+    """
+    Article.parse() (newspaper4k 0.9.3.1) on an already parsed tree.
+
+    Article.parse() always parses ``article.html`` itself; these are the
+    same steps run on ``doc``, the tier's copy of the shared tree.
+    """
+    article.doc = doc
+    article.is_parsed = True
+    if doc is None:
+        return
+    extractor = article.extractor
+    config = article.config
+
+    article.title = title = extractor.get_title(doc)
+    article.authors = extractor.get_authors(doc)[: config.max_authors]
+
+    metadata = extractor.get_metadata(article.url, doc)
+    if metadata['language'] in get_available_languages():
+        article.meta_lang = metadata['language']
+        if config.use_meta_language:
+            config.language = metadata['language']
+    article.meta_site_name = metadata['site_name']
+    article.meta_description = metadata['description']
+    article.canonical_link = metadata['canonical_link']
+    article.meta_keywords = metadata['keywords']
+    article.tags = metadata['tags']
+    article.meta_data = metadata['data']
+
+    article.publish_date = extractor.get_publishing_date(article.url, doc)
+    article.top_node = extractor.calculate_best_node(doc)
+    article.set_movies(extractor.get_videos(doc, article.top_node))
+    article.fetch_images()
+
+    if article.top_node is not None:
+        complemented = DocumentCleaner(config).clean(extractor.top_node_complemented)
+        article._top_node_complemented = complemented
+        article.text, article.article_html = OutputFormatter(config).get_formatted(
+            complemented, title
+        )
+
+
+_META_IMAGE_XPATH = (
+    '//meta[@property="og:image"]/@content | //meta[@name="og:image"]/@content'
+    ' | //meta[@name="twitter:image"]/@content | //link[@rel="image_src"]/@href'
+)
+
+
+def _meta_image(url: str, doc: Any) -> str:
+    """The page's meta-tag image (og:image, twitter:image, image_src), absolute."""
+    for image in doc.xpath(_META_IMAGE_XPATH):
+        if image.strip():
+            return urljoin_if_valid(url, image.strip())
+    return ''
+
+
+class _OfflineImageExtractor(ImageExtractor):
+    """
+    Newspaper4k's ImageExtractor without image downloads.
+
+    Newspaper4k checks the size of candidate images by downloading them
+    through its own session, bypassing the fetch backend, proxies, rate
+    budget and deadline. Candidates are ranked on their position relative
+    to the article body instead.
+    """
+
+    def _check_image_size(self, url: str, referer: Optional[str]) -> bool:
+        return True
+
+
+class _ProfiledContentExtractor(ContentExtractor):
+    """Newspaper4k's ContentExtractor skipping the steps a profile turns off."""
+
+    def __init__(self, config: Config, profile: ExtractionProfile):
+        super().__init__(config)
+        self.profile = profile
+        self.image_extractor = _OfflineImageExtractor(config)
+
+    def get_authors(self, doc: Any) -> List[str]:
+        return super().get_authors(doc) if self.profile.metadata else []
+
+    def get_publishing_date(self, url: str, doc: Any) -> Optional[datetime]:
+        return super().get_publishing_date(url, doc) if self.profile.dates else None
+
+    def calculate_best_node(self, doc: Any) -> Any:
+        # No top node: Article.parse() skips cleaning and formatting the body
+        return super().calculate_best_node(doc) if self.profile.text else None
+
+    def get_videos(self, doc: Any, top_node: Any) -> List[Any]:
+        return super().get_videos(doc, top_node) if self.profile.metadata else []
+
+    def parse_images(self, article_url: str, doc: Any, top_node: Any) -> None:
+        if self.profile.image_scoring and _NEWSPAPER_INTERNALS:
+            super().parse_images(article_url, doc, top_node)
+        elif self.profile.metadata or self.profile.image_scoring:
+            # Meta-tag image only (also where the download-free override
+            # above cannot be trusted to apply)
+            image = _meta_image(article_url, doc)
+            self.image_extractor.meta_image = self.image_extractor.top_image = image
+
+
+NEWSPAPER4K_TIER = Tier('newspaper4k', ArticleExtractor._extract_newspaper4k)
+TRAFILATURA_TIER = Tier('trafilatura', ArticleExtractor._extract_trafilatura)
+# Fast Newspaper4k first, Trafilatura as the fallback on the same payload
+DEFAULT_TIERS: Tuple[Tier, ...] = (NEWSPAPER4K_TIER, TRAFILATURA_TIER)
+
+
+_worker_extractors: Dict[Tuple[Tuple[str, Any], ...], ArticleExtractor] = {}
+
+
+def _extract_from_html_in_worker(
+    options: Dict[str, Any],
+    url: str,
+    html: str,
+    deadline: Optional[float] = None,
+    order: Optional[List[str]] = None
+) -> Tuple[Optional[Dict[str, Any]], List[TierAttempt]]:
+    """
+    Picklable entry point for running the tiers inside an executor.
+
+    Extractors are cached per worker (thread or process) and options set.
+    The tier order is decided by the caller's router; the attempts are
+    returned so the caller can record them.
+    """
+    key = tuple(sorted(options.items()))
+    extractor = _worker_extractors.get(key)
+    if extractor is None:
+        extractor = _worker_extractors.setdefault(key, ArticleExtractor(**options))
+    return extractor._run_tiers(url, html, deadline, order or extractor._tier_order(url))
+
+
+def _run_tier_in_worker(
+    options: Dict[str, Any],
+    tier: str,
+    url: str,
+    html: str
+) -> Optional[Dict[str, Any]]:
+    """Picklable entry point running a single tier for a process race."""
+    key = tuple(sorted(options.items()))
+    extractor = _worker_extractors.get(key)
+    if extractor is None:
+        extractor = _worker_extractors.setdefault(key, ArticleExtractor(**options))
+    return extractor._tiers_by_name[tier].extract(extractor, url, as_document(html))
+
+
+_default_extractor: Optional[ArticleExtractor] = None
+_default_extractor_lock = threading.Lock()
+
+
+def _get_default_extractor() -> ArticleExtractor:
+    """Return the lazily built module-level extractor (and its session)."""
+    global _default_extractor
+    if _default_extractor is None:
+        with _default_extractor_lock:
+            if _default_extractor is None:
+                _default_extractor = ArticleExtractor()
+    return _default_extractor
+
+
 # Convenience function for single extraction
 def extract_article(url: str) -> Optional[Dict[str, Any]]:
     """
     Quick extraction of a single article.
 
+    Reuses one default extractor, so repeated calls share its connection pool.
+
     Args:
         url: Article URL
 
@@ -287,8 +1229,13 @@ def extract_article(url: str) -> Optional[Dict[str, Any]]:
         >>> article = extract_article('https://bianet.org/...')
         >>> print(article['title'])
     """
-    extractor = ArticleExtractor()
-    return extractor.extract(url)
+    return _get_default_extractor().extract(url)
 
 
-__all__ = ["ArticleExtractor", "extract_article"]
+__all__ = [
+    "ArticleExtractor",
+    "DEFAULT_TIERS",
+    "NEWSPAPER4K_TIER",
+    "TRAFILATURA_TIER",
+    "extract_article",
+]
@@ -0,0 +1,329 @@
+"""
+Asyncio variant of :class:`ArticleExtractor`.
+
+Downloads run concurrently on an aiohttp connection pool while the
+CPU-bound Newspaper4k/Trafilatura parsing is sent to an executor, so the
+event loop never blocks. Results use exactly the same dict schema as the
+synchronous extractor.
+
+Dependencies:
+    pip install aiohttp (the ``async`` extra)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import zlib
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .article_extractor import ArticleExtractor, _extract_from_html_in_worker
+from .fetch import (
+    CHUNK_SIZE,
+    DEFAULT_ALLOWED_CONTENT_TYPES,
+    DEFAULT_MAX_BYTES,
+    REASON_CONNECTION,
+    REASON_HTTP_STATUS,
+    REASON_INVALID_URL,
+    REASON_TIMEOUT,
+    REASON_TOO_LARGE,
+    FetchError,
+    FetchResult,
+    check_content_length,
+    check_content_type,
+    decode_body,
+    time_left,
+)
+from .profiles import ExtractionProfile
+from .throttle import RateBudget
+from .tier_router import TierRouter
+
+try:  # optional dependency
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without aiohttp
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def _body_decoder(content_encoding: Optional[str]) -> Any:
+    """zlib decompressor for a gzip / deflate ``Content-Encoding``, else None."""
+    encoding = (content_encoding or '').strip().lower()
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(47)  # gzip or zlib header
+    if encoding == 'deflate':
+        return zlib.decompressobj(zlib.MAX_WBITS)
+    return None
+
+
+def _error_response(response: 'aiohttp.ClientResponse') -> requests.Response:
+    """The status and headers of a failed response, as FetchError carries them."""
+    error = requests.Response()
+    error.status_code = response.status
+    error.reason = response.reason
+    error.headers = CaseInsensitiveDict(response.headers)
+    error.url = str(response.url)
+    return error
+
+
+class AsyncArticleExtractor:
+    """
+    Extract articles from an asyncio application.
+
+    Downloads go through aiohttp rather than a Fetcher, so only the options
+    below apply. Retries (RetryPolicy), the per-domain CircuitBreaker, the
+    DomainScheduler, the HTTP cache, HtmlArchive / WARC output, proxies and
+    DNS caching are not supported; use ArticleExtractor for those.
+
+    Example:
+        >>> async with AsyncArticleExtractor(max_concurrency=200) as extractor:
+        ...     results = await extractor.extract_batch(urls)
+        ...     print(extractor.get_stats(results))
+    """
+
+    def __init__(
+        self,
+        language: str = 'tr',
+        min_text_length: int = 100,
+        timeout: int = 10,
+        max_concurrency: int = 200,
+        limit_per_host: int = 8,
+        executor: Optional[Executor] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        allowed_content_types: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+        deadline: Optional[float] = None,
+        budget: Optional[RateBudget] = None,
+        router: Optional[TierRouter] = None,
+        profile: Union[str, ExtractionProfile] = 'full'
+    ):
+        """
+        Initialize the extractor.
+
+        Args:
+            language: Article language code (default: 'tr' for Turkish)
+            min_text_length: Minimum chars to consider extraction successful
+            timeout: Socket connect/read timeout in seconds
+            max_concurrency: Maximum simultaneous downloads
+            limit_per_host: Maximum simultaneous downloads per host
+            executor: Executor for parsing (default: the loop's thread pool;
+                a ProcessPoolExecutor spreads parsing across cores)
+            max_bytes: Stop reading a page beyond this many bytes (None: no cap)
+            allowed_content_types: Media types accepted as HTML
+            deadline: Wall-clock seconds per article covering DNS, connect,
+                download and both tiers
+            budget: Bandwidth / request-rate budget, shareable with sync
+                extractors of the same process
+            router: Per-domain tier statistics deciding the tier order
+            profile: Extraction profile (``full``, ``text_only``,
+                ``metadata_only`` or an ExtractionProfile)
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncArticleExtractor requires aiohttp: pip install 'news-extractor[async]'"
+            )
+
+        # The sync extractor supplies the parsing tiers, headers and stats
+        self._parser = ArticleExtractor(
+            language=language,
+            min_text_length=min_text_length,
+            timeout=timeout,
+            max_bytes=max_bytes,
+            allowed_content_types=allowed_content_types,
+            deadline=deadline,
+            router=router,
+            profile=profile,
+        )
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.allowed_content_types = allowed_content_types
+        self.deadline = deadline
+        self.budget = budget
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.executor = executor
+        self.headers = dict(self._parser.headers)
+        self.fetch_stats = self._parser.fetch_stats
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> 'AsyncArticleExtractor':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and the parser's race pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._parser.close()
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                # Bodies are decoded in _read_body, after the budget is
+                # charged for the compressed bytes off the wire
+                headers={**self.headers, 'Accept-Encoding': 'gzip, deflate'},
+                auto_decompress=False,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.timeout,
+                    sock_read=self.timeout,
+                ),
+            )
+        return self._session
+
+    async def extract(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract an article without blocking the event loop.
+
+        Returns:
+            Dictionary with article data (same schema as
+            ArticleExtractor.extract), or None if extraction failed
+        """
+        deadline = time.monotonic() + self.deadline if self.deadline else None
+        try:
+            fetched = await self._fetch(url, deadline)
+            loop = asyncio.get_running_loop()
+            # The worker checks the deadline before each tier
+            outcome = await loop.run_in_executor(
+                self.executor,
+                _extract_from_html_in_worker,
+                self._parser._parse_options(),
+                url,
+                fetched.html,
+                deadline,
+                self._parser._tier_order(url),
+            )
+        except FetchError as exc:
+            logger.error("Article extraction failed for url=%s (%s)", url, exc)
+            return None
+        result, attempts = outcome
+        self._parser._record_tiers(url, attempts)
+        self._parser._record_payload_reuse(fetched.num_bytes, attempts)
+        return result
+
+    async def _fetch(self, url: str, deadline: Optional[float] = None) -> FetchResult:
+        """
+        Download the article HTML once for both tiers.
+
+        Raises:
+            FetchError: same reasons as fetch.fetch_html()
+        """
+        session = self._get_session()
+        try:
+            try:
+                if self.budget is not None:
+                    await self._within(asyncio.sleep(self.budget.reserve_request()), deadline, 'connect')
+                response = await self._within(session.get(url), deadline, 'connect')
+                async with response:
+                    if response.status >= 400:
+                        raise FetchError(
+                            REASON_HTTP_STATUS,
+                            f"{response.status} {response.reason} for url: {url}",
+                            response=_error_response(response),
+                        )
+                    content_type = response.headers.get('Content-Type')
+                    check_content_type(content_type, self.allowed_content_types)
+                    check_content_length(response.headers.get('Content-Length'), self.max_bytes)
+                    body, num_bytes = await self._within(
+                        self._read_body(response, response.headers.get('Content-Encoding')),
+                        deadline,
+                        'download',
+                    )
+                    status = response.status
+            except asyncio.TimeoutError as exc:
+                raise FetchError(REASON_TIMEOUT, str(exc) or "read timed out") from exc
+            except (aiohttp.InvalidURL, aiohttp.TooManyRedirects) as exc:
+                raise FetchError(REASON_INVALID_URL, str(exc) or type(exc).__name__) from exc
+            except aiohttp.ClientError as exc:
+                raise FetchError(REASON_CONNECTION, str(exc)) from exc
+        except FetchError as exc:
+            logger.warning("HTTP request failed for url=%s: %s", url, exc)
+            self.fetch_stats.record_failure(exc.reason)
+            raise
+        html = decode_body(body, content_type)
+
+        fetched = FetchResult(
+            url=url,
+            html=html,
+            status_code=status,
+            num_bytes=num_bytes,
+            body=body,
+            content_type=content_type,
+        )
+        self.fetch_stats.record_fetch(fetched)
+        return fetched
+
+    async def _within(self, awaitable: Awaitable[T], deadline: Optional[float], stage: str) -> T:
+        """Await ``awaitable``, cancelling it when ``deadline`` passes."""
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            time_left(deadline, stage)
+            raise
+
+    async def _read_body(
+        self,
+        response: 'aiohttp.ClientResponse',
+        content_encoding: Optional[str] = None
+    ) -> Tuple[bytes, int]:
+        """
+        Read and decode a body, charging ``budget`` for the encoded bytes.
+
+        Returns:
+            (decoded body, encoded bytes received)
+        """
+        decoder = _body_decoder(content_encoding)
+        chunks = []
+        received = 0
+        downloaded = 0
+        try:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                downloaded += len(chunk)
+                if self.budget is not None and self.budget.limits_bytes:
+                    await asyncio.sleep(self.budget.reserve_bytes(len(chunk)))
+                if decoder is not None:
+                    chunk = decoder.decompress(chunk)
+                received += len(chunk)
+                if self.max_bytes and received > self.max_bytes:
+                    raise FetchError(REASON_TOO_LARGE, f"body exceeds {self.max_bytes} bytes")
+                chunks.append(chunk)
+            if decoder is not None:
+                chunks.append(decoder.flush())
+        except zlib.error as exc:
+            raise FetchError(REASON_CONNECTION, f"cannot decode {content_encoding} body: {exc}") from exc
+        return b''.join(chunks), downloaded
+
+    async def extract_batch(self, urls: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Extract multiple articles concurrently.
+
+        Returns:
+            Dictionary mapping URLs to extraction results, in input order
+        """
+        self.fetch_stats.reset()
+        results = await asyncio.gather(*(self.extract(url) for url in urls))
+        if self._parser.router is not None:
+            self._parser.router.save()
+        return dict(zip(urls, results))
+
+    def get_stats(self, results: Dict[str, Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Get statistics from batch extraction results (see ArticleExtractor)."""
+        return self._parser.get_stats(results)
+
+
+__all__ = ["AsyncArticleExtractor"]
@@ -7,6 +7,11 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
 from news_extractor import ArticleExtractor
+from news_extractor.scheduler import (
+    POLITE_MAX_IN_FLIGHT_PER_HOST,
+    POLITE_REQUESTS_PER_SECOND,
+    DomainScheduler,
+)
 
 
 @dataclass(frozen=True)
@@ -54,11 +59,31 @@ def reextract(
     *,
     min_text_length: int = 100,
     extractor: Optional[ArticleExtractor] = None,
+    max_workers: Optional[int] = None,
+    parse_workers: Optional[int] = None,
+    prewarm: bool = False,
 ) -> List[Dict[str, Any]]:
-    extractor = extractor or ArticleExtractor(min_text_length=min_text_length)
+    # Backlogs hammer a few outlets with thousands of URLs: pace them
+    extractor = extractor or ArticleExtractor(
+        min_text_length=min_text_length,
+        scheduler=DomainScheduler(
+            requests_per_second=POLITE_REQUESTS_PER_SECOND,
+            max_in_flight_per_host=POLITE_MAX_IN_FLIGHT_PER_HOST,
+        ),
+    )
+    records = list(records)
+    urls = [record.url for record in records]
+    if prewarm and not extractor.prewarm:
+        extractor.prewarm_connections(urls, max_workers)
+    # extract_many paces the downloads per domain via extractor.scheduler
+    outcomes = extractor.extract_many(
+        urls,
+        max_workers=max_workers,
+        parse_workers=parse_workers,
+    )
     results: List[Dict[str, Any]] = []
 
-    for record in records:
+    for record, (article, error) in zip(records, outcomes):
         payload: Dict[str, Any] = {
             "article_id": record.article_id,
             "canonical_url": record.canonical_url,
@@ -68,13 +93,6 @@ def reextract(
             "stored_at": record.stored_at,
         }
 
-        article: Optional[Dict[str, Any]] = None
-        error: Optional[str] = None
-        try:
-            article = extractor.extract(record.url)
-        except Exception as exc:  # capture unexpected failures
-            error = f"{type(exc).__name__}: {exc}"
-
         payload["extraction"] = article
         payload["error"] = error
         results.append(payload)
@@ -4,16 +4,22 @@ import argparse
 import json
 import logging
 import sys
+from pathlib import Path
 from typing import Any, Dict, Iterable
 
 from .article_extractor import ArticleExtractor
+from .html_archive import HtmlArchive
+from .profiles import PROFILES
+from .reprocess import DEFAULT_CHUNK_SIZE, reprocess_archive, reprocess_warc
+from .throttle import RateBudget
 
 logger = logging.getLogger(__name__)
 
 
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Extract Turkish news articles via Newspaper4k → Trafilatura fallback strategy."
+        description="Extract Turkish news articles via Newspaper4k → Trafilatura fallback strategy.",
+        epilog="Run `news-extractor reprocess --help` to re-extract an HTML archive offline.",
     )
     parser.add_argument("urls", nargs="+", help="One or more article URLs to extract.")
     parser.add_argument(
@@ -28,6 +34,24 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         default="pretty",
         help="Output format for extracted articles (default: pretty)."
     )
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILES),
+        default="full",
+        help="Fields to extract: full, text_only (title + text) or metadata_only (default: full).",
+    )
+    parser.add_argument(
+        "--max-bytes-per-second",
+        type=float,
+        default=None,
+        help="Cap download bandwidth across all fetches (default: unlimited).",
+    )
+    parser.add_argument(
+        "--max-requests-per-second",
+        type=float,
+        default=None,
+        help="Cap the request rate across all fetches (default: unlimited).",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -37,6 +61,71 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def parse_reprocess_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="news-extractor reprocess",
+        description="Re-run the extraction tiers over an HTML archive or WARC files without network access."
+    )
+    parser.add_argument(
+        "sources",
+        type=Path,
+        nargs="+",
+        help="One HtmlArchive directory, or one or more .warc / .warc.gz files.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+        help="Destination JSONL file (one object per archived page).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Pages handed to a worker per task (default: {DEFAULT_CHUNK_SIZE}).",
+    )
+    parser.add_argument(
+        "--all-fetches",
+        action="store_true",
+        help="Process every archived fetch instead of only the newest per URL.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILES),
+        default="full",
+        help="Fields to extract: full, text_only (title + text) or metadata_only (default: full).",
+    )
+    parser.add_argument(
+        "--min-text-length",
+        type=int,
+        default=100,
+        help="Minimum number of characters required to accept an extraction (default: 100)."
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="WARNING",
+        help="Logging verbosity for diagnostics (default: WARNING).",
+    )
+    return parser.parse_args(argv)
+
+
+def budget_from_args(args: argparse.Namespace) -> RateBudget | None:
+    """Build the run-wide RateBudget from ``--max-*-per-second`` (None when unset)."""
+    if not args.max_bytes_per_second and not args.max_requests_per_second:
+        return None
+    return RateBudget(
+        max_bytes_per_second=args.max_bytes_per_second,
+        max_requests_per_second=args.max_requests_per_second,
+    )
+
+
 def _print_pretty(url: str, article: Dict[str, Any]) -> None:
     print("=" * 80)
     print(f"URL: {url}")
@@ -54,26 +143,77 @@ def _print_pretty(url: str, article: Dict[str, Any]) -> None:
     print()
 
 
+def reprocess_main(argv: Iterable[str] | None = None) -> int:
+    args = parse_reprocess_args(argv)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format="%(levelname)s:%(name)s:%(message)s",
+    )
+    missing = [source for source in args.sources if not source.exists()]
+    if missing:
+        print(f"Source not found: {missing[0]}", file=sys.stderr)
+        return 2
+    is_archive = args.sources[0].is_dir()
+    if is_archive and len(args.sources) > 1:
+        print("Pass a single archive directory or only WARC files.", file=sys.stderr)
+        return 2
+
+    options = {"min_text_length": args.min_text_length, "profile": args.profile}
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w", encoding="utf-8") as fh:
+        if is_archive:
+            stats = reprocess_archive(
+                HtmlArchive(args.sources[0]),
+                fh,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                latest_only=not args.all_fetches,
+                extractor_options=options,
+            )
+        else:
+            stats = reprocess_warc(
+                args.sources,
+                fh,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                extractor_options=options,
+            )
+
+    print(
+        f"Reprocessed {stats['total']} pages: {stats['successes']} extracted "
+        f"({stats['success_rate']:.1f}%) → {args.output}",
+        file=sys.stderr,
+    )
+    return 0 if stats["successes"] == stats["total"] else 1
+
+
 def main(argv: Iterable[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] == "reprocess":
+        return reprocess_main(argv[1:])
+
     args = parse_args(argv)
     logging.basicConfig(
         level=getattr(logging, args.log_level),
         format="%(levelname)s:%(name)s:%(message)s",
     )
-    extractor = ArticleExtractor(min_text_length=args.min_text_length)
-
     successes = 0
-    for url in args.urls:
-        article = extractor.extract(url)
-        if article:
-            successes += 1
-            if args.format == "json":
-                print(json.dumps(article, ensure_ascii=False, indent=2))
+    with ArticleExtractor(
+        min_text_length=args.min_text_length,
+        budget=budget_from_args(args),
+        profile=args.profile,
+    ) as extractor:
+        for url in args.urls:
+            article = extractor.extract(url)
+            if article:
+                successes += 1
+                if args.format == "json":
+                    print(json.dumps(article, ensure_ascii=False, indent=2))
+                else:
+                    _print_pretty(url, article)
             else:
-                _print_pretty(url, article)
-        else:
-            logger.error("Extraction failed for url=%s", url)
-            print(f"❌ Failed to extract: {url}", file=sys.stderr)
+                logger.error("Extraction failed for url=%s", url)
+                print(f"❌ Failed to extract: {url}", file=sys.stderr)
 
     all_success = successes == len(args.urls)
     return 0 if all_success else 1
@@ -0,0 +1,432 @@
+"""
+libcurl multi-handle fetch backend.
+
+:class:`CurlMultiFetcher` runs every transfer on one background thread
+driving a ``pycurl.CurlMulti`` handle, so thousands of downloads can be in
+flight without a socket-blocked Python thread each. Callers submit a URL
+and wait on a future; :meth:`CurlMultiFetcher.fetch` wraps that in the
+blocking :class:`fetch.Fetcher` contract used by ArticleExtractor.
+libcurl handles connection reuse, HTTP/2 multiplexing (when built with
+nghttp2), content decoding and redirects.
+
+Dependencies:
+    pip install pycurl (the ``curl`` extra)
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .fetch import (
+    DEFAULT_ALLOWED_CONTENT_TYPES,
+    DEFAULT_MAX_BYTES,
+    REASON_CONNECTION,
+    REASON_HTTP_STATUS,
+    REASON_INVALID_URL,
+    REASON_PROXY,
+    REASON_TIMEOUT,
+    REASON_TOO_LARGE,
+    DeadlineExceeded,
+    FetchError,
+    FetchResult,
+    _cache_lookup,
+    _cached_result,
+    _store_result,
+    _wait_for_budget,
+    check_content_length,
+    check_content_type,
+    time_left,
+)
+from .http_cache import HttpCache
+from .throttle import RateBudget
+
+try:  # optional dependency
+    import pycurl
+except ImportError:  # pragma: no cover - exercised only without pycurl
+    pycurl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 1000
+DEFAULT_MAX_HOST_CONNECTIONS = 8
+SELECT_TIMEOUT = 0.05
+# How long fetch() waits past a deadline for libcurl to report the timeout
+DEADLINE_GRACE = 1.0
+# With a proxy set, these can only mean the proxy is unreachable
+_PROXY_ERRNOS = (pycurl.E_COULDNT_RESOLVE_PROXY, pycurl.E_COULDNT_CONNECT) if pycurl else ()
+# The URL itself is unusable; fetching it again cannot help
+_INVALID_URL_ERRNOS = (
+    (pycurl.E_URL_MALFORMAT, pycurl.E_UNSUPPORTED_PROTOCOL, pycurl.E_TOO_MANY_REDIRECTS) if pycurl else ()
+)
+
+
+@dataclass
+class _Transfer:
+    """State of one in-flight download."""
+
+    url: str
+    future: Future
+    max_bytes: Optional[int]
+    allowed_content_types: Tuple[str, ...]
+    deadline: Optional[float]
+    budget: Optional[RateBudget] = None
+    proxy: Optional[str] = None
+    status_code: int = 0
+    headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
+    headers_done: bool = False
+    chunks: List[bytes] = field(default_factory=list)
+    received: int = 0
+    charged: int = 0
+    downloaded: int = 0
+    error: Optional[FetchError] = None
+    resume_at: float = 0.0
+    paused: bool = False
+
+    def on_header(self, line: bytes) -> Optional[int]:
+        text = line.decode('iso-8859-1').rstrip('\r\n')
+        if text.startswith('HTTP/'):
+            # New response (after a redirect or 100-continue): start over
+            parts = text.split(' ', 2)
+            self.status_code = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+            self.headers = CaseInsensitiveDict()
+            self.charged = 0  # libcurl restarts its download counter too
+            return None
+        if text:
+            name, _, value = text.partition(':')
+            self.headers[name.strip()] = value.strip()
+            return None
+        if 300 <= self.status_code < 400 or self.status_code < 200:
+            return None
+        self.headers_done = True
+        if self.status_code < 400:
+            try:
+                check_content_type(self.headers.get('content-type'), self.allowed_content_types)
+                check_content_length(self.headers.get('content-length'), self.max_bytes)
+            except FetchError as exc:
+                self.error = exc
+                return -1  # abort the transfer
+        return None
+
+    def on_body(self, chunk: bytes) -> Optional[int]:
+        self.received += len(chunk)
+        if self.max_bytes and self.received > self.max_bytes:
+            self.error = FetchError(REASON_TOO_LARGE, f"body exceeds {self.max_bytes} bytes")
+            return -1
+        self.chunks.append(chunk)
+        return None
+
+    def on_progress(self, download_total: int, downloaded: int, upload_total: int, uploaded: int) -> None:
+        # ``downloaded`` counts bytes off the wire, before content decoding
+        if downloaded > self.charged:
+            wait = self.budget.reserve_bytes(downloaded - self.charged)
+            self.charged = downloaded
+            if wait > 0:
+                self.resume_at = time.monotonic() + wait
+
+
+class CurlMultiFetcher:
+    """
+    Event-driven fetcher: one thread, one curl multi handle, many transfers.
+
+    Args:
+        headers: Default headers sent with every request
+        max_connections: Open connections across all hosts
+        max_host_connections: Open connections per host
+        verify: Verify TLS certificates
+
+    Example:
+        >>> fetcher = CurlMultiFetcher(max_host_connections=4)
+        >>> extractor = ArticleExtractor(fetcher=fetcher, max_workers=256)
+        >>> future = fetcher.submit('https://bianet.org/...')
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_host_connections: int = DEFAULT_MAX_HOST_CONNECTIONS,
+        verify: bool = True
+    ):
+        if pycurl is None:
+            raise ImportError("CurlMultiFetcher requires pycurl: pip install 'news-extractor[curl]'")
+        self.headers = dict(headers or {})
+        self.verify = verify
+        self._multi = pycurl.CurlMulti()
+        self._multi.setopt(pycurl.M_MAX_TOTAL_CONNECTIONS, max_connections)
+        self._multi.setopt(pycurl.M_MAX_HOST_CONNECTIONS, max_host_connections)
+        self._multi.setopt(pycurl.M_PIPELINING, pycurl.PIPE_MULTIPLEX)
+        self._pending: 'queue.SimpleQueue[Optional[Tuple[pycurl.Curl, _Transfer]]]' = queue.SimpleQueue()
+        self._active: Dict[pycurl.Curl, _Transfer] = {}
+        self._budgeted: Set[pycurl.Curl] = set()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='curl-multi', daemon=True)
+        self._thread.start()
+
+    # -- public API ------------------------------------------------------
+
+    def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        cache: Optional[HttpCache] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        allowed_content_types: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+        deadline: Optional[float] = None,
+        budget: Optional[RateBudget] = None,
+        proxy: Optional[str] = None,
+    ) -> FetchResult:
+        """Download ``url``; same contract as fetch.fetch_html()."""
+        cached, request_headers = _cache_lookup(url, headers, cache)
+        if cached is not None and cached.is_fresh(cache.ttl):
+            return _cached_result(cached, 'hit')
+
+        transfer = self._submit(
+            url, request_headers, timeout, max_bytes, allowed_content_types, deadline, budget, proxy
+        )
+        status_code, response_headers, body = self._wait(transfer, timeout)
+
+        if cached is not None and status_code == 304:
+            cache.refresh(url)
+            return _cached_result(cached, 'revalidated')
+        return _store_result(
+            url, body, status_code, response_headers, cache, num_bytes=transfer.downloaded
+        )
+
+    def submit(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        allowed_content_types: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+        deadline: Optional[float] = None,
+        budget: Optional[RateBudget] = None,
+        proxy: Optional[str] = None,
+    ) -> 'Future[Tuple[int, CaseInsensitiveDict, bytes]]':
+        """
+        Start a download without blocking (except to wait for a request
+        slot of ``budget``; its byte rate is applied by pausing the
+        transfer).
+
+        Returns:
+            Future resolving to (status_code, headers, body) or raising
+            FetchError
+        """
+        return self._submit(
+            url, headers, timeout, max_bytes, allowed_content_types, deadline, budget, proxy
+        ).future
+
+    def close(self) -> None:
+        """Stop the transfer thread; in-flight downloads fail."""
+        if not self._closed:
+            self._closed = True
+            self._pending.put(None)
+            self._thread.join()
+
+    def _wait(self, transfer: _Transfer, timeout: float) -> Tuple[int, CaseInsensitiveDict, bytes]:
+        """Wait for ``transfer``, but not past its deadline or the transfer thread."""
+        while True:
+            wait = timeout
+            if transfer.deadline is not None:
+                wait = min(wait, max(transfer.deadline - time.monotonic(), 0.0) + DEADLINE_GRACE)
+            try:
+                return transfer.future.result(timeout=wait)
+            except FutureTimeout:
+                if not self._thread.is_alive():
+                    raise FetchError(REASON_CONNECTION, "curl transfer thread stopped") from None
+                if transfer.deadline is not None and time.monotonic() >= transfer.deadline:
+                    raise DeadlineExceeded('download' if transfer.headers_done else 'connect') from None
+
+    # -- transfer thread -------------------------------------------------
+
+    def _submit(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        max_bytes: Optional[int],
+        allowed_content_types: Tuple[str, ...],
+        deadline: Optional[float],
+        budget: Optional[RateBudget] = None,
+        proxy: Optional[str] = None,
+    ) -> _Transfer:
+        if self._closed:
+            raise RuntimeError("CurlMultiFetcher is closed")
+        # libcurl would guess a scheme for 'example.com/x' and try it
+        if urlsplit(url).scheme not in ('http', 'https'):
+            raise FetchError(REASON_INVALID_URL, f"URL needs an http:// or https:// scheme: {url!r}")
+        if budget is not None:
+            _wait_for_budget(budget.reserve_request(), deadline, 'connect')
+        time_left(deadline, 'connect')
+        transfer = _Transfer(
+            url, Future(), max_bytes, allowed_content_types, deadline,
+            budget if budget is not None and budget.limits_bytes else None,
+            proxy,
+        )
+        handle = self._configure(transfer, {**self.headers, **(headers or {})}, timeout)
+        self._pending.put((handle, transfer))
+        return transfer
+
+    def _configure(self, transfer: _Transfer, headers: Dict[str, str], timeout: float) -> 'pycurl.Curl':
+        handle = pycurl.Curl()
+        handle.setopt(pycurl.URL, transfer.url)
+        handle.setopt(pycurl.HTTPHEADER, [f'{name}: {value}' for name, value in headers.items()])
+        handle.setopt(pycurl.ACCEPT_ENCODING, '')  # every encoding libcurl can decode
+        handle.setopt(pycurl.FOLLOWLOCATION, True)
+        handle.setopt(pycurl.MAXREDIRS, 10)
+        handle.setopt(pycurl.NOSIGNAL, True)
+        handle.setopt(pycurl.PIPEWAIT, True)  # prefer multiplexing on an existing h2 connection
+        handle.setopt(pycurl.CONNECTTIMEOUT_MS, int(timeout * 1000))
+        # No bytes for ``timeout`` seconds is a read timeout
+        handle.setopt(pycurl.LOW_SPEED_LIMIT, 1)
+        handle.setopt(pycurl.LOW_SPEED_TIME, max(int(timeout), 1))
+        if transfer.deadline is not None:
+            remaining = max(transfer.deadline - time.monotonic(), 0.001)
+            handle.setopt(pycurl.TIMEOUT_MS, int(remaining * 1000))
+        if transfer.proxy:
+            handle.setopt(pycurl.PROXY, transfer.proxy)
+        if not self.verify:
+            handle.setopt(pycurl.SSL_VERIFYPEER, 0)
+            handle.setopt(pycurl.SSL_VERIFYHOST, 0)
+        handle.setopt(pycurl.HEADERFUNCTION, transfer.on_header)
+        handle.setopt(pycurl.WRITEFUNCTION, transfer.on_body)
+        if transfer.budget is not None:
+            handle.setopt(pycurl.NOPROGRESS, False)
+            handle.setopt(pycurl.XFERINFOFUNCTION, transfer.on_progress)
+        return handle
+
+    def _run(self) -> None:
+        reason = "fetcher closed"
+        try:
+            while True:
+                if not self._drain_pending(block=not self._active):
+                    break
+                while True:
+                    status, _ = self._multi.perform()
+                    if status != pycurl.E_CALL_MULTI_PERFORM:
+                        break
+                self._collect()
+                if self._budgeted:
+                    self._pace()
+                if self._active:
+                    self._multi.select(SELECT_TIMEOUT)
+        except Exception as exc:  # never leave callers waiting on a dead thread
+            logger.exception("curl transfer thread failed")
+            self._closed = True
+            reason = f"curl transfer thread failed: {type(exc).__name__}: {exc}"
+
+        failed = list(self._active.items())
+        while True:
+            try:
+                item = self._pending.get(block=False)
+            except queue.Empty:
+                break
+            if item is not None:
+                failed.append(item)
+        for handle, transfer in failed:
+            if handle in self._active:
+                self._multi.remove_handle(handle)
+            handle.close()
+            if not transfer.future.done():
+                transfer.future.set_exception(FetchError(REASON_CONNECTION, reason))
+        self._active.clear()
+        self._multi.close()
+
+    def _drain_pending(self, block: bool) -> bool:
+        """Add submitted transfers to the multi handle; False on close()."""
+        while True:
+            try:
+                item = self._pending.get(block=block)
+            except queue.Empty:
+                return True
+            if item is None:
+                return False
+            handle, transfer = item
+            self._multi.add_handle(handle)
+            self._active[handle] = transfer
+            if transfer.budget is not None:
+                self._budgeted.add(handle)
+            block = False
+
+    def _pace(self) -> None:
+        """Pause transfers that are ahead of the byte budget, resume due ones."""
+        now = time.monotonic()
+        for handle in self._budgeted:
+            transfer = self._active[handle]
+            if transfer.resume_at > now:
+                if not transfer.paused:
+                    handle.pause(pycurl.PAUSE_RECV)
+                    transfer.paused = True
+            elif transfer.paused:
+                handle.pause(pycurl.PAUSE_CONT)
+                transfer.paused = False
+
+    def _collect(self) -> None:
+        while True:
+            queued, finished, failed = self._multi.info_read()
+            for handle in finished:
+                self._complete(handle, None, '')
+            for handle, errno, message in failed:
+                self._complete(handle, errno, message)
+            if not queued:
+                return
+
+    def _complete(self, handle: 'pycurl.Curl', errno: Optional[int], message: str) -> None:
+        self._multi.remove_handle(handle)
+        transfer = self._active.pop(handle)
+        self._budgeted.discard(handle)
+        # Body bytes off the wire, before libcurl decoded them
+        transfer.downloaded = handle.getinfo(pycurl.SIZE_DOWNLOAD_T)
+        handle.close()
+        try:
+            transfer.future.set_result(self._outcome(transfer, errno, message))
+        except FetchError as exc:
+            transfer.future.set_exception(exc)
+        except Exception as exc:  # the transfer is gone from _active; fail it here
+            transfer.future.set_exception(FetchError(REASON_CONNECTION, f"{type(exc).__name__}: {exc}"))
+
+    def _outcome(
+        self,
+        transfer: _Transfer,
+        errno: Optional[int],
+        message: str
+    ) -> Tuple[int, CaseInsensitiveDict, bytes]:
+        if transfer.error is not None:
+            raise transfer.error
+        if errno == pycurl.E_OPERATION_TIMEDOUT:
+            stage = 'download' if transfer.headers_done else 'connect'
+            if transfer.deadline is not None and time.monotonic() >= transfer.deadline - 0.01:
+                raise DeadlineExceeded(stage)
+            raise FetchError(REASON_TIMEOUT, message)
+        if errno is not None:
+            if errno in _INVALID_URL_ERRNOS:
+                raise FetchError(REASON_INVALID_URL, message)
+            if transfer.proxy and errno in _PROXY_ERRNOS:
+                raise FetchError(REASON_PROXY, message)
+            raise FetchError(REASON_CONNECTION, message)
+        if transfer.status_code >= 400:
+            response = requests.Response()
+            response.status_code = transfer.status_code
+            response.headers = transfer.headers
+            response.url = transfer.url
+            raise FetchError(
+                REASON_HTTP_STATUS,
+                f"{transfer.status_code} for url: {transfer.url}",
+                response=response,
+            )
+        return transfer.status_code, transfer.headers, b''.join(transfer.chunks)
+
+
+__all__ = ["CurlMultiFetcher"]
@@ -0,0 +1,177 @@
+"""
+In-process DNS cache for the blocking fetch layer.
+
+``requests``/urllib3 resolve the host with ``socket.getaddrinfo`` for every
+new connection, and the system resolver is rarely cached inside
+containers. :class:`DnsCache` memoises those lookups for ``ttl`` seconds
+(failures for ``negative_ttl``). Only sessions that mount a
+:class:`DnsCachingAdapter` use it; ``socket.getaddrinfo`` itself is left
+alone. The asyncio engine has its own cache in aiohttp's connector.
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300.0
+DEFAULT_NEGATIVE_TTL = 30.0
+
+_AddrInfo = List[Tuple[Any, ...]]
+
+
+class DnsCache:
+    """
+    TTL cache in front of ``socket.getaddrinfo``.
+
+    Args:
+        ttl: Seconds a successful lookup is reused
+        negative_ttl: Seconds a failed lookup is remembered (0 disables)
+        clock: Time source (tests)
+
+    Example:
+        >>> extractor = ArticleExtractor(dns_cache=DnsCache(ttl=600))
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def getaddrinfo(
+        self,
+        host: Any,
+        port: Any,
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0
+    ) -> _AddrInfo:
+        """Drop-in replacement for ``socket.getaddrinfo``."""
+        key = (host, port, family, type, proto, flags)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                cached = entry[1]
+                if isinstance(cached, socket.gaierror):
+                    raise cached
+                return list(cached)
+            self.misses += 1
+
+        try:
+            result = socket.getaddrinfo(host, port, family, type, proto, flags)
+        except socket.gaierror as exc:
+            if self.negative_ttl > 0:
+                with self._lock:
+                    self._entries[key] = (now + self.negative_ttl, exc)
+            raise
+
+        with self._lock:
+            self._entries[key] = (now + self.ttl, tuple(result))
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _CachedResolution:
+    """Connection mixin resolving its host through ``dns_cache``."""
+
+    dns_cache: DnsCache
+
+    def _new_conn(self) -> socket.socket:
+        # urllib3's own _new_conn(), with the lookup going through the cache.
+        # Like urllib3 it resolves _dns_host, which keeps an FQDN's trailing
+        # dot; ``host`` drops it for TLS and the Host header
+        try:
+            addresses = self.dns_cache.getaddrinfo(
+                self._dns_host.strip('[]'), self.port, allowed_gai_family(), socket.SOCK_STREAM
+            )
+            return _connect(addresses, self.timeout, self.source_address, self.socket_options)
+        except socket.gaierror as exc:
+            raise NameResolutionError(self.host, self, exc) from exc
+        except socket.timeout as exc:
+            raise ConnectTimeoutError(
+                self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+            ) from exc
+        except OSError as exc:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {exc}") from exc
+
+
+def _connect(addresses: _AddrInfo, timeout: Any, source_address: Any, socket_options: Any) -> socket.socket:
+    """Connect to the first reachable address, like urllib3.util.connection."""
+    error = None
+    for family, socktype, proto, _, address in addresses:
+        sock = socket.socket(family, socktype, proto)
+        try:
+            for option in socket_options or ():
+                sock.setsockopt(*option)
+            if timeout is None or isinstance(timeout, (int, float)):
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(address)
+            return sock
+        except OSError as exc:
+            error = exc
+            sock.close()
+    raise error or OSError("getaddrinfo returns an empty list")
+
+
+class DnsCachingAdapter(HTTPAdapter):
+    """
+    ``requests`` adapter whose new connections resolve through a DnsCache.
+
+    The cache only applies to sessions that mount this adapter; connections
+    through a proxy resolve the proxy normally.
+
+    Args:
+        dns_cache: Cache shared by every connection of the adapter
+        **kwargs: HTTPAdapter options (``pool_connections``, ...)
+
+    Example:
+        >>> session.mount('https://', DnsCachingAdapter(DnsCache(ttl=600)))
+    """
+
+    def __init__(self, dns_cache: DnsCache, **kwargs: Any):
+        self.dns_cache = dns_cache
+        attrs = {'dns_cache': dns_cache}
+        self._pool_classes = {
+            'http': type('HTTPConnectionPool', (HTTPConnectionPool,), {
+                'ConnectionCls': type('HTTPConnection', (_CachedResolution, HTTPConnection), attrs),
+            }),
+            'https': type('HTTPSConnectionPool', (HTTPSConnectionPool,), {
+                'ConnectionCls': type('HTTPSConnection', (_CachedResolution, HTTPSConnection), attrs),
+            }),
+        }
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+
+__all__ = ["DnsCache", "DnsCachingAdapter"]
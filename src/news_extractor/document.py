@@ -0,0 +1,86 @@
+"""
+Downloaded HTML with a lazily parsed lxml tree shared by the tiers.
+
+Newspaper4k and Trafilatura used to parse every page into their own
+lxml tree, so each fallback paid for a second parse. :class:`HtmlDocument`
+parses once and hands the tree to every tier: tiers that only read it
+(Trafilatura copies before cleaning) get the tree itself, tiers that
+modify it (Newspaper4k's cleaner) get a deep copy, which costs a fraction
+of a parse. The last tier of a chain takes the parsed tree without a copy.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from typing import Any, Optional, Tuple
+
+from lxml.html import HtmlElement
+from trafilatura.utils import load_html
+
+logger = logging.getLogger(__name__)
+
+
+class HtmlDocument(str):
+    """
+    Decoded page HTML that also carries its parsed tree.
+
+    It is still a ``str``, so custom tiers taking ``html`` keep working;
+    tiers that know about it call tree() or mutable_tree() instead of
+    parsing again. Pickling (process workers) sends the HTML only, and the
+    worker parses its own tree on first use.
+
+    Example:
+        >>> document = as_document(html)
+        >>> tree = document.tree()          # parsed here, once
+        >>> scratch = document.mutable_tree()  # deep copy, safe to modify
+    """
+
+    def __new__(cls, html: str) -> 'HtmlDocument':
+        document = super().__new__(cls, html)
+        document._lock = threading.Lock()
+        document._parsed = False
+        document._tree = None
+        document._last_use = False
+        return document
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        return HtmlDocument, (str(self),)
+
+    def tree(self) -> Optional[HtmlElement]:
+        """
+        The shared tree; callers must not modify it.
+
+        Returns None if the HTML cannot be parsed.
+        """
+        if not self._parsed:
+            with self._lock:
+                if not self._parsed:
+                    self._tree = load_html(str(self))
+                    self._parsed = True
+        return self._tree
+
+    def mutable_tree(self) -> Optional[HtmlElement]:
+        """
+        A tree the caller may modify.
+
+        A deep copy of the shared tree, or the shared tree itself once
+        mark_last_use() said no other tier will read it.
+        """
+        tree = self.tree()
+        if tree is None or self._last_use:
+            return tree
+        return copy.deepcopy(tree)
+
+    def mark_last_use(self) -> None:
+        """Let the next mutable_tree() caller take the parsed tree itself."""
+        self._last_use = True
+
+
+def as_document(html: str) -> HtmlDocument:
+    """Wrap ``html`` in an HtmlDocument unless it already is one."""
+    return html if isinstance(html, HtmlDocument) else HtmlDocument(html)
+
+
+__all__ = ["HtmlDocument", "as_document"]
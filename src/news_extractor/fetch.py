@@ -0,0 +1,634 @@
+"""
+HTTP fetch layer shared by both extraction tiers.
+
+The article HTML is downloaded exactly once per URL and the same payload is
+handed to Newspaper4k (via ``input_html``) and, when needed, to Trafilatura.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional, Protocol, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.request import ACCEPT_ENCODING
+
+from .charset import decode_html
+from .dns_cache import DnsCache, DnsCachingAdapter
+from .throttle import RateBudget
+
+if TYPE_CHECKING:
+    from .http_cache import CachedResponse, HttpCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 8
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_ALLOWED_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+CHUNK_SIZE = 64 * 1024
+
+# Failure reasons reported by FetchError.reason
+REASON_HTTP_STATUS = 'http_status'
+REASON_TIMEOUT = 'timeout'
+REASON_CONNECTION = 'connection_error'
+REASON_CONTENT_TYPE = 'unsupported_content_type'
+REASON_TOO_LARGE = 'body_too_large'
+REASON_DEADLINE = 'deadline_exceeded'
+REASON_CIRCUIT_OPEN = 'circuit_open'
+REASON_PROXY = 'proxy_error'
+REASON_INVALID_URL = 'invalid_url'
+
+# Errors that say the URL itself is unusable; fetching it again cannot help
+_INVALID_URL_ERRORS = (
+    requests.exceptions.MissingSchema,
+    requests.exceptions.InvalidSchema,
+    requests.exceptions.InvalidURL,
+    requests.exceptions.TooManyRedirects,
+)
+
+
+class FetchError(requests.RequestException):
+    """
+    A page could not be downloaded.
+
+    ``reason`` is one of the ``REASON_*`` constants so callers can tell
+    pathological pages (wrong content type, oversized body) from plain
+    network failures.
+    """
+
+    def __init__(self, reason: str, message: str, response: Optional[requests.Response] = None):
+        super().__init__(message, response=response)
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"{self.reason}: {self.args[0]}"
+
+
+class DeadlineExceeded(FetchError):
+    """
+    The per-article deadline ran out.
+
+    ``stage`` names the step that was running: ``connect`` (DNS, connect
+    and response headers), ``download``, ``newspaper4k`` or ``trafilatura``.
+    """
+
+    def __init__(self, stage: str):
+        super().__init__(REASON_DEADLINE, f"deadline exceeded during {stage}")
+        self.stage = stage
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        # Raised inside parse worker processes; keep it picklable
+        return type(self), (self.stage,)
+
+
+def time_left(deadline: Optional[float], stage: str) -> Optional[float]:
+    """
+    Seconds until ``deadline`` (a ``time.monotonic()`` value).
+
+    Returns None without a deadline and raises DeadlineExceeded, naming
+    ``stage``, once it has passed.
+    """
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded(stage)
+    return remaining
+
+
+def _wait_for_budget(wait: float, deadline: Optional[float], stage: str) -> None:
+    """Sleep ``wait`` seconds of RateBudget pacing without overrunning ``deadline``."""
+    if wait <= 0:
+        return
+    remaining = time_left(deadline, stage)
+    if remaining is not None and wait >= remaining:
+        time.sleep(remaining)
+        raise DeadlineExceeded(stage)
+    time.sleep(wait)
+
+
+@dataclass
+class FetchResult:
+    """Downloaded page payload shared by the extraction tiers."""
+
+    url: str
+    html: str
+    status_code: int
+    num_bytes: int  # body bytes as received, before gzip/brotli decoding
+    elapsed: float = 0.0
+    cache_status: Optional[str] = None  # 'hit', 'revalidated' or None
+    body: bytes = b''
+    content_type: Optional[str] = None
+
+
+@dataclass
+class FetchStats:
+    """
+    Counters describing network usage of an extractor.
+
+    ``requests_saved`` / ``bytes_saved`` count the fallback runs that reused
+    the already downloaded payload instead of issuing a second GET.
+    ``cache_hits`` are pages served from the HTTP cache without a request,
+    ``not_modified`` are cheap 304 revalidations. ``failures`` counts
+    failed downloads per FetchError reason; ``retries`` counts repeated
+    attempts after a transient failure. Byte counts are bodies as they
+    came off the wire, before content decoding.
+    """
+
+    requests: int = 0
+    bytes_downloaded: int = 0
+    requests_saved: int = 0
+    bytes_saved: int = 0
+    cache_hits: int = 0
+    not_modified: int = 0
+    retries: int = 0
+    failures: Dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_fetch(self, result: FetchResult) -> None:
+        with self._lock:
+            if result.cache_status == 'hit':
+                self.cache_hits += 1
+                return
+            self.requests += 1
+            if result.cache_status == 'revalidated':
+                self.not_modified += 1
+            else:
+                self.bytes_downloaded += result.num_bytes
+
+    def record_failure(self, reason: str) -> None:
+        with self._lock:
+            self.failures[reason] = self.failures.get(reason, 0) + 1
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def record_reuse(self, num_bytes: int) -> None:
+        with self._lock:
+            self.requests_saved += 1
+            self.bytes_saved += num_bytes
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.bytes_downloaded = 0
+            self.requests_saved = 0
+            self.bytes_saved = 0
+            self.cache_hits = 0
+            self.not_modified = 0
+            self.retries = 0
+            self.failures = {}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'bytes_downloaded': self.bytes_downloaded,
+            'requests_saved': self.requests_saved,
+            'bytes_saved': self.bytes_saved,
+            'cache_hits': self.cache_hits,
+            'not_modified': self.not_modified,
+            'retries': self.retries,
+            'failures': dict(self.failures),
+        }
+
+
+def build_session(
+    headers: Optional[Dict[str, str]] = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    dns_cache: Optional[DnsCache] = None,
+) -> requests.Session:
+    """
+    Build a keep-alive session with per-host connection pools.
+
+    Args:
+        headers: Default headers sent with every request
+        pool_connections: Number of hosts whose pools are kept alive
+        pool_maxsize: Connections kept open per host
+        dns_cache: Resolve the hosts of new connections through this cache
+
+    Connections (and therefore their TLS sessions) are reused across
+    articles from the same host, and compressed transfer encodings are
+    always negotiated.
+    """
+    session = requests.Session()
+    if dns_cache is not None:
+        adapter: HTTPAdapter = DnsCachingAdapter(
+            dns_cache, pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def prewarm_connections(
+    session: requests.Session,
+    urls: Iterable[str],
+    connections_per_host: Optional[Callable[[str, int], int]] = None,
+    timeout: float = 10,
+    max_workers: int = 32,
+    before_request: Optional[Callable[[str], bool]] = None,
+) -> int:
+    """
+    Resolve the distinct hosts of ``urls`` and open pooled connections.
+
+    Each connection is opened by a ``HEAD`` request for the origin's root,
+    sent through the session so it lands in the same per-host pool (with
+    the same proxy and TLS settings) as the batch's requests. The HEADs
+    run in parallel, so the first request to each host skips the cold
+    start. The call returns after ``timeout`` at the latest; slower hosts
+    keep connecting in the background.
+
+    Args:
+        session: Session whose pools receive the connections
+        urls: URLs of the upcoming batch
+        connections_per_host: ``(host, urls_for_host) -> connections``
+            (default: one connection per host)
+        timeout: Seconds to wait for the connects
+        max_workers: Parallel connects
+        before_request: Called with the origin before each HEAD, e.g. to
+            take a rate-limit token; returning False skips that connection
+
+    Returns:
+        Number of connections opened within ``timeout``
+    """
+    origins: Dict[str, Tuple[str, int]] = {}
+    for url in urls:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            continue
+        origin = f'{parts.scheme}://{parts.netloc}/'
+        _, count = origins.get(origin, (parts.hostname, 0))
+        origins[origin] = (parts.hostname, count + 1)
+    if not origins:
+        return 0
+
+    jobs = []
+    for origin, (host, count) in origins.items():
+        wanted = connections_per_host(host, count) if connections_per_host else 1
+        jobs.extend([origin] * max(1, min(count, wanted)))
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(jobs)))
+    futures = [
+        executor.submit(_open_pooled_connection, session, origin, timeout, before_request)
+        for origin in jobs
+    ]
+    done, _ = wait(futures, timeout=timeout)
+    executor.shutdown(wait=False)
+    opened = sum(1 for future in done if future.result())
+    logger.debug("Pre-warmed %d/%d connections to %d hosts", opened, len(jobs), len(origins))
+    return opened
+
+
+def _open_pooled_connection(
+    session: requests.Session,
+    origin: str,
+    timeout: float,
+    before_request: Optional[Callable[[str], bool]] = None
+) -> bool:
+    if before_request is not None and not before_request(origin):
+        return False
+    try:
+        # Any status will do; the body-less response hands the connection
+        # back to the pool
+        session.head(origin, timeout=timeout, allow_redirects=False).close()
+        return True
+    except requests.RequestException as exc:  # pre-warming is best effort
+        logger.debug("Pre-warm failed for %s: %s", origin, exc)
+        return False
+
+
+def decode_body(body: bytes, content_type: Optional[str]) -> str:
+    """
+    Decode a response body once (see charset.resolve_charset()).
+
+    Shared by the sync and async engines so both produce identical text.
+    """
+    return decode_html(body, content_type)[0]
+
+
+def check_content_type(
+    content_type: Optional[str],
+    allowed: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+) -> None:
+    """Raise FetchError unless the media type is HTML (missing is allowed)."""
+    media_type = (content_type or '').split(';')[0].strip().lower()
+    if media_type and allowed and media_type not in allowed:
+        raise FetchError(REASON_CONTENT_TYPE, f"content type {media_type!r} is not HTML")
+
+
+def check_content_length(declared: Optional[str], max_bytes: Optional[int]) -> None:
+    """Raise FetchError when a declared Content-Length exceeds ``max_bytes``."""
+    if max_bytes and declared and declared.isdigit() and int(declared) > max_bytes:
+        raise FetchError(REASON_TOO_LARGE, f"Content-Length {declared} exceeds {max_bytes} bytes")
+
+
+def fetch_html(
+    url: str,
+    session: Optional[requests.Session] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    cache: Optional['HttpCache'] = None,
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    allowed_content_types: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+    deadline: Optional[float] = None,
+    budget: Optional[RateBudget] = None,
+    proxy: Optional[str] = None,
+) -> FetchResult:
+    """
+    Download ``url`` and return its decoded HTML.
+
+    The body is streamed: the status and Content-Type are checked before
+    anything is read, and reading stops as soon as ``max_bytes`` is
+    exceeded. With a ``cache``, fresh entries are served without a request
+    and stale ones are revalidated with a conditional GET.
+
+    ``timeout`` bounds each socket operation. ``deadline`` (a
+    ``time.monotonic()`` value) bounds the whole download: every socket
+    wait is shortened to the time left, so a slow-drip server cannot hold
+    the caller past it.
+
+    A shared ``budget`` paces the run: the request waits for a request
+    slot, and the body is read no faster than the byte rate allows.
+    ``proxy`` routes the request through that HTTP(S) proxy; failing to
+    reach it is reported as ``proxy_error``.
+
+    Raises:
+        FetchError: with a distinct ``reason`` for HTTP errors, timeouts,
+            connection failures, non-HTML content and oversized bodies.
+        DeadlineExceeded: when ``deadline`` passes before the body is read.
+    """
+    cached, request_headers = _cache_lookup(url, headers, cache)
+    if cached is not None and cached.is_fresh(cache.ttl):
+        return _cached_result(cached, 'hit')
+
+    if budget is not None:
+        _wait_for_budget(budget.reserve_request(), deadline, 'connect')
+    remaining = time_left(deadline, 'connect')
+    if remaining is not None:
+        timeout = min(timeout, remaining)
+
+    getter = session.get if session is not None else requests.get
+    try:
+        response = getter(
+            url,
+            headers=request_headers or None,
+            timeout=timeout,
+            stream=True,
+            proxies={'http': proxy, 'https': proxy} if proxy else None,
+        )
+    except _INVALID_URL_ERRORS as exc:
+        raise FetchError(REASON_INVALID_URL, str(exc)) from exc
+    except requests.exceptions.ProxyError as exc:
+        raise FetchError(REASON_PROXY, str(exc)) from exc
+    except requests.ConnectTimeout as exc:
+        time_left(deadline, 'connect')
+        # Through a proxy the only connection made is to the proxy itself
+        raise FetchError(REASON_PROXY if proxy else REASON_TIMEOUT, str(exc)) from exc
+    except requests.Timeout as exc:
+        time_left(deadline, 'connect')
+        raise FetchError(REASON_TIMEOUT, str(exc)) from exc
+    except requests.RequestException as exc:
+        raise FetchError(REASON_CONNECTION, str(exc)) from exc
+
+    with response:
+        if cached is not None and response.status_code == 304:
+            cache.refresh(url)
+            return _cached_result(cached, 'revalidated')
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            raise FetchError(REASON_HTTP_STATUS, str(exc), response=response) from exc
+
+        content_type = response.headers.get('content-type')
+        check_content_type(content_type, allowed_content_types)
+        check_content_length(response.headers.get('content-length'), max_bytes)
+        body = _read_body(response, max_bytes, timeout, deadline, budget)
+
+    return _store_result(
+        url, body, response.status_code, response.headers, cache, num_bytes=response.raw.tell()
+    )
+
+
+class Fetcher(Protocol):
+    """
+    Download backend used by ArticleExtractor.
+
+    ``fetch`` follows the fetch_html() contract: return a FetchResult with
+    the decoded HTML, honour ``cache`` / ``max_bytes`` /
+    ``allowed_content_types`` / ``deadline`` / ``budget`` / ``proxy``, and raise FetchError (with
+    one of the ``REASON_*`` reasons) on failure. It is called from many
+    download threads at once.
+    """
+
+    def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        cache: Optional['HttpCache'] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        allowed_content_types: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+        deadline: Optional[float] = None,
+        budget: Optional[RateBudget] = None,
+        proxy: Optional[str] = None,
+    ) -> FetchResult:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class RequestsFetcher:
+    """
+    Default backend: a pooled ``requests`` session (HTTP/1.1).
+
+    Args:
+        session: Session to use (default: build_session())
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or build_session()
+
+    def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        cache: Optional['HttpCache'] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        allowed_content_types: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+        deadline: Optional[float] = None,
+        budget: Optional[RateBudget] = None,
+        proxy: Optional[str] = None,
+    ) -> FetchResult:
+        return fetch_html(
+            url,
+            session=self.session,
+            headers=headers,
+            timeout=timeout,
+            cache=cache,
+            max_bytes=max_bytes,
+            allowed_content_types=allowed_content_types,
+            deadline=deadline,
+            budget=budget,
+            proxy=proxy,
+        )
+
+    def prewarm(
+        self,
+        urls: Iterable[str],
+        connections_per_host: Optional[Callable[[str, int], int]] = None,
+        timeout: float = 10,
+        before_request: Optional[Callable[[str], bool]] = None,
+    ) -> int:
+        """Open pooled connections ahead of a batch (see prewarm_connections())."""
+        return prewarm_connections(
+            self.session, urls, connections_per_host, timeout=timeout, before_request=before_request
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _read_body(
+    response: requests.Response,
+    max_bytes: Optional[int],
+    timeout: float = 10,
+    deadline: Optional[float] = None,
+    budget: Optional[RateBudget] = None,
+) -> bytes:
+    """Read a streamed body, aborting once it grows past ``max_bytes``."""
+    chunks = []
+    received = 0
+    charged = 0  # wire bytes already paid to ``budget``
+    throttled = budget is not None and budget.limits_bytes
+    try:
+        for chunk in _iter_body(response, timeout, deadline):
+            received += len(chunk)
+            if max_bytes and received > max_bytes:
+                raise FetchError(REASON_TOO_LARGE, f"body exceeds {max_bytes} bytes")
+            chunks.append(chunk)
+            if throttled:
+                # Charge bytes off the wire, not the (larger) decompressed chunk
+                position = response.raw.tell()
+                _wait_for_budget(budget.reserve_bytes(position - charged), deadline, 'download')
+                charged = position
+    except FetchError:
+        raise
+    except requests.RequestException as exc:
+        # requests wraps read timeouts during iter_content in ConnectionError
+        timed_out = isinstance(exc, requests.Timeout) or (
+            bool(exc.args) and isinstance(exc.args[0], ReadTimeoutError)
+        )
+        if timed_out:
+            time_left(deadline, 'download')
+        raise FetchError(REASON_TIMEOUT if timed_out else REASON_CONNECTION, str(exc)) from exc
+    except ReadTimeoutError as exc:
+        time_left(deadline, 'download')
+        raise FetchError(REASON_TIMEOUT, str(exc)) from exc
+    except (ProtocolError, OSError) as exc:
+        raise FetchError(REASON_CONNECTION, str(exc)) from exc
+    return b''.join(chunks)
+
+
+def _iter_body(response: requests.Response, timeout: float, deadline: Optional[float]) -> Iterator[bytes]:
+    """
+    Yield decoded body chunks.
+
+    Without a deadline this is ``iter_content``. With one, chunks are read
+    with ``read1`` (returns whatever has arrived) and the socket timeout is
+    cut to the time left before every read, so a server trickling bytes
+    cannot stretch a single read past the deadline.
+    """
+    if deadline is None:
+        yield from response.iter_content(CHUNK_SIZE)
+        return
+
+    raw = response.raw
+    connection = getattr(raw, 'connection', None)
+    sock = getattr(connection, 'sock', None)
+    while True:
+        remaining = time_left(deadline, 'download')
+        if sock is not None:
+            sock.settimeout(min(timeout, remaining))
+        chunk = raw.read1(CHUNK_SIZE, decode_content=True)
+        if not chunk:
+            # read1 may return b'' while the decoder still holds data
+            tail = raw.read(decode_content=True)
+            if tail:
+                yield tail
+            return
+        yield chunk
+
+
+def _cache_lookup(
+    url: str,
+    headers: Optional[Dict[str, str]],
+    cache: Optional['HttpCache'],
+) -> Tuple[Optional['CachedResponse'], Dict[str, str]]:
+    """Cached entry for ``url`` and the request headers (conditional if stale)."""
+    cached = cache.get(url) if cache is not None else None
+    request_headers = dict(headers or {})
+    if cached is not None:
+        request_headers.update(cached.conditional_headers())
+    return cached, request_headers
+
+
+def _store_result(
+    url: str,
+    body: bytes,
+    status_code: int,
+    headers: Any,
+    cache: Optional['HttpCache'],
+    num_bytes: Optional[int] = None,
+) -> FetchResult:
+    """
+    Cache a downloaded body and wrap it; ``headers`` is case-insensitive.
+
+    ``num_bytes`` is the encoded size received (default: ``len(body)``).
+    """
+    content_type = headers.get('content-type')
+    if cache is not None and status_code == 200:
+        cache.put(
+            url,
+            body,
+            status_code=status_code,
+            content_type=content_type,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+        )
+    return FetchResult(
+        url=url,
+        html=decode_body(body, content_type),
+        status_code=status_code,
+        num_bytes=len(body) if num_bytes is None else num_bytes,
+        body=body,
+        content_type=content_type,
+    )
+
+
+def _cached_result(cached: 'CachedResponse', cache_status: str) -> FetchResult:
+    return FetchResult(
+        url=cached.url,
+        html=decode_body(cached.body, cached.content_type),
+        status_code=cached.status_code,
+        num_bytes=len(cached.body),
+        cache_status=cache_status,
+        body=cached.body,
+        content_type=cached.content_type,
+    )
@@ -0,0 +1,257 @@
+"""
+Content-addressed archive of raw fetched HTML.
+
+Every downloaded body is zlib-compressed and appended to a large pack file
+(``packs/pack-NNNNNN.pack``). A SQLite index maps the SHA-256 of the raw
+body to its pack location and records which URL produced which body when,
+so identical pages are stored once. Readers memory-map the packs and
+decompress straight from the mapped region without copying the record.
+
+Archived pages let extraction bugs be fixed by re-running the tiers over
+stored HTML instead of refetching the corpus from live sites.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+try:  # POSIX advisory locks make appends safe across processes
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+DEFAULT_PACK_SIZE = 1024 ** 3
+RECORD_MAGIC = b'NXA1'
+RECORD_HEADER_SIZE = len(RECORD_MAGIC) + 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    pack INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    raw_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT NOT NULL,
+    sha256 TEXT NOT NULL REFERENCES blobs (sha256),
+    content_type TEXT,
+    status_code INTEGER NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_url ON pages (url, fetched_at);
+"""
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """Index entry of one archived fetch."""
+
+    url: str
+    sha256: str
+    content_type: Optional[str]
+    status_code: int
+    fetched_at: float
+
+
+class HtmlArchive:
+    """
+    Append-only, content-addressed store of raw page bodies.
+
+    Args:
+        root: Archive directory (created on first use)
+        pack_size: Bytes after which a new pack file is started
+
+    Example:
+        >>> archive = HtmlArchive(Path('corpus'))
+        >>> extractor = ArticleExtractor(archive=archive)
+        >>> page = archive.latest('https://bianet.org/...')
+        >>> html = archive.read_body(page.sha256)
+    """
+
+    def __init__(self, root: Path, pack_size: int = DEFAULT_PACK_SIZE):
+        self.root = Path(root)
+        self.pack_size = pack_size
+        self.pack_dir = self.root / 'packs'
+        self.pack_dir.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._maps_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.root / 'index.sqlite', timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _pack_path(self, pack: int) -> Path:
+        return self.pack_dir / f'pack-{pack:06d}.pack'
+
+    # -- writing ---------------------------------------------------------
+
+    def add(
+        self,
+        url: str,
+        body: bytes,
+        content_type: Optional[str] = None,
+        status_code: int = 200,
+        fetched_at: Optional[float] = None
+    ) -> str:
+        """
+        Archive ``body`` fetched from ``url`` and return its SHA-256.
+
+        Bodies already in the archive are not written again; only the
+        URL → content mapping is recorded.
+        """
+        digest = hashlib.sha256(body).digest()
+        sha256 = digest.hex()
+        conn = self._connect()
+
+        if conn.execute('SELECT 1 FROM blobs WHERE sha256 = ?', (sha256,)).fetchone() is None:
+            record = RECORD_MAGIC + digest + zlib.compress(body, 6)
+            with self._write_lock, self._locked_append() as (pack, handle):
+                # Another process may have stored the same body meanwhile
+                if conn.execute('SELECT 1 FROM blobs WHERE sha256 = ?', (sha256,)).fetchone() is None:
+                    offset = handle.seek(0, os.SEEK_END)
+                    handle.write(record)
+                    handle.flush()
+                    with conn:
+                        conn.execute(
+                            'INSERT INTO blobs (sha256, pack, offset, length, raw_size)'
+                            ' VALUES (?, ?, ?, ?, ?)',
+                            (sha256, pack, offset, len(record), len(body)),
+                        )
+
+        with conn:
+            conn.execute(
+                'INSERT INTO pages (url, sha256, content_type, status_code, fetched_at)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (url, sha256, content_type, status_code,
+                 time.time() if fetched_at is None else fetched_at),
+            )
+        return sha256
+
+    def _locked_append(self) -> '_PackAppender':
+        return _PackAppender(self)
+
+    def _current_pack(self) -> int:
+        packs = sorted(self.pack_dir.glob('pack-*.pack'))
+        if not packs:
+            return 0
+        pack = int(packs[-1].stem.split('-')[1])
+        if packs[-1].stat().st_size >= self.pack_size:
+            pack += 1
+        return pack
+
+    # -- reading ---------------------------------------------------------
+
+    def latest(self, url: str) -> Optional[ArchivedPage]:
+        """Most recent archived fetch of ``url``."""
+        row = self._connect().execute(
+            'SELECT url, sha256, content_type, status_code, fetched_at FROM pages'
+            ' WHERE url = ? ORDER BY fetched_at DESC LIMIT 1',
+            (url,),
+        ).fetchone()
+        return ArchivedPage(*row) if row else None
+
+    def iter_pages(self, latest_only: bool = True) -> Iterator[ArchivedPage]:
+        """Iterate over archived fetches (by default the newest per URL)."""
+        query = (
+            'SELECT url, sha256, content_type, status_code, MAX(fetched_at) FROM pages'
+            ' GROUP BY url ORDER BY url'
+            if latest_only else
+            'SELECT url, sha256, content_type, status_code, fetched_at FROM pages'
+            ' ORDER BY fetched_at'
+        )
+        conn = sqlite3.connect(self.root / 'index.sqlite', timeout=30)
+        try:
+            for row in conn.execute(query):
+                yield ArchivedPage(*row)
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        return self._connect().execute('SELECT COUNT(DISTINCT url) FROM pages').fetchone()[0]
+
+    def _location(self, sha256: str) -> Tuple[int, int, int]:
+        row = self._connect().execute(
+            'SELECT pack, offset, length FROM blobs WHERE sha256 = ?', (sha256,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(sha256)
+        return row
+
+    def _map(self, pack: int, end: int) -> mmap.mmap:
+        with self._maps_lock:
+            mapped = self._maps.get(pack)
+            if mapped is None or len(mapped) < end:
+                # The pack grew: map it again. An older mapping is left to
+                # the garbage collector because views may still reference it.
+                with open(self._pack_path(pack), 'rb') as handle:
+                    mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[pack] = mapped
+            return mapped
+
+    def read_compressed(self, sha256: str) -> memoryview:
+        """Zero-copy view of the compressed body inside the mapped pack."""
+        pack, offset, length = self._location(sha256)
+        mapped = self._map(pack, offset + length)
+        return memoryview(mapped)[offset + RECORD_HEADER_SIZE:offset + length]
+
+    def read_body(self, sha256: str) -> bytes:
+        """Decompressed raw body for ``sha256``."""
+        return zlib.decompress(self.read_compressed(sha256))
+
+    def close(self) -> None:
+        """Unmap packs and close this thread's index connection."""
+        with self._maps_lock:
+            for mapped in self._maps.values():
+                try:
+                    mapped.close()
+                except BufferError:  # a memoryview is still alive
+                    pass
+            self._maps.clear()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class _PackAppender:
+    """Context manager holding the cross-process append lock."""
+
+    def __init__(self, archive: HtmlArchive):
+        self._archive = archive
+
+    def __enter__(self) -> Tuple[int, 'object']:
+        lock_path = self._archive.pack_dir / '.lock'
+        self._lock_handle = open(lock_path, 'a+b')
+        if fcntl is not None:
+            fcntl.flock(self._lock_handle, fcntl.LOCK_EX)
+        pack = self._archive._current_pack()
+        self._handle = open(self._archive._pack_path(pack), 'ab')
+        return pack, self._handle
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._handle.close()
+        if fcntl is not None:
+            fcntl.flock(self._lock_handle, fcntl.LOCK_UN)
+        self._lock_handle.close()
+
+
+__all__ = ["ArchivedPage", "HtmlArchive"]
@@ -0,0 +1,234 @@
+"""
+HTTP/2 fetch backend built on httpx.
+
+Most large Turkish outlets serve HTTP/2. Instead of one socket per
+concurrent request, :class:`Http2Fetcher` multiplexes every in-flight
+article of a host as streams on a single TLS connection, negotiated via
+ALPN. Hosts that only speak HTTP/1.1 (and plain ``http://`` URLs) are
+fetched over HTTP/1.1 by the same client automatically. Results, errors
+and cache handling match :func:`fetch.fetch_html`.
+
+Dependencies:
+    pip install 'httpx[http2]' (the ``http2`` extra)
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from .fetch import (
+    DEFAULT_ALLOWED_CONTENT_TYPES,
+    DEFAULT_MAX_BYTES,
+    REASON_CONNECTION,
+    REASON_HTTP_STATUS,
+    REASON_INVALID_URL,
+    REASON_PROXY,
+    REASON_TIMEOUT,
+    REASON_TOO_LARGE,
+    FetchError,
+    FetchResult,
+    _cache_lookup,
+    _cached_result,
+    _store_result,
+    _wait_for_budget,
+    check_content_length,
+    check_content_type,
+    time_left,
+)
+from .http_cache import HttpCache
+from .throttle import RateBudget
+
+try:  # optional dependency
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx[http2]
+    httpx = None
+
+# httpx only negotiates HTTP/2 when h2 is importable
+if importlib.util.find_spec('h2') is None:  # pragma: no cover
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class Http2Fetcher:
+    """
+    Thread-safe HTTP/2 client shared by all download threads.
+
+    Args:
+        headers: Default headers sent with every request
+        max_connections: Open connections across all hosts (an HTTP/2 host
+            normally needs one)
+        verify: Verify TLS certificates
+
+    Example:
+        >>> extractor = ArticleExtractor(http2=True, max_workers=32)
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        verify: bool = True
+    ):
+        if httpx is None:
+            raise ImportError(
+                "Http2Fetcher requires httpx with HTTP/2 support: pip install 'news-extractor[http2]'"
+            )
+        self._client_options = {
+            'http2': True,
+            'headers': headers,
+            'verify': verify,
+            'follow_redirects': True,
+            'limits': httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        }
+        self.client = httpx.Client(**self._client_options)
+        # httpx binds a proxy to the client, so each proxy gets its own
+        self._proxy_clients: Dict[str, 'httpx.Client'] = {}
+        self._versions: Dict[str, int] = {}
+        self._versions_lock = threading.Lock()
+
+    def close(self) -> None:
+        self.client.close()
+        for client in self._proxy_clients.values():
+            client.close()
+
+    def _client_for(self, proxy: Optional[str]) -> 'httpx.Client':
+        if not proxy:
+            return self.client
+        with self._versions_lock:
+            client = self._proxy_clients.get(proxy)
+            if client is None:
+                client = self._proxy_clients[proxy] = httpx.Client(proxy=proxy, **self._client_options)
+            return client
+
+    def protocol_counts(self) -> Dict[str, int]:
+        """Responses received per HTTP version (e.g. ``{'HTTP/2': 40}``)."""
+        with self._versions_lock:
+            return dict(self._versions)
+
+    def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        cache: Optional[HttpCache] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        allowed_content_types: Tuple[str, ...] = DEFAULT_ALLOWED_CONTENT_TYPES,
+        deadline: Optional[float] = None,
+        budget: Optional[RateBudget] = None,
+        proxy: Optional[str] = None,
+    ) -> FetchResult:
+        """Download ``url``; same contract as fetch.fetch_html()."""
+        cached, request_headers = _cache_lookup(url, headers, cache)
+        if cached is not None and cached.is_fresh(cache.ttl):
+            return _cached_result(cached, 'hit')
+
+        if budget is not None:
+            _wait_for_budget(budget.reserve_request(), deadline, 'connect')
+        remaining = time_left(deadline, 'connect')
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+
+        client = self._client_for(proxy)
+        # A per-request Timeout; _read_body() cuts its read limit to the deadline
+        request = client.build_request(
+            'GET', url, headers=request_headers, timeout=httpx.Timeout(timeout)
+        )
+        try:
+            response = client.send(request, stream=True)
+        except (httpx.InvalidURL, httpx.UnsupportedProtocol, httpx.TooManyRedirects) as exc:
+            raise FetchError(REASON_INVALID_URL, str(exc) or type(exc).__name__) from exc
+        except httpx.ProxyError as exc:
+            raise FetchError(REASON_PROXY, str(exc) or type(exc).__name__) from exc
+        except httpx.ConnectError as exc:
+            reason = REASON_PROXY if proxy else REASON_CONNECTION
+            raise FetchError(reason, str(exc) or type(exc).__name__) from exc
+        except httpx.ConnectTimeout as exc:
+            time_left(deadline, 'connect')
+            reason = REASON_PROXY if proxy else REASON_TIMEOUT
+            raise FetchError(reason, str(exc) or type(exc).__name__) from exc
+        except httpx.TimeoutException as exc:
+            time_left(deadline, 'connect')
+            raise FetchError(REASON_TIMEOUT, str(exc) or type(exc).__name__) from exc
+        except httpx.HTTPError as exc:
+            raise FetchError(REASON_CONNECTION, str(exc) or type(exc).__name__) from exc
+
+        try:
+            with self._versions_lock:
+                self._versions[response.http_version] = self._versions.get(response.http_version, 0) + 1
+
+            if cached is not None and response.status_code == 304:
+                cache.refresh(url)
+                return _cached_result(cached, 'revalidated')
+
+            if response.status_code >= 400:
+                raise FetchError(
+                    REASON_HTTP_STATUS,
+                    f"{response.status_code} {response.reason_phrase} for url: {url}",
+                    response=response,
+                )
+
+            check_content_type(response.headers.get('content-type'), allowed_content_types)
+            check_content_length(response.headers.get('content-length'), max_bytes)
+            body = self._read_body(response, max_bytes, timeout, deadline, budget)
+        finally:
+            response.close()
+
+        return _store_result(
+            url, body, response.status_code, response.headers, cache,
+            num_bytes=response.num_bytes_downloaded,
+        )
+
+    def _read_body(
+        self,
+        response: 'httpx.Response',
+        max_bytes: Optional[int],
+        timeout: float,
+        deadline: Optional[float],
+        budget: Optional[RateBudget] = None
+    ) -> bytes:
+        # httpcore looks the read timeout up before every socket read, so
+        # shrinking it between chunks keeps a stalled body within the deadline
+        timeouts = response.request.extensions['timeout']
+        chunks = []
+        received = 0
+        charged = 0
+        throttled = budget is not None and budget.limits_bytes
+        try:
+            _cut_read_timeout(timeouts, timeout, deadline)
+            # Without a chunk size iter_bytes() yields data as frames arrive,
+            # so the deadline is checked between small reads
+            for chunk in response.iter_bytes():
+                received += len(chunk)
+                if max_bytes and received > max_bytes:
+                    raise FetchError(REASON_TOO_LARGE, f"body exceeds {max_bytes} bytes")
+                chunks.append(chunk)
+                if throttled:
+                    downloaded = response.num_bytes_downloaded  # compressed, off the wire
+                    _wait_for_budget(budget.reserve_bytes(downloaded - charged), deadline, 'download')
+                    charged = downloaded
+                _cut_read_timeout(timeouts, timeout, deadline)
+        except httpx.TimeoutException as exc:
+            time_left(deadline, 'download')
+            raise FetchError(REASON_TIMEOUT, str(exc) or type(exc).__name__) from exc
+        except httpx.HTTPError as exc:
+            raise FetchError(REASON_CONNECTION, str(exc) or type(exc).__name__) from exc
+        return b''.join(chunks)
+
+
+def _cut_read_timeout(timeouts: Dict[str, Optional[float]], timeout: float, deadline: Optional[float]) -> None:
+    """Limit the next read to ``timeout`` or what is left of ``deadline``."""
+    remaining = time_left(deadline, 'download')
+    if remaining is not None:
+        timeouts['read'] = min(timeout, remaining)
+
+
+__all__ = ["Http2Fetcher"]
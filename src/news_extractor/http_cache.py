@@ -0,0 +1,219 @@
+"""
+Persistent on-disk HTTP cache for the fetch layer.
+
+Bodies are stored zlib-compressed in a SQLite database together with their
+``ETag`` / ``Last-Modified`` validators. Entries younger than ``ttl`` are
+served without touching the network; older entries are revalidated with a
+conditional GET, so re-running a batch mostly costs ``304 Not Modified``
+responses. The database runs in WAL mode and can be shared by several
+processes; least recently used entries are evicted past ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_TTL = 24 * 3600
+DEFAULT_MAX_BYTES = 1024 ** 3
+# Entries read per eviction query
+EVICT_BATCH = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    content_type TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+-- Running total of ``size``, kept by triggers in the writing transaction
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_meta (key, value)
+    SELECT 'total_size', COALESCE(SUM(size), 0) FROM responses;
+CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses BEGIN
+    UPDATE cache_meta SET value = value + NEW.size WHERE key = 'total_size';
+END;
+CREATE TRIGGER IF NOT EXISTS responses_size_update AFTER UPDATE OF size ON responses BEGIN
+    UPDATE cache_meta SET value = value + NEW.size - OLD.size WHERE key = 'total_size';
+END;
+CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses BEGIN
+    UPDATE cache_meta SET value = value - OLD.size WHERE key = 'total_size';
+END;
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its validators."""
+
+    url: str
+    status_code: int
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    stored_at: float
+
+    def is_fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return now - self.stored_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers turning the next GET into a revalidation request."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    SQLite-backed HTTP response cache.
+
+    Args:
+        path: Database file (created on first use)
+        ttl: Seconds an entry is served without revalidation
+        max_bytes: Compressed size budget; LRU entries are evicted beyond it
+
+    Example:
+        >>> cache = HttpCache(Path('.cache/http.sqlite'), ttl=6 * 3600)
+        >>> extractor = ArticleExtractor(cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached entry for ``url`` (fresh or stale), if any."""
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT status_code, content_type, etag, last_modified, body, stored_at'
+            ' FROM responses WHERE url = ?',
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        with conn:
+            conn.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), url))
+        status_code, content_type, etag, last_modified, body, stored_at = row
+        return CachedResponse(
+            url=url,
+            status_code=status_code,
+            content_type=content_type,
+            etag=etag,
+            last_modified=last_modified,
+            body=zlib.decompress(body),
+            stored_at=stored_at,
+        )
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        status_code: int = 200,
+        content_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a response body and evict old entries if over budget."""
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            # An upsert, not INSERT OR REPLACE: REPLACE deletes the old row
+            # without firing the delete trigger that keeps the size total
+            conn.execute(
+                'INSERT INTO responses'
+                ' (url, status_code, content_type, etag, last_modified, body, size, stored_at, accessed_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'
+                ' ON CONFLICT (url) DO UPDATE SET status_code = excluded.status_code,'
+                ' content_type = excluded.content_type, etag = excluded.etag,'
+                ' last_modified = excluded.last_modified, body = excluded.body,'
+                ' size = excluded.size, stored_at = excluded.stored_at,'
+                ' accessed_at = excluded.accessed_at',
+                (url, status_code, content_type, etag, last_modified, compressed,
+                 len(compressed), now, now),
+            )
+        self._evict()
+
+    def refresh(self, url: str) -> None:
+        """Mark ``url`` as freshly validated (after a 304)."""
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                'UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?',
+                (now, now, url),
+            )
+
+    def size(self) -> int:
+        """Compressed bytes currently stored."""
+        row = self._connect().execute(
+            "SELECT value FROM cache_meta WHERE key = 'total_size'"
+        ).fetchone()
+        return int(row[0])
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        conn = self._connect()
+        with conn:
+            excess = self.size() - self.max_bytes
+            while excess > 0:
+                rows = conn.execute(
+                    'SELECT url, size FROM responses ORDER BY accessed_at LIMIT ?', (EVICT_BATCH,)
+                ).fetchall()
+                if not rows:
+                    return
+                victims = []
+                for url, size in rows:
+                    if excess <= 0:
+                        break
+                    victims.append((url,))
+                    excess -= size
+                conn.executemany('DELETE FROM responses WHERE url = ?', victims)
+
+    def close(self) -> None:
+        """Close this thread's database connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+__all__ = ["CachedResponse", "HttpCache"]
@@ -0,0 +1,76 @@
+"""
+Extraction profiles: which parts of an article the tiers compute.
+
+Most consumers only read ``title`` and ``text``, yet a full extraction
+also ranks top-image candidates, guesses the
+publish date, hunts for authors and walks tables. An
+:class:`ExtractionProfile` switches those sub-steps off in both tiers.
+Skipped fields keep their keys in the result with an empty value, so
+consumers see the same shape whatever the profile.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Union
+
+
+@dataclass(frozen=True)
+class ExtractionProfile:
+    """
+    Sub-steps the extraction tiers run.
+
+    Args:
+        name: Profile name
+        text: Extract the article body (top-node scoring, cleaning and
+            formatting). Without it, results are accepted on their title.
+        metadata: Authors, description, keywords, categories and the
+            meta-tag image
+        dates: Publish date guessing
+        image_scoring: Newspaper4k's ranking of the page's images for the
+            top image (no downloads); off, the meta-tag image is used
+        tables: Table content in Trafilatura's text
+
+    Example:
+        >>> extractor = ArticleExtractor(profile='text_only')
+        >>> from dataclasses import replace
+        >>> extractor = ArticleExtractor(profile=replace(FULL, image_scoring=False))
+    """
+
+    name: str
+    text: bool = True
+    metadata: bool = True
+    dates: bool = True
+    image_scoring: bool = True
+    tables: bool = True
+
+
+FULL = ExtractionProfile('full')
+TEXT_ONLY = ExtractionProfile(
+    'text_only', metadata=False, dates=False, image_scoring=False, tables=False
+)
+METADATA_ONLY = ExtractionProfile('metadata_only', text=False, image_scoring=False, tables=False)
+
+PROFILES: Dict[str, ExtractionProfile] = {
+    profile.name: profile for profile in (FULL, TEXT_ONLY, METADATA_ONLY)
+}
+
+
+def get_profile(profile: Union[str, ExtractionProfile]) -> ExtractionProfile:
+    """
+    Resolve a profile name (``full``, ``text_only``, ``metadata_only``).
+
+    Raises:
+        ValueError: if the name is unknown
+    """
+    if isinstance(profile, ExtractionProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown extraction profile {profile!r}; expected one of {', '.join(PROFILES)}"
+        ) from None
+
+
+__all__ = ["FULL", "METADATA_ONLY", "PROFILES", "TEXT_ONLY", "ExtractionProfile", "get_profile"]
@@ -0,0 +1,182 @@
+"""
+Offline bulk re-extraction over an :class:`HtmlArchive` or WARC files.
+
+Archived pages (or WARC response records) are streamed in chunks to a
+process pool.
+Every worker maps the packs itself, runs the ArticleExtractor tiers and
+serializes its results, and the parent only writes finished JSON lines
+to disk. No network access is involved, so throughput is bound by CPU.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import threading
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from .article_extractor import ArticleExtractor
+from .fetch import DEFAULT_ALLOWED_CONTENT_TYPES, FetchError, check_content_type, decode_body
+from .html_archive import ArchivedPage, HtmlArchive
+from .warc import WarcResponse, iter_warc_responses
+
+DEFAULT_CHUNK_SIZE = 64
+
+_worker_archive: Optional[HtmlArchive] = None
+_worker_extractor: Optional[ArticleExtractor] = None
+
+
+def _init_worker(archive_root: Optional[str], options: Dict[str, Any]) -> None:
+    global _worker_archive, _worker_extractor
+    _worker_archive = HtmlArchive(Path(archive_root)) if archive_root else None
+    _worker_extractor = ArticleExtractor(**options)
+
+
+def _reprocess_chunk(items: List[Union[ArchivedPage, WarcResponse]]) -> Tuple[List[str], int]:
+    """Extract one chunk of pages; return JSON lines and successes."""
+    lines = []
+    successes = 0
+    for item in items:
+        article: Optional[Dict[str, Any]] = None
+        error: Optional[str] = None
+        if isinstance(item, ArchivedPage):
+            entry = {'url': item.url, 'sha256': item.sha256, 'fetched_at': item.fetched_at}
+        else:
+            entry = {'url': item.url, 'warc_date': item.date}
+        try:
+            body = item.body if isinstance(item, WarcResponse) else _worker_archive.read_body(item.sha256)
+            html = decode_body(body, item.content_type)
+            article = _worker_extractor.extract_from_html(item.url, html)
+        except Exception as exc:  # capture unexpected failures
+            error = f"{type(exc).__name__}: {exc}"
+        successes += article is not None
+        entry['extraction'] = article
+        entry['error'] = error
+        lines.append(json.dumps(entry, ensure_ascii=False))
+    return lines, successes
+
+
+def _chunks(
+    pages: Iterable[Any],
+    size: int,
+    backlog: threading.BoundedSemaphore
+) -> Iterator[List[ArchivedPage]]:
+    iterator = iter(pages)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        backlog.acquire()
+        yield chunk
+
+
+def reprocess_archive(
+    archive: HtmlArchive,
+    output: TextIO,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    latest_only: bool = True,
+    extractor_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Re-run the extraction tiers over every archived page.
+
+    Args:
+        archive: Archive to read pages from
+        output: Text stream receiving one JSON object per page
+        workers: Worker processes (default: all cores)
+        chunk_size: Pages handed to a worker per task
+        latest_only: Only the newest fetch of each URL
+        extractor_options: ArticleExtractor keyword arguments
+
+    Returns:
+        Summary with total / successes / success_rate
+    """
+    return _run_pool(
+        archive.iter_pages(latest_only=latest_only),
+        output,
+        archive_root=str(archive.root),
+        workers=workers,
+        chunk_size=chunk_size,
+        extractor_options=extractor_options,
+    )
+
+
+def reprocess_warc(
+    paths: Iterable[Path],
+    output: TextIO,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    extractor_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Re-run the extraction tiers over the 2xx HTML response records of WARC files.
+
+    Records are streamed from disk; see reprocess_archive() for arguments.
+    Records whose Content-Type is not in the extractor's
+    ``allowed_content_types`` are skipped before they reach a worker.
+    """
+    allowed = (extractor_options or {}).get('allowed_content_types', DEFAULT_ALLOWED_CONTENT_TYPES)
+    records = (
+        record
+        for path in paths
+        for record in iter_warc_responses(path)
+        if 200 <= record.status_code < 300 and _is_allowed(record, allowed)
+    )
+    return _run_pool(
+        records,
+        output,
+        archive_root=None,
+        workers=workers,
+        chunk_size=chunk_size,
+        extractor_options=extractor_options,
+    )
+
+
+def _is_allowed(record: WarcResponse, allowed: Tuple[str, ...]) -> bool:
+    try:
+        check_content_type(record.content_type, allowed)
+    except FetchError:
+        return False
+    return True
+
+
+def _run_pool(
+    items: Iterable[Any],
+    output: TextIO,
+    *,
+    archive_root: Optional[str],
+    workers: Optional[int],
+    chunk_size: int,
+    extractor_options: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    workers = workers or os.cpu_count() or 1
+    total = successes = 0
+
+    with Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(archive_root, extractor_options or {}),
+    ) as pool:
+        # Pool feeds tasks eagerly; bound the chunks queued ahead of workers
+        backlog = threading.BoundedSemaphore(workers * 4)
+        chunks = _chunks(items, chunk_size, backlog)
+        for lines, chunk_successes in pool.imap_unordered(_reprocess_chunk, chunks):
+            backlog.release()
+            output.writelines(line + '\n' for line in lines)
+            total += len(lines)
+            successes += chunk_successes
+
+    return {
+        'total': total,
+        'successes': successes,
+        'success_rate': (successes / total * 100) if total else 0.0,
+    }
+
+
+__all__ = ["reprocess_archive", "reprocess_warc"]
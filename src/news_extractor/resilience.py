@@ -0,0 +1,200 @@
+"""
+Retries and per-domain circuit breaking for the fetch layer.
+
+:class:`RetryPolicy` retries idempotent failures (connection errors such
+as resets, unreachable proxies, and 502/503/504 responses) with capped
+exponential backoff and full jitter, so retries from many workers do not
+arrive in lockstep.
+:class:`CircuitBreaker` tracks consecutive failures per domain: once a
+domain crosses the threshold its remaining URLs fail immediately with
+``circuit_open`` instead of each burning a full timeout, and a single
+probe request is let through after ``reset_timeout`` to close it again.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from .fetch import (
+    REASON_CIRCUIT_OPEN,
+    REASON_CONNECTION,
+    REASON_DEADLINE,
+    REASON_HTTP_STATUS,
+    REASON_PROXY,
+    REASON_TIMEOUT,
+    FetchError,
+)
+from .scheduler import domain_of, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ATTEMPTS = 3
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+def _status_of(exc: FetchError) -> Optional[int]:
+    response = exc.response
+    return response.status_code if response is not None else None
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before fetching a URL again.
+
+    Args:
+        attempts: Total tries per URL (1 disables retries)
+        backoff: Base delay in seconds; retry ``n`` waits a random time
+            up to ``backoff * 2 ** (n - 1)`` (full jitter)
+        max_backoff: Upper bound for a single delay; a ``Retry-After``
+            longer than this is not waited for
+        retry_statuses: HTTP statuses worth retrying
+        retry_reasons: FetchError reasons worth retrying
+
+    Example:
+        >>> extractor = ArticleExtractor(retry=RetryPolicy(attempts=4, backoff=1.0))
+    """
+
+    def __init__(
+        self,
+        attempts: int = DEFAULT_ATTEMPTS,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        retry_statuses: Tuple[int, ...] = (502, 503, 504),
+        retry_reasons: Tuple[str, ...] = (REASON_CONNECTION, REASON_PROXY),
+        rng: Optional[random.Random] = None
+    ):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.retry_reasons = retry_reasons
+        self._rng = rng or random.Random()
+
+    def delay(self, exc: FetchError, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retry number ``attempt`` (1-based).
+
+        Returns None when ``exc`` should not be retried.
+        """
+        if attempt >= self.attempts:
+            return None
+        status = _status_of(exc)
+        if exc.reason == REASON_HTTP_STATUS:
+            if status not in self.retry_statuses:
+                return None
+        elif exc.reason not in self.retry_reasons:
+            return None
+
+        delay = self._rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        retry_after = parse_retry_after(exc.response.headers.get('Retry-After')) if status else None
+        if retry_after is not None:
+            if retry_after > self.max_backoff:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probe_started: Optional[float] = None
+
+
+class CircuitBreaker:
+    """
+    Per-domain circuit breaker shared by all download threads.
+
+    A domain opens after ``failure_threshold`` consecutive failures
+    (connection errors, timeouts, 5xx). While open, check() raises
+    FetchError(``circuit_open``). After ``reset_timeout`` seconds one probe
+    request is allowed; its success closes the circuit, its failure opens
+    it again. Any HTTP response below 500 counts as success; other
+    failures (``invalid_url``, content type, body size) are not counted.
+
+    Args:
+        failure_threshold: Consecutive failures that open a domain (0 disables)
+        reset_timeout: Seconds a domain stays open before a probe
+        clock: Time source (tests)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def check(self, url: str) -> None:
+        """Raise FetchError(``circuit_open``) if ``url``'s domain is open."""
+        if self.failure_threshold <= 0:
+            return
+        domain = domain_of(url)
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            if circuit is None or circuit.opened_at is None:
+                return
+            now = self._clock()
+            # A probe that never reported back (e.g. its proxy failed) is
+            # replaced after another reset_timeout
+            last = circuit.opened_at if circuit.probe_started is None else circuit.probe_started
+            if now - last >= self.reset_timeout:
+                circuit.probe_started = now  # this caller is the probe
+                return
+        raise FetchError(
+            REASON_CIRCUIT_OPEN,
+            f"{domain} skipped after {circuit.failures} consecutive failures",
+        )
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            circuit = self._circuits.pop(domain_of(url), None)
+        if circuit is not None and circuit.opened_at is not None:
+            logger.info("Circuit closed for %s", domain_of(url))
+
+    def record_failure(self, url: str, exc: FetchError) -> None:
+        """Count ``exc`` against the domain if it indicates the host is unwell."""
+        if exc.reason == REASON_HTTP_STATUS:
+            status = _status_of(exc)
+            if status is not None and status < 500:
+                self.record_success(url)
+                return
+        elif exc.reason not in (REASON_CONNECTION, REASON_TIMEOUT, REASON_DEADLINE):
+            return
+        if self.failure_threshold <= 0:
+            return
+
+        domain = domain_of(url)
+        with self._lock:
+            circuit = self._circuits.setdefault(domain, _Circuit())
+            circuit.failures += 1
+            reopened = circuit.probe_started is not None
+            circuit.probe_started = None
+            if circuit.failures >= self.failure_threshold and (circuit.opened_at is None or reopened):
+                circuit.opened_at = self._clock()
+                logger.warning(
+                    "Circuit open for %s after %d consecutive failures", domain, circuit.failures
+                )
+
+    def open_domains(self) -> Dict[str, int]:
+        """Domains currently open, with their consecutive failure counts."""
+        with self._lock:
+            return {
+                domain: circuit.failures
+                for domain, circuit in self._circuits.items()
+                if circuit.opened_at is not None
+            }
+
+
+__all__ = ["CircuitBreaker", "RetryPolicy"]
@@ -0,0 +1,412 @@
+"""
+Per-domain politeness scheduling for batch extraction.
+
+Batch workers pull the next URL whose host is ready, so URLs from
+different domains are interleaved and one slow or rate-limited outlet
+never blocks the others. ``Retry-After`` responses pause the affected
+host. Politeness is opt-in: with a ``requests_per_second`` each host gets
+a token bucket (steady request rate plus a small burst), and with a
+``max_in_flight_per_host`` a cap on concurrent requests. The defaults
+pace nothing.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional, Sequence
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# No per-host pacing unless asked for; see DomainScheduler
+DEFAULT_REQUESTS_PER_SECOND: Optional[float] = None
+DEFAULT_BURST = 4
+DEFAULT_MAX_IN_FLIGHT_PER_HOST: Optional[int] = None
+
+# What the backlog runner asks for: gentle enough to avoid 429s and bans
+POLITE_REQUESTS_PER_SECOND = 2.0
+POLITE_MAX_IN_FLIGHT_PER_HOST = 4
+
+
+def domain_of(url: str) -> str:
+    """Return the host used as politeness key (``www.`` stripped)."""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Convert a ``Retry-After`` header (seconds or HTTP date) to seconds.
+
+    Returns None when the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    now = time.time() if now is None else now
+    return max(retry_at.timestamp() - now, 0.0)
+
+
+@dataclass
+class TokenBucket:
+    """Classic token bucket; ``rate`` tokens per second up to ``capacity``."""
+
+    rate: float
+    capacity: float
+    tokens: float = field(default=-1.0)
+    updated: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.tokens < 0:
+            self.tokens = self.capacity
+
+    def refill(self, now: float) -> None:
+        if self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 when ready)."""
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate if self.rate > 0 else float('inf')
+
+    def take(self, now: float) -> None:
+        self.refill(now)
+        self.tokens -= 1
+
+
+@dataclass
+class _HostState:
+    bucket: Optional[TokenBucket]
+    in_flight: int = 0
+    not_before: float = 0.0
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until the host may receive a request (0 when ready)."""
+        rate_wait = self.bucket.wait_time(now) if self.bucket is not None else 0.0
+        return max(self.not_before - now, rate_wait, 0.0)
+
+    def take(self, now: float) -> None:
+        if self.bucket is not None:
+            self.bucket.take(now)
+
+
+class DomainScheduler:
+    """
+    Rate-limit and interleave batch fetches per domain.
+
+    The defaults only interleave domains and honour ``Retry-After``; set
+    the limits to crawl politely.
+
+    Args:
+        requests_per_second: Steady request rate allowed per domain
+            (None: unpaced)
+        burst: Requests a rested domain may receive back-to-back
+        max_in_flight_per_host: Concurrent requests allowed per domain
+            (None: only ``max_workers`` bounds them)
+
+    Example:
+        >>> scheduler = DomainScheduler(requests_per_second=1, max_in_flight_per_host=2)
+        >>> extractor = ArticleExtractor(max_workers=16, scheduler=scheduler)
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        max_in_flight_per_host: Optional[int] = DEFAULT_MAX_IN_FLIGHT_PER_HOST,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_in_flight_per_host = max_in_flight_per_host
+        self._clock = clock
+        self._hosts: Dict[str, _HostState] = {}
+        self._cond = threading.Condition()
+
+    def _host(self, domain: str) -> _HostState:
+        state = self._hosts.get(domain)
+        if state is None:
+            state = _HostState(
+                bucket=TokenBucket(rate=self.requests_per_second, capacity=self.burst)
+                if self.requests_per_second else None
+            )
+            self._hosts[domain] = state
+        return state
+
+    def max_in_flight(self, domain: str) -> float:
+        """Concurrent request limit for ``domain`` (``inf``: unlimited)."""
+        if self.max_in_flight_per_host is None:
+            return float('inf')
+        return self.max_in_flight_per_host
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Do not send requests to the domain of ``url`` for ``seconds``."""
+        with self._cond:
+            state = self._host(domain_of(url))
+            state.not_before = max(state.not_before, self._clock() + seconds)
+            self._cond.notify_all()
+
+    def wait_for_token(self, url: str, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the domain of ``url`` may receive another request, and
+        take its rate token.
+
+        For retries: the caller still holds the in-flight slot its URL got
+        from ScheduledBatch.next(), so only the rate and any deferral apply.
+
+        Returns:
+            False, without taking a token, if that would take longer than
+            ``timeout`` seconds
+        """
+        domain = domain_of(url)
+        with self._cond:
+            give_up = None if timeout is None else self._clock() + timeout
+            while True:
+                now = self._clock()
+                state = self._host(domain)
+                ready_in = state.wait_time(now)
+                if ready_in <= 0:
+                    state.take(now)
+                    return True
+                if give_up is not None and now + ready_in > give_up:
+                    return False
+                self._cond.wait(ready_in)
+
+    def record_response(
+        self,
+        url: str,
+        elapsed: float,
+        status_code: Optional[int] = None,
+        timed_out: bool = False
+    ) -> None:
+        """Feed back the outcome of a fetch (ignored by the static scheduler)."""
+
+    def save(self) -> None:
+        """Persist learned state (nothing to persist for static limits)."""
+
+    def batch(self, urls: Sequence[str]) -> 'ScheduledBatch':
+        """Create a work queue that hands out ``urls`` politely."""
+        return ScheduledBatch(self, urls)
+
+    def _ready_in(self, domain: str, now: float) -> float:
+        """Seconds until ``domain`` may receive a request (caller holds lock)."""
+        state = self._host(domain)
+        if state.in_flight >= self.max_in_flight(domain):
+            return float('inf')
+        return state.wait_time(now)
+
+    def _start(self, domain: str, now: float) -> None:
+        state = self._host(domain)
+        state.take(now)
+        state.in_flight += 1
+
+    def _finish(self, domain: str, refund: bool = False) -> None:
+        with self._cond:
+            state = self._host(domain)
+            state.in_flight -= 1
+            if refund and state.bucket is not None:
+                state.bucket.tokens = min(state.bucket.tokens + 1, state.bucket.capacity)
+            self._cond.notify_all()
+
+
+@dataclass
+class _DomainLimit:
+    limit: float
+    baseline_p95: Optional[float] = None
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=50))
+    outcomes: Deque[bool] = field(default_factory=lambda: deque(maxlen=50))
+    last_decrease: float = 0.0
+
+
+class AdaptiveDomainScheduler(DomainScheduler):
+    """
+    DomainScheduler whose per-host concurrency is tuned at runtime (AIMD).
+
+    Each domain starts at ``initial_limit`` concurrent requests. The limit
+    grows additively (about +1 per window of successes) while the p95
+    latency stays within ``latency_tolerance`` × the domain's best observed
+    p95 and the error rate stays under ``max_error_rate``. Timeouts, 5xx
+    and 429 responses halve it (at most once per ``cooldown`` seconds).
+    Learned limits are written to ``state_path`` so the next run starts warm.
+
+    Example:
+        >>> scheduler = AdaptiveDomainScheduler(state_path=Path('domain_limits.json'))
+        >>> extractor = ArticleExtractor(max_workers=32, scheduler=scheduler)
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        initial_limit: float = 2,
+        min_limit: float = 1,
+        max_limit: float = 16,
+        latency_tolerance: float = 1.5,
+        max_error_rate: float = 0.05,
+        cooldown: float = 2.0,
+        state_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        super().__init__(
+            requests_per_second=requests_per_second,
+            burst=burst,
+            max_in_flight_per_host=int(initial_limit),
+            clock=clock,
+        )
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+        self.state_path = state_path
+        self._limits: Dict[str, _DomainLimit] = {}
+        if state_path is not None and state_path.exists():
+            self._load(state_path)
+
+    def _load(self, path: Path) -> None:
+        try:
+            state = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable domain limits file %s: %s", path, exc)
+            return
+        for domain, entry in state.items():
+            limit = min(max(float(entry.get('limit', self.initial_limit)), self.min_limit), self.max_limit)
+            self._limits[domain] = _DomainLimit(limit=limit, baseline_p95=entry.get('baseline_p95'))
+
+    def _domain_limit(self, domain: str) -> _DomainLimit:
+        entry = self._limits.get(domain)
+        if entry is None:
+            entry = self._limits[domain] = _DomainLimit(limit=self.initial_limit)
+        return entry
+
+    def max_in_flight(self, domain: str) -> int:
+        return max(int(self._domain_limit(domain).limit), 1)
+
+    def limits(self) -> Dict[str, float]:
+        """Current concurrency limit per domain."""
+        with self._cond:
+            return {domain: entry.limit for domain, entry in self._limits.items()}
+
+    def record_response(
+        self,
+        url: str,
+        elapsed: float,
+        status_code: Optional[int] = None,
+        timed_out: bool = False
+    ) -> None:
+        congested = timed_out or status_code == 429 or (status_code is not None and status_code >= 500)
+        failed = congested or status_code is None
+        with self._cond:
+            entry = self._domain_limit(domain_of(url))
+            entry.outcomes.append(failed)
+            now = self._clock()
+
+            if congested:
+                if now - entry.last_decrease >= self.cooldown:
+                    entry.limit = max(entry.limit / 2, self.min_limit)
+                    entry.last_decrease = now
+                return
+
+            if failed:
+                return
+
+            entry.latencies.append(elapsed)
+            if len(entry.latencies) < 10:
+                return
+            p95 = sorted(entry.latencies)[int(len(entry.latencies) * 0.95) - 1]
+            if entry.baseline_p95 is None or p95 < entry.baseline_p95:
+                entry.baseline_p95 = p95
+            error_rate = sum(entry.outcomes) / len(entry.outcomes)
+            if p95 <= entry.baseline_p95 * self.latency_tolerance and error_rate <= self.max_error_rate:
+                entry.limit = min(entry.limit + 1 / entry.limit, self.max_limit)
+            self._cond.notify_all()
+
+    def save(self) -> None:
+        """Write the learned limits to ``state_path`` (atomically)."""
+        if self.state_path is None:
+            return
+        with self._cond:
+            state = {
+                domain: {'limit': round(entry.limit, 3), 'baseline_p95': entry.baseline_p95}
+                for domain, entry in sorted(self._limits.items())
+            }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(tmp_path, self.state_path)
+
+
+class ScheduledBatch:
+    """
+    Thread-safe queue of batch indices, released per domain when polite.
+
+    Workers call :meth:`next` until it returns None and must call
+    :meth:`done` after each fetch.
+    """
+
+    def __init__(self, scheduler: DomainScheduler, urls: Sequence[str]):
+        self._scheduler = scheduler
+        self._urls = urls
+        self._queues: 'OrderedDict[str, Deque[int]]' = OrderedDict()
+        for index, url in enumerate(urls):
+            self._queues.setdefault(domain_of(url), deque()).append(index)
+
+    def next(self) -> Optional[int]:
+        """Block until some domain is ready and return one of its URL indices."""
+        scheduler = self._scheduler
+        with scheduler._cond:
+            while True:
+                if not self._queues:
+                    return None
+                now = scheduler._clock()
+                wait = float('inf')
+                # Round-robin: the domain served last moves to the back.
+                for domain in list(self._queues):
+                    ready_in = scheduler._ready_in(domain, now)
+                    if ready_in <= 0:
+                        queue = self._queues.pop(domain)
+                        index = queue.popleft()
+                        if queue:
+                            self._queues[domain] = queue
+                        scheduler._start(domain, now)
+                        return index
+                    wait = min(wait, ready_in)
+                scheduler._cond.wait(None if wait == float('inf') else wait)
+
+    def done(self, index: int, refund: bool = False) -> None:
+        """
+        Release the in-flight slot taken for ``index``.
+
+        ``refund`` returns the rate token when no request reached the host.
+        """
+        self._scheduler._finish(domain_of(self._urls[index]), refund=refund)
+
+
+__all__ = [
+    "AdaptiveDomainScheduler",
+    "DomainScheduler",
+    "ScheduledBatch",
+    "TokenBucket",
+    "domain_of",
+    "parse_retry_after",
+]
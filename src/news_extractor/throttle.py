@@ -0,0 +1,85 @@
+"""
+Run-wide bandwidth and request-rate budget.
+
+The per-domain scheduler keeps us polite towards each outlet; a
+:class:`RateBudget` caps what the whole run takes from the uplink. One
+budget can be shared by any number of extractors and download threads.
+Bytes are charged chunk by chunk while a body streams in, and the reader
+sleeps just long enough to stay on the rate, so traffic is paced evenly
+instead of arriving in bursts followed by long pauses.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+from .scheduler import TokenBucket
+
+DEFAULT_BURST_SECONDS = 0.1
+
+
+class RateBudget:
+    """
+    Shared bytes/sec and requests/sec limit.
+
+    Tokens may go negative: a caller charges what it just used and gets
+    back how long to wait, so large chunks are paid off as a short pause
+    rather than blocking until the whole chunk fits.
+
+    Args:
+        max_bytes_per_second: Body bytes per second across all fetches
+            (None: unlimited)
+        max_requests_per_second: Requests started per second (None: unlimited)
+        burst_seconds: Budget a rested run may spend at once, in seconds
+            of rate
+        clock: Time source (tests)
+
+    Example:
+        >>> budget = RateBudget(max_bytes_per_second=2_000_000, max_requests_per_second=20)
+        >>> extractor = ArticleExtractor(max_workers=16, budget=budget)
+    """
+
+    def __init__(
+        self,
+        max_bytes_per_second: Optional[float] = None,
+        max_requests_per_second: Optional[float] = None,
+        burst_seconds: float = DEFAULT_BURST_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_bytes_per_second = max_bytes_per_second
+        self.max_requests_per_second = max_requests_per_second
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._bytes = (
+            TokenBucket(max_bytes_per_second, max_bytes_per_second * burst_seconds)
+            if max_bytes_per_second else None
+        )
+        self._requests = (
+            TokenBucket(max_requests_per_second, max(1.0, max_requests_per_second * burst_seconds))
+            if max_requests_per_second else None
+        )
+
+    @property
+    def limits_bytes(self) -> bool:
+        return self._bytes is not None
+
+    def reserve_request(self) -> float:
+        """Charge one request; return the seconds to wait before sending it."""
+        return self._charge(self._requests, 1)
+
+    def reserve_bytes(self, size: int) -> float:
+        """Charge ``size`` received bytes; return the seconds to pause reading."""
+        return self._charge(self._bytes, size)
+
+    def _charge(self, bucket: Optional[TokenBucket], amount: float) -> float:
+        if bucket is None or amount <= 0:
+            return 0.0
+        with self._lock:
+            bucket.refill(self._clock())
+            bucket.tokens -= amount
+            return -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+
+
+__all__ = ["RateBudget"]
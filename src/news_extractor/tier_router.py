@@ -0,0 +1,180 @@
+"""
+Per-domain routing between the extraction tiers.
+
+Some outlets reliably defeat one tier (Newspaper4k returns no text for
+t24.com.tr, for example), yet the fixed chain runs that tier first on
+every article and only then falls back. :class:`TierRouter` keeps a
+decayed success rate and latency per domain and tier, and runs the tiers
+cheapest first by expected cost (latency ÷ success rate). The other tiers stay in the chain as
+fallbacks, and a small share of articles is routed in the default order
+so a site that changes its markup is noticed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .scheduler import domain_of
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPLORE = 0.1
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_DECAY = 0.97
+
+# (tier, succeeded, seconds) for every tier run on an article
+TierAttempt = Tuple[str, bool, float]
+
+
+@dataclass
+class _TierStats:
+    attempts: float = 0.0
+    successes: float = 0.0
+    latency: Optional[float] = None
+
+    def success_rate(self) -> float:
+        # Laplace smoothing keeps one lucky or unlucky page from deciding
+        return (self.successes + 1) / (self.attempts + 2)
+
+
+class TierRouter:
+    """
+    Learn which extraction tier works for which domain.
+
+    Args:
+        explore: Share of articles run in the default tier order, so demoted
+            tiers keep being sampled
+        min_samples: Attempts a tier needs on a domain before it is ranked
+        decay: Weight kept by older observations on every new one (site
+            changes fade the old history out)
+        state_path: JSON file the statistics are loaded from and saved to
+        rng: Random source (tests)
+
+    Example:
+        >>> router = TierRouter(state_path=Path('tier_stats.json'))
+        >>> extractor = ArticleExtractor(max_workers=16, router=router)
+    """
+
+    def __init__(
+        self,
+        explore: float = DEFAULT_EXPLORE,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        decay: float = DEFAULT_DECAY,
+        state_path: Optional[Path] = None,
+        rng: Optional[random.Random] = None
+    ):
+        self.explore = explore
+        self.min_samples = min_samples
+        self.decay = decay
+        self.state_path = state_path
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, _TierStats]] = {}
+        if state_path is not None and state_path.exists():
+            self._load(state_path)
+
+    def order(self, url: str, tiers: Sequence[str]) -> List[str]:
+        """
+        Tiers to run for ``url``, lowest expected cost first.
+
+        Running tier A before B costs ``A.latency + (1 - A.rate) * B.latency``
+        on average, so the chain is cheapest sorted by latency ÷ success
+        rate: a fast tier that often fails can still go first, a slow one
+        needs a better rate. ``tiers`` is the default order; it is kept for
+        domains without enough history and for exploration.
+        """
+        tiers = list(tiers)
+        if self._rng.random() < self.explore:
+            return tiers
+        with self._lock:
+            stats = self._stats.get(domain_of(url))
+            if not stats:
+                return tiers
+            latencies = [entry.latency for entry in stats.values() if entry.latency is not None]
+            typical = sum(latencies) / len(latencies) if latencies else 1.0
+
+            def expected_cost(item: Tuple[int, str]) -> Tuple[float, int]:
+                position, tier = item
+                entry = stats.get(tier)
+                if entry is None or entry.attempts < self.min_samples:
+                    return (typical / 0.5, position)  # unknown: neutral prior
+                latency = entry.latency if entry.latency is not None else typical
+                return (latency / entry.success_rate(), position)
+
+            return [tier for _, tier in sorted(enumerate(tiers), key=expected_cost)]
+
+    def record(self, url: str, attempts: Iterable[TierAttempt]) -> None:
+        """Add the outcome of every tier run on ``url``."""
+        domain = domain_of(url)
+        with self._lock:
+            stats = self._stats.setdefault(domain, {})
+            for tier, succeeded, elapsed in attempts:
+                entry = stats.setdefault(tier, _TierStats())
+                entry.attempts = entry.attempts * self.decay + 1
+                entry.successes = entry.successes * self.decay + succeeded
+                entry.latency = (
+                    elapsed if entry.latency is None
+                    else self.decay * entry.latency + (1 - self.decay) * elapsed
+                )
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Per-domain, per-tier success rate, weighted attempts and latency."""
+        with self._lock:
+            return {
+                domain: {
+                    tier: {
+                        'success_rate': round(entry.success_rate(), 3),
+                        'attempts': round(entry.attempts, 2),
+                        'latency': round(entry.latency, 4) if entry.latency is not None else None,
+                    }
+                    for tier, entry in tiers.items()
+                }
+                for domain, tiers in self._stats.items()
+            }
+
+    def _load(self, path: Path) -> None:
+        try:
+            state = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable tier stats file %s: %s", path, exc)
+            return
+        for domain, tiers in state.items():
+            self._stats[domain] = {
+                tier: _TierStats(
+                    attempts=float(entry.get('attempts', 0)),
+                    successes=float(entry.get('successes', 0)),
+                    latency=entry.get('latency'),
+                )
+                for tier, entry in tiers.items()
+            }
+
+    def save(self) -> None:
+        """Write the statistics to ``state_path`` (atomically)."""
+        if self.state_path is None:
+            return
+        with self._lock:
+            state = {
+                domain: {
+                    tier: {
+                        'attempts': round(entry.attempts, 4),
+                        'successes': round(entry.successes, 4),
+                        'latency': entry.latency,
+                    }
+                    for tier, entry in sorted(tiers.items())
+                }
+                for domain, tiers in sorted(self._stats.items())
+            }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(tmp_path, self.state_path)
+
+
+__all__ = ["TierAttempt", "TierRouter"]
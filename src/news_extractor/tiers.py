@@ -0,0 +1,116 @@
+"""
+Extraction tiers and their acceptance rules.
+
+ArticleExtractor runs a chain of :class:`Tier` objects on the downloaded
+HTML and returns the first accepted result. Each tier has its own time
+budget, minimum text length, title requirement and optional custom
+check, so cheap tiers can go first and a slow one cannot eat the whole
+per-article deadline. The built-in Newspaper4k and Trafilatura tiers
+live next to the extractor (``article_extractor.NEWSPAPER4K_TIER`` /
+``TRAFILATURA_TIER``).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# extract(extractor, url, html) -> result dict or None
+TierFunction = Callable[[Any, str, str], Optional[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class Tier:
+    """
+    One step of the extraction chain.
+
+    Tiers are shipped to parse worker processes, so ``extract`` and
+    ``accept`` must be picklable (module-level functions or methods, not
+    lambdas).
+
+    Args:
+        name: Tier name, reported as the result's ``method``
+        extract: ``extract(extractor, url, html)`` returning a result dict
+            (at least ``text``) or None. ``html`` is an HtmlDocument: a
+            ``str`` whose tree() / mutable_tree() reuse the page's single
+            parse
+        budget: Seconds the tier may run before the chain moves on
+            (None: no limit besides the article deadline)
+        min_length: Minimum text length (None: the extractor's
+            ``min_text_length``)
+        require_title: Reject results without a title
+        accept: Extra check ``accept(result) -> bool``
+
+    Example:
+        >>> from dataclasses import replace
+        >>> chain = [replace(NEWSPAPER4K_TIER, budget=1.0, require_title=True), TRAFILATURA_TIER]
+        >>> extractor = ArticleExtractor(tiers=chain)
+    """
+
+    name: str
+    extract: TierFunction
+    budget: Optional[float] = None
+    min_length: Optional[int] = None
+    require_title: bool = False
+    accept: Optional[Callable[[Dict[str, Any]], bool]] = None
+
+    def rejection(
+        self,
+        result: Dict[str, Any],
+        min_length: int,
+        require_text: bool = True
+    ) -> Optional[str]:
+        """
+        Why ``result`` is not acceptable, or None when it is.
+
+        With ``require_text=False`` (profiles without the article body) a
+        title is required instead of a minimum text length.
+        """
+        text = result.get('text') or ''
+        wanted = self.min_length if self.min_length is not None else min_length
+        if require_text and len(text) < wanted:
+            return f"text too short (len={len(text)})"
+        if (self.require_title or not require_text) and not result.get('title'):
+            return "no title"
+        if self.accept is not None and not self.accept(result):
+            return "rejected by accept()"
+        return None
+
+
+def run_with_budget(
+    function: Callable[[], Optional[Dict[str, Any]]],
+    budget: float,
+    name: str
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    Run ``function`` on a helper thread and wait at most ``budget`` seconds.
+
+    Returns:
+        (finished, result). A tier that overruns cannot be interrupted; its
+        thread finishes in the background and the result is dropped.
+    """
+    outcome: list = []
+    done = threading.Event()
+
+    def target() -> None:
+        try:
+            outcome.append((True, function()))
+        except BaseException as exc:  # re-raised in the caller
+            outcome.append((False, exc))
+        finally:
+            done.set()
+
+    threading.Thread(target=target, name=f'tier-{name}', daemon=True).start()
+    if not done.wait(max(budget, 0)):
+        return False, None
+    succeeded, value = outcome[0]
+    if not succeeded:
+        raise value
+    return True, value
+
+
+__all__ = ["Tier", "TierFunction", "run_with_budget"]
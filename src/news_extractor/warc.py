@@ -0,0 +1,214 @@
+"""
+WARC import and export for the fetch layer.
+
+:class:`WarcWriter` appends every fetched page as a gzip-per-record WARC/1.0
+``response`` record, and :func:`iter_warc_responses` streams ``response``
+records back out of (optionally gzipped) WARC files one record at a time.
+Replayed records enter the extractor at the same point as freshly
+downloaded HTML, so large crawls can be re-extracted with no HTTP traffic.
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.client import responses as http_reasons
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+WARC_VERSION = b'WARC/1.0'
+
+
+@dataclass(frozen=True)
+class WarcResponse:
+    """HTTP response replayed from a WARC ``response`` record."""
+
+    url: str
+    status_code: int
+    content_type: Optional[str]
+    body: bytes
+    date: Optional[str]
+
+
+def _warc_date(timestamp: Optional[float] = None) -> str:
+    moment = datetime.fromtimestamp(timestamp, timezone.utc) if timestamp else datetime.now(timezone.utc)
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class WarcWriter:
+    """
+    Append fetched pages to a ``.warc.gz`` file (one gzip member per record).
+
+    Example:
+        >>> with WarcWriter(Path('crawl.warc.gz')) as warc:
+        ...     extractor = ArticleExtractor(warc_writer=warc)
+        ...     extractor.extract_batch(urls)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._handle: BinaryIO = open(self.path, 'ab')
+        if self._handle.tell() == 0:
+            self._write_warcinfo()
+
+    def __enter__(self) -> 'WarcWriter':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._handle.closed:
+                self._handle.close()
+
+    def _write_record(self, headers: Dict[str, str], block: bytes) -> None:
+        header_lines = [WARC_VERSION]
+        header_lines.extend(f'{name}: {value}'.encode('utf-8') for name, value in headers.items())
+        header_lines.append(b'Content-Length: %d' % len(block))
+        record = b'\r\n'.join(header_lines) + b'\r\n\r\n' + block + b'\r\n\r\n'
+        member = gzip.compress(record)
+        with self._lock:
+            self._handle.write(member)
+            self._handle.flush()
+
+    def _write_warcinfo(self) -> None:
+        block = b'software: news-extractor\r\nformat: WARC File Format 1.0\r\n'
+        self._write_record({
+            'WARC-Type': 'warcinfo',
+            'WARC-Date': _warc_date(),
+            'WARC-Filename': self.path.name,
+            'WARC-Record-ID': f'<urn:uuid:{uuid.uuid4()}>',
+            'Content-Type': 'application/warc-fields',
+        }, block)
+
+    def write_response(
+        self,
+        url: str,
+        body: bytes,
+        status_code: int = 200,
+        content_type: Optional[str] = None,
+        fetched_at: Optional[float] = None
+    ) -> None:
+        """
+        Write one ``response`` record.
+
+        ``body`` is the decoded payload (transfer and content encodings
+        already removed), so the stored HTTP headers describe it as such.
+        """
+        http_headers = [f'HTTP/1.1 {status_code} {http_reasons.get(status_code, "")}'.rstrip()]
+        if content_type:
+            http_headers.append(f'Content-Type: {content_type}')
+        http_headers.append(f'Content-Length: {len(body)}')
+        block = ('\r\n'.join(http_headers) + '\r\n\r\n').encode('iso-8859-1') + body
+        self._write_record({
+            'WARC-Type': 'response',
+            'WARC-Target-URI': url,
+            'WARC-Date': _warc_date(fetched_at),
+            'WARC-Record-ID': f'<urn:uuid:{uuid.uuid4()}>',
+            'Content-Type': 'application/http; msgtype=response',
+        }, block)
+
+
+def _open_warc(path: Path) -> BinaryIO:
+    with open(path, 'rb') as probe:
+        gzipped = probe.read(2) == b'\x1f\x8b'
+    return gzip.open(path, 'rb') if gzipped else open(path, 'rb')
+
+
+def _read_headers(stream: BinaryIO) -> Tuple[Optional[bytes], Dict[str, str]]:
+    """Read a start line and header block; (None, {}) at end of stream."""
+    line = stream.readline()
+    while line in (b'\r\n', b'\n'):
+        line = stream.readline()
+    if not line:
+        return None, {}
+    start_line = line.rstrip(b'\r\n')
+    headers: Dict[str, str] = {}
+    for line in iter(stream.readline, b''):
+        if line in (b'\r\n', b'\n'):
+            break
+        name, _, value = line.decode('utf-8', errors='replace').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return start_line, headers
+
+
+def _dechunk(payload: bytes) -> bytes:
+    body = bytearray()
+    position = 0
+    while position < len(payload):
+        line_end = payload.find(b'\r\n', position)
+        if line_end < 0:
+            break
+        size = int(payload[position:line_end].split(b';')[0] or b'0', 16)
+        if size == 0:
+            break
+        start = line_end + 2
+        body += payload[start:start + size]
+        position = start + size + 2
+    return bytes(body)
+
+
+def _parse_http_block(block: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    head, _, payload = block.partition(b'\r\n\r\n')
+    lines = head.split(b'\r\n')
+    status_parts = lines[0].split(b' ', 2)
+    status_code = int(status_parts[1]) if len(status_parts) > 1 and status_parts[1].isdigit() else 0
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        name, _, value = line.decode('iso-8859-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        payload = _dechunk(payload)
+    encoding = headers.get('content-encoding', '').lower()
+    if encoding in ('gzip', 'x-gzip', 'deflate'):
+        try:
+            payload = zlib.decompress(payload, 47 if encoding != 'deflate' else zlib.MAX_WBITS)
+        except zlib.error:
+            pass
+    return status_code, headers, payload
+
+
+def iter_warc_responses(path: Path) -> Iterator[WarcResponse]:
+    """
+    Stream the HTTP ``response`` records of a WARC file.
+
+    Works on plain and gzipped WARCs; only one record is held in memory
+    at a time. Other record types (request, metadata, ...) are skipped.
+    """
+    with _open_warc(Path(path)) as stream:
+        while True:
+            start_line, headers = _read_headers(stream)
+            if start_line is None:
+                return
+            length = int(headers.get('content-length', '0'))
+            if headers.get('warc-type') != 'response' or not headers.get('warc-target-uri'):
+                remaining = length
+                while remaining > 0:
+                    skipped = stream.read(min(remaining, 1 << 20))
+                    if not skipped:
+                        return
+                    remaining -= len(skipped)
+                continue
+
+            block = stream.read(length)
+            if 'application/http' not in headers.get('content-type', 'application/http'):
+                continue
+            status_code, http_headers, body = _parse_http_block(block)
+            yield WarcResponse(
+                url=headers['warc-target-uri'].strip('<>'),
+                status_code=status_code,
+                content_type=http_headers.get('content-type'),
+                body=body,
+                date=headers.get('warc-date'),
+            )
+
+
+__all__ = ["WarcResponse", "WarcWriter", "iter_warc_responses"]
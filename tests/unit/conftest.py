@@ -0,0 +1,109 @@
+"""Shared fixtures: a local HTTP server and a sample Turkish news page."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import pytest
+
+WORDS = (
+    "haber gündem ekonomi spor dünya siyaset kültür sanat teknoloji sağlık "
+    "eğitim yerel açıklama bakanlık toplantı karar yatırım ve bir bu için ile da "
+    "daha çok gibi olarak"
+).split()
+
+Route = Callable[[BaseHTTPRequestHandler], None]
+
+
+class LocalServer:
+    """
+    Threaded HTTP server on 127.0.0.1 serving ``routes``.
+
+    Every request path is appended to ``hits`` (``HEAD <path>`` for HEAD
+    requests, which always get an empty 200); unknown paths get a 404.
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, Route] = {}
+        self.hits: List[str] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+                server.hits.append(self.path)
+                route = server.routes.get(self.path.split('?')[0])
+                if route is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                else:
+                    route(self)
+
+            def do_HEAD(self) -> None:
+                server.hits.append('HEAD ' + self.path)
+                self.send_response(200)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        self.base = f'http://127.0.0.1:{self._httpd.server_port}'
+        threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True).start()
+
+    def url(self, path: str) -> str:
+        return self.base + path
+
+    def serve(
+        self,
+        path: str,
+        body: bytes,
+        status: int = 200,
+        headers: Tuple[Tuple[str, str], ...] = (('Content-Type', 'text/html; charset=utf-8'),),
+    ) -> None:
+        """Answer ``path`` with a fixed response."""
+        def route(handler: BaseHTTPRequestHandler) -> None:
+            handler.send_response(status)
+            for name, value in headers:
+                handler.send_header(name, value)
+            handler.send_header('Content-Length', str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+
+        self.routes[path] = route
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def server() -> Iterator[LocalServer]:
+    local = LocalServer()
+    yield local
+    local.close()
+
+
+def make_article(images: str = 'https://img.example.com.tr', paragraphs: int = 12) -> str:
+    """A news page with metadata, an og:image and inline images under ``images``."""
+    body = ''.join(
+        '<p>' + ' '.join(WORDS[(i * 7 + j) % len(WORDS)] for j in range(40)).capitalize() + '.</p>'
+        + (f'<figure><img src="{images}/body/{i}.jpg" width="600"></figure>' if i % 4 == 0 else '')
+        for i in range(paragraphs)
+    )
+    return (
+        '<html lang="tr"><head><meta charset="utf-8"><title>Büyük haber başlığı</title>'
+        '<meta property="og:title" content="Büyük haber başlığı">'
+        f'<meta property="og:image" content="{images}/top.jpg">'
+        '<meta name="author" content="Ayşe Yılmaz">'
+        '<meta name="description" content="Haberin kısa özeti">'
+        '<meta property="article:published_time" content="2024-05-01T10:00:00+03:00">'
+        '</head><body><main><article><h1>Büyük haber başlığı</h1>'
+        f'{body}</article></main><footer>Tüm hakları saklıdır</footer></body></html>'
+    )
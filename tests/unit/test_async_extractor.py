@@ -0,0 +1,129 @@
+"""AsyncArticleExtractor downloads and failures against a local aiohttp server."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import pytest
+from conftest import make_article
+
+from news_extractor.fetch import (
+    REASON_CONTENT_TYPE,
+    REASON_DEADLINE,
+    REASON_HTTP_STATUS,
+    DeadlineExceeded,
+    FetchError,
+)
+
+web = pytest.importorskip('aiohttp.web')
+from news_extractor.async_extractor import AsyncArticleExtractor  # noqa: E402
+
+ARTICLE = make_article().encode('utf-8')
+
+
+async def article(request):
+    return web.Response(body=ARTICLE, content_type='text/html', charset='utf-8')
+
+
+async def compressed(request):
+    return web.Response(
+        body=gzip.compress(ARTICLE),
+        headers={'Content-Type': 'text/html; charset=utf-8', 'Content-Encoding': 'gzip'},
+    )
+
+
+async def pdf(request):
+    return web.Response(body=b'%PDF-1.4', content_type='application/pdf')
+
+
+async def stalled(request):
+    await asyncio.sleep(5)
+    return web.Response(body=ARTICLE, content_type='text/html')
+
+
+@asynccontextmanager
+async def local_server() -> AsyncIterator[str]:
+    app = web.Application()
+    app.router.add_get('/haber', article)
+    app.router.add_get('/gzip', compressed)
+    app.router.add_get('/belge.pdf', pdf)
+    app.router.add_get('/yavas', stalled)
+    runner = web.AppRunner(app, shutdown_timeout=0.1)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f'http://127.0.0.1:{port}'
+    finally:
+        await runner.cleanup()
+
+
+def run(scenario, **options):
+    """Run ``scenario(extractor, base_url)`` against a fresh server and extractor."""
+    async def main():
+        async with local_server() as base:
+            async with AsyncArticleExtractor(**options) as extractor:
+                return await scenario(extractor, base)
+
+    return asyncio.run(main())
+
+
+def test_extracts_an_article():
+    async def scenario(extractor, base):
+        return await extractor.extract(base + '/haber')
+
+    result = run(scenario)
+
+    assert result['title'] == 'Büyük haber başlığı'
+
+
+def test_http_errors_keep_the_response():
+    async def scenario(extractor, base):
+        with pytest.raises(FetchError) as raised:
+            await extractor._fetch(base + '/yok')
+        return raised.value, extractor.fetch_stats.as_dict()
+
+    error, stats = run(scenario)
+
+    assert error.reason == REASON_HTTP_STATUS
+    assert error.response.status_code == 404
+    assert stats['failures'] == {REASON_HTTP_STATUS: 1}
+
+
+def test_non_html_is_rejected():
+    async def scenario(extractor, base):
+        with pytest.raises(FetchError) as raised:
+            await extractor._fetch(base + '/belge.pdf')
+        return raised.value
+
+    assert run(scenario).reason == REASON_CONTENT_TYPE
+
+
+def test_gzip_bodies_are_decoded():
+    async def scenario(extractor, base):
+        return await extractor._fetch(base + '/gzip')
+
+    fetched = run(scenario)
+
+    assert fetched.body == ARTICLE
+    assert 'Büyük haber başlığı' in fetched.html
+    assert fetched.num_bytes == len(gzip.compress(ARTICLE))
+
+
+def test_deadline_bounds_a_stalled_response():
+    async def scenario(extractor, base):
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded) as raised:
+            await extractor._fetch(base + '/yavas', started + 0.3)
+        return raised.value, time.monotonic() - started, extractor.fetch_stats.as_dict()
+
+    error, elapsed, stats = run(scenario, deadline=0.3)
+
+    assert error.stage == 'connect'
+    assert elapsed < 1
+    assert stats['failures'] == {REASON_DEADLINE: 1}
@@ -0,0 +1,123 @@
+"""RateBudget pacing and what each fetch backend charges to it."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+
+import pytest
+
+from news_extractor.fetch import fetch_html
+from news_extractor.throttle import RateBudget
+
+BODY = ('<html><body>' + '<p>Türkçe haber metni</p>' * 20000 + '</body></html>').encode('utf-8')
+ENCODED = gzip.compress(BODY)
+
+
+class RecordingBudget(RateBudget):
+    """A budget too large to ever pause, recording the bytes charged."""
+
+    def __init__(self) -> None:
+        super().__init__(max_bytes_per_second=1e12)
+        self.charged = 0
+
+    def reserve_bytes(self, size: int) -> float:
+        self.charged += size
+        return super().reserve_bytes(size)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def page(server):
+    server.serve('/page', ENCODED, headers=(
+        ('Content-Type', 'text/html; charset=utf-8'), ('Content-Encoding', 'gzip'),
+    ))
+    return server.url('/page')
+
+
+def test_request_rate():
+    clock = FakeClock()
+    budget = RateBudget(max_requests_per_second=10, burst_seconds=0.1, clock=clock)
+
+    assert budget.reserve_request() == 0
+    assert budget.reserve_request() == pytest.approx(0.1)
+    clock.now += 1.0
+    assert budget.reserve_request() == 0
+
+
+def test_bytes_go_into_debt():
+    clock = FakeClock()
+    budget = RateBudget(max_bytes_per_second=1000, burst_seconds=0.1, clock=clock)
+
+    assert budget.limits_bytes
+    assert budget.reserve_bytes(100) == 0
+    assert budget.reserve_bytes(500) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert budget.reserve_bytes(0) == 0
+
+
+def test_unlimited_budget_never_waits():
+    budget = RateBudget()
+
+    assert not budget.limits_bytes
+    assert budget.reserve_bytes(10 ** 9) == budget.reserve_request() == 0
+
+
+def test_requests_backend_charges_wire_bytes(page):
+    budget = RecordingBudget()
+    result = fetch_html(page, budget=budget)
+
+    assert result.body == BODY
+    assert budget.charged == len(ENCODED)
+
+
+def test_http2_backend_charges_wire_bytes(page):
+    http2 = pytest.importorskip('news_extractor.http2')
+    pytest.importorskip('httpx')
+    fetcher = http2.Http2Fetcher()
+    budget = RecordingBudget()
+    try:
+        result = fetcher.fetch(page, budget=budget)
+    finally:
+        fetcher.close()
+
+    assert result.body == BODY
+    assert budget.charged == len(ENCODED)
+
+
+def test_curl_backend_charges_wire_bytes(page):
+    pytest.importorskip('pycurl')
+    from news_extractor.curl_multi import CurlMultiFetcher
+
+    fetcher = CurlMultiFetcher()
+    budget = RecordingBudget()
+    try:
+        result = fetcher.fetch(page, budget=budget)
+    finally:
+        fetcher.close()
+
+    assert result.body == BODY
+    assert budget.charged == len(ENCODED)
+
+
+def test_async_backend_charges_wire_bytes(page):
+    pytest.importorskip('aiohttp')
+    from news_extractor.async_extractor import AsyncArticleExtractor
+
+    budget = RecordingBudget()
+
+    async def fetch():
+        async with AsyncArticleExtractor(budget=budget) as extractor:
+            return await extractor._fetch(page)
+
+    result = asyncio.run(fetch())
+    assert result.body == BODY
+    assert budget.charged == len(ENCODED)
+    assert result.num_bytes == len(ENCODED)
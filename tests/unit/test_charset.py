@@ -0,0 +1,54 @@
+"""Charset resolution order: header, BOM, meta, heuristic, detector."""
+
+from __future__ import annotations
+
+import codecs
+
+import pytest
+
+from news_extractor.charset import decode_html, resolve_charset
+
+TEXT = 'Çağdaş gazetecilik üzerine düşünceler: şimdi, İstanbul ve Güneydoğu'
+META_1254 = b'<html><head><meta charset="windows-1254"></head><body>'
+
+
+@pytest.mark.parametrize('body, content_type, expected', [
+    # The header wins over everything in the body
+    (codecs.BOM_UTF8 + META_1254, 'text/html; charset=ISO-8859-9', ('cp1254', 'header')),
+    # Unknown header labels fall through to the body
+    (codecs.BOM_UTF8 + b'<p>x</p>', 'text/html; charset=bogus', ('utf-8-sig', 'bom')),
+    # The BOM beats a <meta> tag
+    (codecs.BOM_UTF8 + META_1254, 'text/html', ('utf-8-sig', 'bom')),
+    (META_1254 + TEXT.encode('utf-8'), None, ('cp1254', 'meta')),
+    (b'<?xml version="1.0" encoding="ISO-8859-9"?><html>', None, ('cp1254', 'meta')),
+    # A <meta> tag read as ASCII cannot be UTF-16
+    (b'<meta charset="utf-16">', None, ('utf-8', 'meta')),
+    (b'<html>' + TEXT.encode('utf-8'), None, ('utf-8', 'heuristic')),
+    (b'<html>' + TEXT.encode('cp1254'), None, ('cp1254', 'heuristic')),
+])
+def test_resolution_order(body, content_type, expected):
+    assert resolve_charset(body, content_type) == expected
+
+
+def test_meta_beyond_the_sniff_window_is_ignored():
+    body = b'<html>' + b' ' * 5000 + META_1254 + TEXT.encode('utf-8')
+
+    assert resolve_charset(body) == ('utf-8', 'heuristic')
+
+
+def test_other_single_byte_pages_go_to_the_detector():
+    body = ('<html><body>' + 'Привет, как дела? Это новости дня. ' * 20).encode('cp1251')
+
+    assert resolve_charset(body)[1] == 'detector'
+
+
+@pytest.mark.parametrize('encoding, content_type', [
+    ('utf-8', None),
+    ('cp1254', None),
+    ('iso-8859-9', 'text/html; charset=iso-8859-9'),
+    ('utf-8-sig', None),
+])
+def test_decode_html_round_trips_turkish(encoding, content_type):
+    text, _ = decode_html(('<p>' + TEXT + '</p>').encode(encoding), content_type)
+
+    assert text == '<p>' + TEXT + '</p>'
@@ -0,0 +1,94 @@
+"""CurlMultiFetcher results, errors and a failing transfer thread."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from conftest import make_article
+
+from news_extractor.fetch import (
+    REASON_CONNECTION,
+    REASON_CONTENT_TYPE,
+    REASON_HTTP_STATUS,
+    REASON_TOO_LARGE,
+    FetchError,
+)
+
+pycurl = pytest.importorskip('pycurl')
+from news_extractor.curl_multi import CurlMultiFetcher  # noqa: E402
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = CurlMultiFetcher()
+    yield fetcher
+    fetcher.close()
+
+
+def test_fetches_the_page(fetcher, server):
+    body = make_article().encode('utf-8')
+    server.serve('/haber', body)
+
+    result = fetcher.fetch(server.url('/haber'))
+
+    assert result.body == body
+    assert result.status_code == 200
+
+
+def test_http_errors_keep_the_response(fetcher, server):
+    server.serve('/yok', b'', status=404)
+
+    with pytest.raises(FetchError) as raised:
+        fetcher.fetch(server.url('/yok'))
+    assert raised.value.reason == REASON_HTTP_STATUS
+    assert raised.value.response.status_code == 404
+
+
+def test_non_html_is_aborted_after_the_headers(fetcher, server):
+    server.serve('/belge.pdf', b'%PDF-1.4', headers=(('Content-Type', 'application/pdf'),))
+
+    with pytest.raises(FetchError) as raised:
+        fetcher.fetch(server.url('/belge.pdf'))
+    assert raised.value.reason == REASON_CONTENT_TYPE
+
+
+def test_oversize_bodies_are_aborted(fetcher, server):
+    server.serve('/buyuk', b'<p>' + b'x' * 16_000)
+
+    with pytest.raises(FetchError) as raised:
+        fetcher.fetch(server.url('/buyuk'), max_bytes=1024)
+    assert raised.value.reason == REASON_TOO_LARGE
+
+
+class BrokenMulti:
+    """A CurlMulti whose perform() fails, as pycurl.error can mid-batch."""
+
+    def __init__(self, multi):
+        self._multi = multi
+
+    def perform(self):
+        raise pycurl.error(pycurl.E_OUT_OF_MEMORY, 'out of memory')
+
+    def __getattr__(self, name):
+        return getattr(self._multi, name)
+
+
+def test_a_failing_transfer_thread_fails_the_waiting_callers(fetcher, server):
+    server.serve('/haber', make_article().encode('utf-8'))
+    fetcher._multi = BrokenMulti(fetcher._multi)
+    outcome = []
+
+    def fetch():
+        try:
+            fetcher.fetch(server.url('/haber'), timeout=1)
+        except FetchError as exc:
+            outcome.append(exc.reason)
+
+    caller = threading.Thread(target=fetch, daemon=True)
+    caller.start()
+    caller.join(5)
+
+    assert outcome == [REASON_CONNECTION]
+    with pytest.raises(RuntimeError):
+        fetcher.fetch(server.url('/haber'))
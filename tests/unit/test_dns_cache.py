@@ -0,0 +1,134 @@
+"""DnsCache lookups and its scoping to one session."""
+
+from __future__ import annotations
+
+import socket
+
+import pytest
+import requests
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.dns_cache import DnsCache
+from news_extractor.fetch import build_session, prewarm_connections
+from news_extractor.scheduler import DomainScheduler
+from news_extractor.throttle import RateBudget
+
+ADDRESS = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', 80))]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Record system lookups; ``haber.test`` and ``haber.test.`` resolve to 127.0.0.1."""
+    system = socket.getaddrinfo
+    hosts = []
+
+    def getaddrinfo(host, port, *args, **kwargs):
+        hosts.append(host)
+        if host == 'nowhere.test':
+            raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        return system('127.0.0.1' if host.rstrip('.') == 'haber.test' else host, port, *args, **kwargs)
+
+    monkeypatch.setattr(socket, 'getaddrinfo', getaddrinfo)
+    return hosts
+
+
+def test_lookups_are_reused_for_ttl(lookups):
+    clock = FakeClock()
+    cache = DnsCache(ttl=60, clock=clock)
+
+    first = cache.getaddrinfo('haber.test', 80)
+    assert cache.getaddrinfo('haber.test', 80) == first
+    assert (lookups, cache.hits, cache.misses) == (['haber.test'], 1, 1)
+    clock.now += 60
+    cache.getaddrinfo('haber.test', 80)
+    assert lookups == ['haber.test'] * 2
+
+
+def test_failures_are_remembered_for_negative_ttl(lookups):
+    clock = FakeClock()
+    cache = DnsCache(negative_ttl=30, clock=clock)
+
+    for _ in range(2):
+        with pytest.raises(socket.gaierror):
+            cache.getaddrinfo('nowhere.test', 80)
+    assert lookups == ['nowhere.test']
+    clock.now += 30
+    with pytest.raises(socket.gaierror):
+        cache.getaddrinfo('nowhere.test', 80)
+    assert lookups == ['nowhere.test'] * 2
+
+
+def test_only_the_session_with_the_cache_uses_it(lookups, server):
+    def closing(handler):
+        handler.send_response(200)
+        handler.send_header('Content-Length', '2')
+        handler.send_header('Connection', 'close')  # every request connects anew
+        handler.end_headers()
+        handler.wfile.write(b'ok')
+
+    server.routes['/haber'] = closing
+    url = server.url('/haber').replace('127.0.0.1', 'haber.test')
+    cache = DnsCache()
+    session = build_session(dns_cache=cache)
+
+    for _ in range(3):
+        assert session.get(url, timeout=5).text == 'ok'
+    assert (lookups, cache.misses, cache.hits) == (['haber.test'], 1, 2)
+
+    requests.get(url, timeout=5)
+    assert lookups == ['haber.test'] * 2  # other clients resolve normally
+    assert socket.getaddrinfo.__name__ == 'getaddrinfo'
+    with pytest.raises(requests.ConnectionError):
+        build_session(dns_cache=cache).get('http://nowhere.test/', timeout=5)
+
+
+def test_fqdn_lookups_keep_the_trailing_dot(lookups, server):
+    server.serve('/haber', b'ok')
+    url = server.url('/haber').replace('127.0.0.1', 'haber.test.')
+
+    assert build_session(dns_cache=DnsCache()).get(url, timeout=5).text == 'ok'
+    assert lookups == ['haber.test.']
+
+
+def test_prewarm_parks_connections_in_the_session_pool(server):
+    server.serve('/haber', b'ok')
+    url = server.url('/haber')
+    session = build_session()
+    pool = session.get_adapter(url).poolmanager.connection_from_url(url)
+
+    assert prewarm_connections(session, [url] * 3, lambda host, count: 2) == 2
+    assert server.hits == ['HEAD /'] * 2
+    opened = pool.num_connections
+    session.get(url, timeout=5)
+    assert pool.num_connections == opened  # served by a pre-warmed connection
+
+
+class CountingBudget(RateBudget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests = 0
+
+    def reserve_request(self) -> float:
+        self.requests += 1
+        return super().reserve_request()
+
+
+def test_prewarm_takes_scheduler_tokens_and_budget(server):
+    server.serve('/haber', b'ok')
+    budget = CountingBudget()
+    # One token now, the next one 100 s away: the second HEAD is skipped
+    scheduler = DomainScheduler(requests_per_second=0.01, burst=1)
+    extractor = ArticleExtractor(scheduler=scheduler, budget=budget, timeout=1)
+
+    assert extractor.prewarm_connections([server.url('/haber')] * 2) == 1
+    assert server.hits == ['HEAD /']
+    assert budget.requests == 1
+    assert not scheduler.wait_for_token(server.url('/haber'), timeout=0)
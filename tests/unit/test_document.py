@@ -0,0 +1,68 @@
+"""HtmlDocument: one parse per page, shared by the tiers without mutation."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from conftest import make_article
+from lxml.html import tostring
+
+from news_extractor import document as document_module
+from news_extractor.article_extractor import NEWSPAPER4K_TIER, TRAFILATURA_TIER, ArticleExtractor
+from news_extractor.document import HtmlDocument, as_document
+
+URL = 'https://www.example.com.tr/gundem/haber-1'
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count the pages HtmlDocument parses."""
+    calls = []
+    load_html = document_module.load_html
+
+    def counting(html):
+        calls.append(html)
+        return load_html(html)
+
+    monkeypatch.setattr(document_module, 'load_html', counting)
+    return calls
+
+
+@pytest.mark.parametrize('tiers', [
+    (NEWSPAPER4K_TIER, TRAFILATURA_TIER),
+    (TRAFILATURA_TIER, NEWSPAPER4K_TIER),
+])
+def test_both_tiers_share_one_unchanged_tree(parses, tiers):
+    extractor = ArticleExtractor()
+    document = as_document(make_article())
+    before = tostring(document.tree())
+
+    for tier in tiers:
+        result = tier.extract(extractor, URL, document)
+        assert result['title'] == 'Büyük haber başlığı'
+        assert tostring(document.tree()) == before
+
+    assert len(parses) == 1
+
+
+def test_the_last_use_takes_the_tree_itself(parses):
+    document = as_document(make_article())
+    tree = document.tree()
+
+    assert document.mutable_tree() is not tree
+    document.mark_last_use()
+    assert document.mutable_tree() is tree
+    assert len(parses) == 1
+
+
+def test_pickling_sends_the_html_only(parses):
+    document = as_document(make_article())
+    document.tree()
+
+    copied = pickle.loads(pickle.dumps(document))
+
+    assert isinstance(copied, HtmlDocument)
+    assert copied == document
+    assert not copied._parsed
+    assert as_document(copied) is copied
@@ -0,0 +1,47 @@
+"""extract_article() and the shared default extractor's session."""
+
+from __future__ import annotations
+
+import pytest
+from conftest import make_article
+
+from news_extractor import article_extractor
+from news_extractor.article_extractor import extract_article
+
+
+@pytest.fixture
+def default_extractor(monkeypatch):
+    """A fresh module-level extractor for the test, closed afterwards."""
+    monkeypatch.setattr(article_extractor, '_default_extractor', None)
+    yield article_extractor._get_default_extractor
+    extractor = article_extractor._default_extractor
+    if extractor is not None:
+        extractor.close()
+
+
+def test_calls_reuse_one_session_and_connection(default_extractor, server):
+    for path in ('/haber/1', '/haber/2'):
+        server.serve(path, make_article().encode('utf-8'))
+
+    first = extract_article(server.url('/haber/1'))
+    extractor = default_extractor()
+    session = extractor.fetcher.session
+    second = extract_article(server.url('/haber/2'))
+
+    assert first['title'] == second['title'] == 'Büyük haber başlığı'
+    assert default_extractor() is extractor
+    assert extractor.fetcher.session is session
+    pools = session.get_adapter(server.base).poolmanager.pools
+    assert [pools[key].num_connections for key in pools.keys()] == [1]
+
+
+def test_close_releases_the_session(default_extractor, server):
+    server.serve('/haber', make_article().encode('utf-8'))
+    extract_article(server.url('/haber'))
+    extractor = default_extractor()
+    poolmanager = extractor.fetcher.session.get_adapter(server.base).poolmanager
+    assert len(poolmanager.pools) == 1
+
+    extractor.close()
+
+    assert len(poolmanager.pools) == 0
@@ -0,0 +1,210 @@
+"""fetch_html() results, failure reasons and deadlines against a local server."""
+
+from __future__ import annotations
+
+import gzip
+import socket
+import threading
+import time
+
+import pytest
+from conftest import make_article
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.fetch import (
+    REASON_CONNECTION,
+    REASON_CONTENT_TYPE,
+    REASON_HTTP_STATUS,
+    REASON_TIMEOUT,
+    REASON_TOO_LARGE,
+    DeadlineExceeded,
+    FetchError,
+    build_session,
+    fetch_html,
+)
+from news_extractor.tiers import Tier
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def reason_of(url, **options):
+    with pytest.raises(FetchError) as raised:
+        fetch_html(url, **options)
+    return raised.value.reason
+
+
+def test_decodes_the_body_once(server):
+    body = make_article().encode('cp1254', errors='replace')
+    server.serve('/haber', body, headers=(('Content-Type', 'text/html; charset=windows-1254'),))
+
+    result = fetch_html(server.url('/haber'), session=build_session())
+
+    assert 'Büyük haber başlığı' in result.html
+    assert (result.status_code, result.num_bytes, result.body) == (200, len(body), body)
+
+
+def test_gzip_bodies_are_decompressed(server):
+    body = make_article().encode('utf-8')
+    server.serve('/haber', gzip.compress(body), headers=(
+        ('Content-Type', 'text/html; charset=utf-8'), ('Content-Encoding', 'gzip'),
+    ))
+
+    result = fetch_html(server.url('/haber'))
+
+    assert result.body == body
+    assert result.num_bytes == len(gzip.compress(body))
+
+
+def untitled(extractor, url, html):
+    return {'title': None, 'text': 'Türkçe haber metni. ' * 10}
+
+
+def titled(extractor, url, html):
+    return {'title': 'Başlık', 'text': 'Türkçe haber metni. ' * 10}
+
+
+def curl_fetcher():
+    pytest.importorskip('pycurl')
+    from news_extractor.curl_multi import CurlMultiFetcher
+    return CurlMultiFetcher()
+
+
+@pytest.mark.parametrize('backend', [
+    lambda: {},
+    lambda: {'http2': True},
+    lambda: {'fetcher': curl_fetcher()},
+], ids=['requests', 'http2', 'curl'])
+def test_stats_count_wire_bytes(server, backend):
+    encoded = gzip.compress(make_article().encode('utf-8'))
+    server.serve('/haber', encoded, headers=(
+        ('Content-Type', 'text/html; charset=utf-8'), ('Content-Encoding', 'gzip'),
+    ))
+    options = backend()
+    tiers = [Tier('first', untitled, require_title=True), Tier('second', titled)]
+
+    with ArticleExtractor(tiers=tiers, **options) as extractor:
+        results = extractor.extract_batch([server.url('/haber')])
+        fetch = extractor.get_stats(results)['fetch']
+    if 'fetcher' in options:
+        options['fetcher'].close()
+
+    assert results[server.url('/haber')]['method'] == 'second'
+    assert fetch['requests'] == fetch['requests_saved'] == 1
+    assert fetch['bytes_downloaded'] == fetch['bytes_saved'] == len(encoded)
+
+
+def test_http_errors_keep_the_response(server):
+    server.serve('/yok', b'not found', status=404)
+
+    with pytest.raises(FetchError) as raised:
+        fetch_html(server.url('/yok'))
+    assert raised.value.reason == REASON_HTTP_STATUS
+    assert raised.value.response.status_code == 404
+    assert str(raised.value).startswith('http_status: 404')
+
+
+def test_non_html_is_rejected_before_the_body(server, release):
+    sent = []
+
+    def image(handler):
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'image/png')
+        handler.send_header('Content-Length', str(10 ** 6))
+        handler.end_headers()
+        sent.append(True)
+        release.wait(5)  # the body never comes
+
+    server.routes['/resim'] = image
+    assert reason_of(server.url('/resim'), timeout=5) == REASON_CONTENT_TYPE
+    assert sent == [True]
+
+
+def test_declared_oversize_is_rejected_before_the_body(server, release):
+    def huge(handler):
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/html')
+        handler.send_header('Content-Length', str(10 ** 9))
+        handler.end_headers()
+        release.wait(5)
+
+    server.routes['/dev'] = huge
+    assert reason_of(server.url('/dev'), max_bytes=1000, timeout=5) == REASON_TOO_LARGE
+
+
+def test_streamed_oversize_stops_reading(server):
+    def chunked(handler):
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/html')
+        handler.send_header('Transfer-Encoding', 'chunked')
+        handler.end_headers()
+        for _ in range(10):
+            handler.wfile.write(b'%x\r\n%s\r\n' % (1000, b'a' * 1000))
+        handler.wfile.write(b'0\r\n\r\n')
+
+    server.routes['/akis'] = chunked
+    assert reason_of(server.url('/akis'), max_bytes=2500) == REASON_TOO_LARGE
+    assert len(fetch_html(server.url('/akis'), max_bytes=None).body) == 10000
+
+
+def test_refused_connections(server):
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]  # nothing listens once closed
+
+    assert reason_of(f'http://127.0.0.1:{port}/') == REASON_CONNECTION
+
+
+def test_stalled_servers_time_out(server, release):
+    server.routes['/yavas'] = lambda handler: release.wait(5)
+
+    assert reason_of(server.url('/yavas'), timeout=0.2) == REASON_TIMEOUT
+
+
+def dripping(release):
+    """A route sending one byte of its body every 50 ms."""
+    def route(handler):
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/html')
+        handler.send_header('Content-Length', '1000')
+        handler.end_headers()
+        for _ in range(1000):
+            if release.wait(0.05):
+                return
+            handler.wfile.write(b'a')
+            handler.wfile.flush()
+    return route
+
+
+def test_deadline_bounds_a_slow_drip_download(server, release):
+    server.routes['/damla'] = dripping(release)
+    started = time.monotonic()
+
+    # Every read gets a byte well within the 1 s socket timeout
+    with pytest.raises(DeadlineExceeded) as raised:
+        fetch_html(server.url('/damla'), timeout=1, deadline=started + 0.5)
+    assert raised.value.stage == 'download'
+    assert time.monotonic() - started < 0.9
+
+
+def test_deadline_bounds_waiting_for_headers(server, release):
+    server.routes['/bekle'] = lambda handler: release.wait(5)
+    started = time.monotonic()
+
+    with pytest.raises(DeadlineExceeded) as raised:
+        fetch_html(server.url('/bekle'), timeout=10, deadline=started + 0.3)
+    assert raised.value.stage == 'connect'
+    assert time.monotonic() - started < 0.9
+
+
+def test_extractor_reports_the_deadline_stage(server, release):
+    server.routes['/damla'] = dripping(release)
+    extractor = ArticleExtractor(timeout=1, deadline=0.3)
+
+    outcomes = extractor.extract_many([server.url('/damla')])
+
+    assert outcomes == [(None, 'deadline_exceeded: deadline exceeded during download')]
@@ -0,0 +1,81 @@
+"""HtmlArchive storage, deduplication and the extractor hook."""
+
+from __future__ import annotations
+
+import pytest
+from conftest import make_article
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.html_archive import HtmlArchive
+from news_extractor.http_cache import HttpCache
+
+URL = 'https://site.example/haber/'
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = HtmlArchive(tmp_path / 'archive')
+    yield archive
+    archive.close()
+
+
+def pack_bytes(archive):
+    return sum(path.stat().st_size for path in archive.pack_dir.glob('*.pack'))
+
+
+def test_round_trip(archive):
+    body = make_article().encode('utf-8')
+    sha256 = archive.add(URL + '1', body, 'text/html', fetched_at=1000.0)
+    page = archive.latest(URL + '1')
+
+    assert (page.sha256, page.content_type, page.status_code, page.fetched_at) == (
+        sha256, 'text/html', 200, 1000.0
+    )
+    assert archive.read_body(sha256) == body
+    assert archive.latest(URL + 'missing') is None
+    with pytest.raises(KeyError):
+        archive.read_body('0' * 64)
+
+
+def test_identical_bodies_are_stored_once(archive):
+    body = make_article().encode('utf-8')
+    first = archive.add(URL + '1', body)
+    size = pack_bytes(archive)
+    second = archive.add(URL + '2', body)
+
+    assert first == second
+    assert pack_bytes(archive) == size
+    assert len(archive) == 2
+    assert archive._connect().execute('SELECT COUNT(*) FROM blobs').fetchone()[0] == 1
+
+
+def test_iter_pages_latest_only(archive):
+    archive.add(URL + '1', b'old', fetched_at=1.0)
+    archive.add(URL + '1', b'new', fetched_at=2.0)
+    archive.add(URL + '2', b'other', fetched_at=3.0)
+
+    latest = {page.url: archive.read_body(page.sha256) for page in archive.iter_pages()}
+    assert latest == {URL + '1': b'new', URL + '2': b'other'}
+    assert len(list(archive.iter_pages(latest_only=False))) == 3
+
+
+def test_rolls_over_to_new_packs(tmp_path):
+    archive = HtmlArchive(tmp_path / 'archive', pack_size=100)
+    bodies = [bytes([index]) * 5000 + bytes(range(256)) for index in range(3)]
+    digests = [archive.add(f'{URL}{index}', body) for index, body in enumerate(bodies)]
+
+    assert len(list(archive.pack_dir.glob('*.pack'))) == 3
+    assert [archive.read_body(digest) for digest in digests] == bodies
+    archive.close()
+
+
+def test_cache_hits_are_not_archived_again(tmp_path, archive, server):
+    server.serve('/haber', make_article().encode('utf-8'))
+    cache = HttpCache(tmp_path / 'http.sqlite', ttl=3600)
+    extractor = ArticleExtractor(cache=cache, archive=archive)
+
+    assert extractor.extract(server.url('/haber')) is not None
+    assert extractor.extract(server.url('/haber')) is not None
+    assert len(server.hits) == 1
+    assert len(list(archive.iter_pages(latest_only=False))) == 1
+    cache.close()
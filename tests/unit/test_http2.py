@@ -0,0 +1,62 @@
+"""Http2Fetcher results, errors and deadlines."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from conftest import make_article
+
+from news_extractor.fetch import REASON_HTTP_STATUS, DeadlineExceeded, FetchError
+from news_extractor.http2 import Http2Fetcher
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = Http2Fetcher()
+    yield fetcher
+    fetcher.close()
+
+
+def test_fetches_and_counts_protocols(fetcher, server):
+    body = make_article().encode('utf-8')
+    server.serve('/haber', body)
+
+    result = fetcher.fetch(server.url('/haber'))
+
+    assert result.body == body
+    assert fetcher.protocol_counts() == {'HTTP/1.1': 1}  # no TLS, no ALPN
+
+
+def test_http_errors_keep_the_response(fetcher, server):
+    server.serve('/yok', b'', status=404)
+
+    with pytest.raises(FetchError) as raised:
+        fetcher.fetch(server.url('/yok'))
+    assert raised.value.reason == REASON_HTTP_STATUS
+    assert raised.value.response.status_code == 404
+
+
+def test_stalled_body_stops_at_the_deadline(fetcher, server):
+    release = threading.Event()
+
+    def stalling(handler):
+        time.sleep(0.8)
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/html')
+        handler.send_header('Content-Length', '1000')
+        handler.end_headers()
+        handler.wfile.write(b'<html>')
+        handler.wfile.flush()
+        release.wait(5)
+
+    server.routes['/yavas'] = stalling
+    started = time.monotonic()
+    try:
+        with pytest.raises(DeadlineExceeded):
+            fetcher.fetch(server.url('/yavas'), timeout=10, deadline=started + 1.0)
+    finally:
+        release.set()
+    # The read timeout fixed when the request started would allow ~1.8 s
+    assert time.monotonic() - started < 1.4
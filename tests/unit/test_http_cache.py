@@ -0,0 +1,133 @@
+"""HttpCache freshness, revalidation, size accounting and eviction."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from news_extractor.fetch import fetch_html
+from news_extractor.http_cache import HttpCache
+
+URL = 'https://site.example/haber/'
+PAGE = '<html><body>Türkçe haber</body></html>'.encode('utf-8')
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HttpCache(tmp_path / 'http.sqlite', ttl=60)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_and_freshness(cache):
+    cache.put(URL, PAGE, content_type='text/html', etag='"v1"', last_modified='Wed, 01 May 2024 10:00:00 GMT')
+    entry = cache.get(URL)
+
+    assert entry.body == PAGE and entry.content_type == 'text/html'
+    assert entry.is_fresh(cache.ttl)
+    assert not entry.is_fresh(cache.ttl, now=entry.stored_at + 61)
+    assert entry.conditional_headers() == {
+        'If-None-Match': '"v1"', 'If-Modified-Since': 'Wed, 01 May 2024 10:00:00 GMT',
+    }
+    assert cache.get(URL + 'missing') is None
+
+
+def test_fresh_entries_skip_the_network(cache, server):
+    server.serve('/haber', PAGE, headers=(('Content-Type', 'text/html'), ('ETag', '"v1"')))
+    url = server.url('/haber')
+
+    assert fetch_html(url, cache=cache).cache_status is None
+    assert fetch_html(url, cache=cache).cache_status == 'hit'
+    assert len(server.hits) == 1
+
+
+def test_stale_entries_are_revalidated(tmp_path, server):
+    cache = HttpCache(tmp_path / 'http.sqlite', ttl=0)
+    conditional = []
+
+    def revalidating(handler):
+        conditional.append(handler.headers.get('If-None-Match'))
+        if handler.headers.get('If-None-Match') == '"v1"':
+            handler.send_response(304)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/html')
+        handler.send_header('ETag', '"v1"')
+        handler.send_header('Content-Length', str(len(PAGE)))
+        handler.end_headers()
+        handler.wfile.write(PAGE)
+
+    server.routes['/haber'] = revalidating
+    url = server.url('/haber')
+    fetch_html(url, cache=cache)
+    stored_at = cache.get(url).stored_at
+    revalidated = fetch_html(url, cache=cache)
+
+    assert conditional == [None, '"v1"']
+    assert revalidated.cache_status == 'revalidated' and revalidated.body == PAGE
+    assert cache.get(url).stored_at > stored_at
+    cache.close()
+
+
+def test_size_is_tracked_across_overwrites_and_deletes(cache):
+    for index in range(5):
+        cache.put(f'{URL}{index}', os.urandom(1000))
+    cache.put(f'{URL}0', os.urandom(3000))  # overwrite grows the entry
+
+    conn = cache._connect()
+    total = conn.execute('SELECT SUM(size) FROM responses').fetchone()[0]
+    assert cache.size() == total
+    with conn:
+        conn.execute('DELETE FROM responses WHERE url = ?', (f'{URL}1',))
+    assert cache.size() == conn.execute('SELECT SUM(size) FROM responses').fetchone()[0]
+
+
+def test_evicts_least_recently_used(tmp_path):
+    # Random bodies do not compress: each entry takes ~1000 bytes
+    cache = HttpCache(tmp_path / 'http.sqlite', max_bytes=3500)
+    for index in range(3):
+        cache.put(f'{URL}{index}', os.urandom(1000))
+        time.sleep(0.01)
+    cache.get(f'{URL}0')  # now the most recently used
+    time.sleep(0.01)
+    cache.put(f'{URL}3', os.urandom(1000))
+
+    assert cache.get(f'{URL}1') is None
+    assert all(cache.get(f'{URL}{index}') is not None for index in (0, 2, 3))
+    assert cache.size() <= 3500
+    cache.close()
+
+
+def test_evicts_past_one_query_batch(tmp_path):
+    cache = HttpCache(tmp_path / 'http.sqlite', max_bytes=10 ** 6)
+    for index in range(150):
+        cache.put(f'{URL}{index}', os.urandom(100))
+    cache.max_bytes = 1000
+    cache.put(URL + 'last', os.urandom(100))
+
+    assert cache.size() <= 1000
+    assert cache.get(URL + 'last') is not None
+    cache.close()
+
+
+def test_existing_database_gets_a_size_total(tmp_path):
+    path = tmp_path / 'http.sqlite'
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            'CREATE TABLE responses (url TEXT PRIMARY KEY, status_code INTEGER NOT NULL,'
+            ' content_type TEXT, etag TEXT, last_modified TEXT, body BLOB NOT NULL,'
+            ' size INTEGER NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+        )
+        conn.execute(
+            "INSERT INTO responses VALUES ('u', 200, NULL, NULL, NULL, x'00', 1234, 0, 0)"
+        )
+    conn.close()
+
+    cache = HttpCache(path)
+    assert cache.size() == 1234
+    cache.close()
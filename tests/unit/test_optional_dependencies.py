@@ -0,0 +1,42 @@
+"""The package must import without its optional backends."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[2] / 'src'
+
+SCRIPT = """
+import sys
+for name in ('aiohttp', 'httpx', 'h2', 'pycurl'):
+    sys.modules[name] = None  # makes ``import name`` raise ImportError
+
+import news_extractor
+from news_extractor import cli
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.curl_multi import CurlMultiFetcher
+from news_extractor.http2 import Http2Fetcher
+
+for backend in (news_extractor.AsyncArticleExtractor, CurlMultiFetcher, Http2Fetcher):
+    try:
+        backend()
+    except ImportError as exc:
+        assert 'news-extractor[' in str(exc), exc
+    else:
+        raise AssertionError(f'{backend.__name__} built without its dependency')
+
+# http2=True falls back to requests
+assert type(ArticleExtractor(http2=True).fetcher).__name__ == 'RequestsFetcher'
+"""
+
+
+def test_imports_without_optional_backends():
+    completed = subprocess.run(
+        [sys.executable, '-c', SCRIPT],
+        env={'PYTHONPATH': str(SRC)},
+        capture_output=True,
+        text=True,
+    )
+    assert completed.returncode == 0, completed.stderr
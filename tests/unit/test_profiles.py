@@ -0,0 +1,66 @@
+"""get_profile() and the result shape under every profile."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+from conftest import make_article
+
+from news_extractor.article_extractor import NEWSPAPER4K_TIER, TRAFILATURA_TIER, ArticleExtractor
+from news_extractor.profiles import FULL, METADATA_ONLY, TEXT_ONLY, get_profile
+
+URL = 'https://site.example/haber/1'
+
+
+def test_get_profile_resolves_names_and_passes_profiles_through():
+    custom = replace(FULL, name='custom', image_scoring=False)
+
+    assert [get_profile(name) for name in ('full', 'text_only', 'metadata_only')] == [
+        FULL, TEXT_ONLY, METADATA_ONLY,
+    ]
+    assert get_profile(custom) is custom
+
+
+def test_unknown_profile_names_are_rejected():
+    with pytest.raises(ValueError, match="'summary'; expected one of full, text_only, metadata_only"):
+        get_profile('summary')
+    with pytest.raises(ValueError):
+        ArticleExtractor(profile='summary')
+
+
+@pytest.fixture(scope='module')
+def results():
+    html = make_article()
+    return {
+        (tier.name, profile): ArticleExtractor(profile=profile, tiers=[tier]).extract_from_html(URL, html)
+        for tier in (NEWSPAPER4K_TIER, TRAFILATURA_TIER)
+        for profile in ('full', 'text_only', 'metadata_only')
+    }
+
+
+@pytest.mark.parametrize('tier', ['newspaper4k', 'trafilatura'])
+def test_profiles_keep_the_result_keys(results, tier):
+    keys = {profile: list(results[tier, profile]) for profile in ('full', 'text_only', 'metadata_only')}
+
+    assert keys['text_only'] == keys['full'] == keys['metadata_only']
+
+
+@pytest.mark.parametrize('tier', ['newspaper4k', 'trafilatura'])
+def test_text_only_skips_metadata(results, tier):
+    full, text_only = results[tier, 'full'], results[tier, 'text_only']
+
+    assert text_only['text'] == full['text'] and text_only['title'] == full['title']
+    assert full['authors'] and full['date'] and full['image']
+    assert (text_only['authors'], text_only['date'], text_only['description'], text_only['image']) == (
+        [], None, None, None
+    )
+
+
+@pytest.mark.parametrize('tier', ['newspaper4k', 'trafilatura'])
+def test_metadata_only_skips_the_body(results, tier):
+    full, metadata = results[tier, 'full'], results[tier, 'metadata_only']
+
+    assert (metadata['text'], metadata['text_length']) == ('', 0)
+    assert metadata['title'] == full['title'] == 'Büyük haber başlığı'
+    assert metadata['authors'] == full['authors'] and metadata['date'] == full['date']
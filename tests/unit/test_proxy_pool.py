@@ -0,0 +1,71 @@
+"""ProxyPool health scoring and proxied extraction."""
+
+from __future__ import annotations
+
+import socket
+
+import pytest
+from conftest import LocalServer, make_article
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.proxy_pool import ProxyPool
+
+ARTICLE = 'http://haber.example.test/gundem/haber-1'
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_domains_stick_to_their_proxy():
+    pool = ProxyPool(['http://a:1', 'http://b:1'])
+    first = pool.proxy_for('https://site.example/1')
+
+    assert pool.proxy_for('https://site.example/2') == first
+    assert pool.proxy_for('https://other.example/1') != first
+
+
+def test_failing_proxy_sits_out_its_cooldown():
+    clock = FakeClock()
+    pool = ProxyPool(['http://a:1', 'http://b:1'], max_failures=2, cooldown=10, clock=clock)
+    url = 'https://site.example/1'
+    bad = pool.proxy_for(url)
+    for _ in range(2):
+        pool.record_failure(bad, url)
+
+    assert pool.proxy_for(url) != bad
+    assert pool.stats()[bad]['disabled_for'] == 10
+    clock.now += 11
+    assert pool.stats()[bad]['disabled_for'] == 0
+
+
+@pytest.fixture
+def images():
+    local = LocalServer()
+    yield local
+    local.close()
+
+
+def test_every_request_goes_through_the_proxy(server, images, monkeypatch):
+    # ``server`` plays the proxy (it sees absolute request URIs); a
+    # download that skipped it would reach ``images`` directly
+    server.serve(ARTICLE, make_article(images.base).encode('utf-8'))
+    connections = []
+    connect = socket.socket.connect
+
+    def record(self, address):
+        connections.append(address)
+        return connect(self, address)
+
+    monkeypatch.setattr(socket.socket, 'connect', record)
+    extractor = ArticleExtractor(proxy_pool=ProxyPool([server.base]))
+    result = extractor.extract(ARTICLE)
+
+    assert result is not None and result['title'] == 'Büyük haber başlığı'
+    assert server.hits == [ARTICLE]
+    assert images.hits == []
+    assert {port for _, port in connections} == {int(server.base.rsplit(':', 1)[1])}
@@ -0,0 +1,56 @@
+"""Offline re-extraction over an HtmlArchive."""
+
+from __future__ import annotations
+
+import io
+import json
+import socket
+
+import pytest
+from conftest import make_article
+
+from news_extractor import reprocess
+from news_extractor.html_archive import HtmlArchive
+from news_extractor.reprocess import reprocess_archive
+
+URL = 'https://www.example.com.tr/gundem/haber-1'
+
+
+@pytest.fixture
+def archive(tmp_path, server):
+    archive = HtmlArchive(tmp_path / 'archive')
+    # Images point at the local server, so any download shows up in its hits
+    archive.add(URL, make_article(server.base).encode('utf-8'), 'text/html; charset=utf-8')
+    yield archive
+    archive.close()
+
+
+def test_worker_opens_no_sockets(archive, monkeypatch):
+    connections = []
+
+    def refuse(self, address):
+        # Recorded rather than only raised: the libraries swallow errors
+        connections.append(address)
+        raise OSError('network access during reprocessing')
+
+    monkeypatch.setattr(socket.socket, 'connect', refuse)
+    reprocess._init_worker(str(archive.root), {})
+    lines, successes = reprocess._reprocess_chunk(list(archive.iter_pages()))
+
+    entry = json.loads(lines[0])
+    assert connections == []
+    assert successes == 1
+    assert entry['error'] is None
+    assert entry['extraction']['title'] == 'Büyük haber başlığı'
+
+
+@pytest.mark.parametrize('profile', ['full', 'text_only', 'metadata_only'])
+def test_reprocess_archive_makes_no_requests(archive, server, profile):
+    output = io.StringIO()
+    summary = reprocess_archive(
+        archive, output, workers=1, extractor_options={'profile': profile}
+    )
+
+    assert summary['total'] == summary['successes'] == 1
+    assert server.hits == []
+    assert json.loads(output.getvalue())['url'] == URL
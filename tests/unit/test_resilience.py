@@ -0,0 +1,177 @@
+"""RetryPolicy, CircuitBreaker and how retries are scheduled."""
+
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+import pytest
+import requests
+from conftest import make_article
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.fetch import (
+    REASON_CIRCUIT_OPEN,
+    REASON_CONNECTION,
+    REASON_CONTENT_TYPE,
+    REASON_HTTP_STATUS,
+    REASON_INVALID_URL,
+    REASON_TIMEOUT,
+    FetchError,
+)
+from news_extractor.resilience import CircuitBreaker, RetryPolicy
+from news_extractor.scheduler import DomainScheduler
+
+URL = 'https://site.example/haber/1'
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def http_error(status: int, retry_after: Optional[str] = None) -> FetchError:
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return FetchError(REASON_HTTP_STATUS, f'HTTP {status}', response=response)
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(attempts=3, backoff=1.0, max_backoff=8.0, rng=random.Random(1))
+
+
+@pytest.mark.parametrize('exc', [
+    FetchError(REASON_CONNECTION, 'reset'),
+    http_error(503),
+])
+def test_retries_transient_failures_with_jitter(policy, exc):
+    assert 0 <= policy.delay(exc, 1) <= 1.0
+    assert 0 <= policy.delay(exc, 2) <= 2.0
+    assert policy.delay(exc, 3) is None  # out of attempts
+
+
+@pytest.mark.parametrize('exc', [
+    http_error(404),
+    FetchError(REASON_TIMEOUT, 'slow'),
+    FetchError(REASON_CONTENT_TYPE, 'image/png'),
+    FetchError(REASON_INVALID_URL, 'no scheme'),
+])
+def test_does_not_retry_other_failures(policy, exc):
+    assert policy.delay(exc, 1) is None
+
+
+def test_honours_retry_after(policy):
+    assert policy.delay(http_error(503, retry_after='5'), 1) == 5
+    assert policy.delay(http_error(503, retry_after='60'), 1) is None  # beyond max_backoff
+
+
+def test_circuit_opens_after_threshold_and_probes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+    failure = FetchError(REASON_CONNECTION, 'reset')
+
+    breaker.record_failure(URL, failure)
+    breaker.check(URL)
+    breaker.record_failure(URL, failure)
+    with pytest.raises(FetchError) as raised:
+        breaker.check(URL)
+    assert raised.value.reason == REASON_CIRCUIT_OPEN
+    assert breaker.open_domains() == {'site.example': 2}
+    breaker.check('https://other.example/1')  # other domains unaffected
+
+    clock.now += 30
+    breaker.check(URL)  # the probe
+    with pytest.raises(FetchError):
+        breaker.check(URL)  # everyone else waits for its outcome
+
+    breaker.record_failure(URL, failure)  # failed probe reopens
+    with pytest.raises(FetchError):
+        breaker.check(URL)
+    clock.now += 30
+    breaker.check(URL)
+    breaker.record_success(URL)
+    assert breaker.open_domains() == {}
+    breaker.check(URL)
+
+
+def test_client_errors_count_as_success():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(URL, http_error(404))
+
+    breaker.check(URL)
+    assert breaker.open_domains() == {}
+
+
+def test_invalid_urls_are_neither_retried_nor_counted(server):
+    def loop(handler):
+        handler.send_response(302)
+        handler.send_header('Location', '/loop')
+        handler.send_header('Content-Length', '0')
+        handler.end_headers()
+
+    server.routes['/loop'] = loop
+    extractor = ArticleExtractor(circuit_breaker=CircuitBreaker(failure_threshold=1))
+
+    outcomes = extractor.extract_many(['example.com/haber', 'http://', server.url('/loop')])
+
+    for result, error in outcomes:
+        assert result is None
+        assert error.startswith(f'{REASON_INVALID_URL}: ')
+    assert len(server.hits) == 31  # requests' redirect limit, followed once
+    assert extractor.fetch_stats.as_dict()['retries'] == 0
+    assert extractor.circuit_breaker.open_domains() == {}
+
+
+class RecordingScheduler(DomainScheduler):
+    def __init__(self) -> None:
+        super().__init__(requests_per_second=1000, burst=10)
+        self.retry_tokens = 0
+
+    def wait_for_token(self, url: str, timeout: Optional[float] = None) -> bool:
+        self.retry_tokens += 1
+        return super().wait_for_token(url, timeout)
+
+
+def test_retry_takes_a_scheduler_token(server):
+    responses = [503, 200]
+
+    def flaky(handler):
+        status = responses.pop(0)
+        body = make_article().encode('utf-8') if status == 200 else b''
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'text/html; charset=utf-8')
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    server.routes['/haber'] = flaky
+    scheduler = RecordingScheduler()
+    extractor = ArticleExtractor(
+        scheduler=scheduler, retry=RetryPolicy(attempts=2, backoff=0.01)
+    )
+
+    results = extractor.extract_batch([server.url('/haber')])
+
+    assert results[server.url('/haber')] is not None
+    assert len(server.hits) == 2
+    assert scheduler.retry_tokens == 1
+    assert extractor.fetch_stats.as_dict()['retries'] == 1
+
+
+def test_retry_gives_up_when_no_token_fits_the_deadline(server):
+    server.serve('/haber', b'', status=503)
+    scheduler = DomainScheduler(requests_per_second=0.01, burst=1)
+    extractor = ArticleExtractor(
+        scheduler=scheduler, retry=RetryPolicy(attempts=3, backoff=0.01), deadline=2
+    )
+
+    results = extractor.extract_batch([server.url('/haber')])
+
+    assert results[server.url('/haber')] is None
+    assert len(server.hits) == 1  # the next token is 100 s away
@@ -0,0 +1,177 @@
+"""Per-domain scheduling: interleaving, tokens, in-flight limits and AIMD."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import threading
+import time
+from pathlib import Path
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.backlog import reextract
+from news_extractor.scheduler import AdaptiveDomainScheduler, DomainScheduler
+
+URL = 'https://site.example/haber/1'
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_wait_for_token_paces_retries():
+    scheduler = DomainScheduler(requests_per_second=20, burst=1)
+    started = time.monotonic()
+
+    assert scheduler.wait_for_token(URL)
+    assert scheduler.wait_for_token(URL)
+    assert 0.03 <= time.monotonic() - started < 1
+
+
+def test_wait_for_token_respects_timeout_and_deferral():
+    scheduler = DomainScheduler(requests_per_second=100, burst=1)
+    scheduler.defer(URL, 60)
+    started = time.monotonic()
+
+    assert not scheduler.wait_for_token(URL, timeout=0.5)
+    assert time.monotonic() - started < 0.5  # gives up at once
+    assert scheduler.wait_for_token('https://other.example/1', timeout=0.5)
+
+
+def test_default_scheduler_does_not_pace():
+    scheduler = DomainScheduler()
+    batch = scheduler.batch([URL] * 20)
+    started = time.monotonic()
+
+    assert [batch.next() for _ in range(20)] == list(range(20))
+    assert batch.next() is None
+    assert time.monotonic() - started < 0.1
+
+
+def test_interleaves_domains():
+    urls = ['https://a.example/1', 'https://a.example/2', 'https://www.b.example/1']
+    batch = DomainScheduler().batch(urls)
+
+    assert [batch.next() for _ in urls] == [0, 2, 1]
+
+
+def test_token_bucket_paces_a_domain():
+    scheduler = DomainScheduler(requests_per_second=20, burst=2)
+    batch = scheduler.batch([URL] * 3)
+    started = time.monotonic()
+
+    batch.next()
+    batch.next()
+    assert time.monotonic() - started < 0.03  # the burst
+    batch.next()
+    assert time.monotonic() - started >= 0.04
+
+
+def test_refund_returns_the_token():
+    scheduler = DomainScheduler(requests_per_second=0.01, burst=1)
+    batch = scheduler.batch([URL] * 2)
+
+    batch.done(batch.next(), refund=True)
+    started = time.monotonic()
+    assert batch.next() == 1
+    assert time.monotonic() - started < 0.1
+
+
+def test_in_flight_limit_holds_the_next_url():
+    scheduler = DomainScheduler(max_in_flight_per_host=1)
+    batch = scheduler.batch([URL] * 2)
+    first = batch.next()
+    handed_out = []
+    worker = threading.Thread(target=lambda: handed_out.append(batch.next()), daemon=True)
+    worker.start()
+
+    time.sleep(0.1)
+    assert handed_out == []
+    batch.done(first)
+    worker.join(1)
+    assert handed_out == [1]
+
+
+def test_aimd_halves_on_congestion_once_per_cooldown():
+    clock = FakeClock()
+    scheduler = AdaptiveDomainScheduler(initial_limit=8, min_limit=1, cooldown=2, clock=clock)
+
+    scheduler.record_response(URL, 0.1, status_code=503)
+    assert scheduler.limits() == {'site.example': 4}
+    scheduler.record_response(URL, 5.0, timed_out=True)
+    assert scheduler.limits() == {'site.example': 4}  # same congestion episode
+    for _ in range(3):
+        clock.now += 2
+        scheduler.record_response(URL, 0.1, status_code=429)
+    assert scheduler.limits() == {'site.example': 1}  # min_limit
+    assert scheduler.max_in_flight('site.example') == 1
+
+
+def test_aimd_grows_while_latency_stays_flat():
+    scheduler = AdaptiveDomainScheduler(initial_limit=2, max_limit=3, clock=FakeClock())
+
+    for _ in range(9):
+        scheduler.record_response(URL, 0.1, status_code=200)
+    assert scheduler.limits() == {'site.example': 2}  # not enough samples yet
+    scheduler.record_response(URL, 0.1, status_code=200)
+    assert scheduler.limits() == {'site.example': 2.5}
+    for _ in range(10):
+        scheduler.record_response(URL, 0.1, status_code=200)
+    assert scheduler.limits() == {'site.example': 3}  # max_limit
+    assert scheduler.max_in_flight('site.example') == 3
+
+
+def test_aimd_stops_growing_when_latency_rises():
+    scheduler = AdaptiveDomainScheduler(initial_limit=2, clock=FakeClock())
+    for _ in range(10):
+        scheduler.record_response(URL, 0.1, status_code=200)
+    for _ in range(5):
+        scheduler.record_response(URL, 1.0, status_code=200)
+    limit = scheduler.limits()['site.example']
+
+    for _ in range(10):
+        scheduler.record_response(URL, 1.0, status_code=200)
+    assert scheduler.limits()['site.example'] == limit
+
+
+def test_aimd_limits_survive_a_restart(tmp_path):
+    path = tmp_path / 'domain_limits.json'
+    scheduler = AdaptiveDomainScheduler(initial_limit=8, state_path=path, clock=FakeClock())
+    scheduler.record_response(URL, 0.1, status_code=503)
+    scheduler.save()
+
+    restarted = AdaptiveDomainScheduler(state_path=path)
+    assert restarted.limits() == {'site.example': 4}
+    assert restarted.max_in_flight('other.example') == 2  # initial_limit
+
+    path.write_text(json.dumps({'site.example': {'limit': 100}}), encoding='utf-8')
+    assert AdaptiveDomainScheduler(max_limit=16, state_path=path).limits() == {'site.example': 16}
+    path.write_text('{', encoding='utf-8')
+    assert AdaptiveDomainScheduler(state_path=path).limits() == {}
+
+
+
+def test_backlog_paths_pace_by_default(monkeypatch):
+    schedulers = []
+    monkeypatch.setattr(
+        ArticleExtractor, 'extract_many', lambda self, urls, **options: schedulers.append(self.scheduler) or []
+    )
+    reextract([])
+
+    assert (schedulers[0].requests_per_second, schedulers[0].max_in_flight_per_host) == (2.0, 4)
+
+
+def test_backlog_runner_exposes_the_limits():
+    script = Path(__file__).resolve().parents[2] / 'examples' / 'scrape_news_gatherer_backlog.py'
+    spec = importlib.util.spec_from_file_location('backlog_runner', script)
+    runner = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(runner)
+
+    args = runner.parse_args([])
+    assert (args.requests_per_second, args.max_in_flight_per_host) == (2.0, 4)
+    args = runner.parse_args(['--requests-per-second', '0', '--max-in-flight-per-host', '0'])
+    assert (args.requests_per_second, args.max_in_flight_per_host) == (0, 0)
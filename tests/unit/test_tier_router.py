@@ -0,0 +1,84 @@
+"""TierRouter ordering, exploration and persistence."""
+
+from __future__ import annotations
+
+import random
+
+from news_extractor.tier_router import TierRouter
+
+URL = 'https://www.t24.com.tr/haber/1'
+TIERS = ('newspaper4k', 'trafilatura')
+
+
+def router(**options) -> TierRouter:
+    options.setdefault('explore', 0)
+    return TierRouter(min_samples=5, decay=1.0, **options)
+
+
+def record(router: TierRouter, tier: str, successes: int, failures: int, seconds: float) -> None:
+    attempts = [(tier, True, seconds)] * successes + [(tier, False, seconds)] * failures
+    router.record(URL, attempts)
+
+
+def test_unknown_domains_keep_the_default_order():
+    assert router().order(URL, TIERS) == list(TIERS)
+
+
+def test_reliable_tier_goes_first():
+    tiers = router()
+    record(tiers, 'newspaper4k', 0, 10, 0.1)
+    record(tiers, 'trafilatura', 10, 0, 0.1)
+
+    assert tiers.order(URL, TIERS) == ['trafilatura', 'newspaper4k']
+    assert tiers.order('https://other.example/1', TIERS) == list(TIERS)
+
+
+def test_orders_by_latency_over_success_rate():
+    tiers = router()
+    # Fails half the time but costs 0.05 / 0.5 = 0.1 s per success
+    record(tiers, 'newspaper4k', 10, 10, 0.05)
+    # Always succeeds but costs 0.5 / ~0.92 = 0.54 s per success
+    record(tiers, 'trafilatura', 10, 0, 0.5)
+    assert tiers.order(URL, TIERS) == ['newspaper4k', 'trafilatura']
+
+    slow = router()
+    record(slow, 'newspaper4k', 10, 10, 1.0)
+    record(slow, 'trafilatura', 10, 0, 0.5)
+    assert slow.order(URL, TIERS) == ['trafilatura', 'newspaper4k']
+
+
+def test_tiers_need_min_samples_to_be_ranked():
+    tiers = router()
+    record(tiers, 'newspaper4k', 0, 4, 0.1)
+    record(tiers, 'trafilatura', 4, 0, 0.1)
+    assert tiers.order(URL, TIERS) == list(TIERS)
+
+    record(tiers, 'newspaper4k', 0, 1, 0.1)
+    assert tiers.order(URL, TIERS) == ['trafilatura', 'newspaper4k']
+
+
+def test_explores_the_default_order():
+    tiers = router(explore=0.5, rng=random.Random(3))
+    record(tiers, 'newspaper4k', 0, 10, 0.1)
+    record(tiers, 'trafilatura', 10, 0, 0.1)
+
+    orders = [tiers.order(URL, TIERS)[0] for _ in range(200)]
+    assert 60 < orders.count('newspaper4k') < 140
+
+
+def test_statistics_survive_a_restart(tmp_path):
+    path = tmp_path / 'tier_stats.json'
+    tiers = router(state_path=path)
+    record(tiers, 'newspaper4k', 0, 10, 0.1)
+    record(tiers, 'trafilatura', 10, 0, 0.3)
+    tiers.save()
+
+    restarted = router(state_path=path)
+    assert restarted.stats() == tiers.stats()
+    assert restarted.stats()['t24.com.tr']['trafilatura'] == {
+        'success_rate': 0.917, 'attempts': 10, 'latency': 0.3,
+    }
+    assert restarted.order(URL, TIERS) == ['trafilatura', 'newspaper4k']
+
+    path.write_text('{', encoding='utf-8')
+    assert router(state_path=path).stats() == {}
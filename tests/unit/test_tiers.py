@@ -0,0 +1,156 @@
+"""Tier acceptance rules, run_with_budget, the tier chain and the race."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from conftest import make_article
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.fetch import DeadlineExceeded
+from news_extractor.tier_router import TierRouter
+from news_extractor.tiers import Tier, run_with_budget
+
+URL = 'https://www.example.com.tr/gundem/haber-1'
+TEXT = 'Türkçe haber metni. ' * 10
+release = threading.Event()
+
+
+def fast(extractor, url, html):
+    return {'title': 'Başlık', 'text': TEXT}
+
+
+def untitled(extractor, url, html):
+    return {'title': None, 'text': TEXT}
+
+
+def slow(extractor, url, html):
+    release.wait(5)
+    return {'title': 'Yavaş', 'text': TEXT}
+
+
+@pytest.fixture(autouse=True)
+def release_slow_tiers():
+    release.clear()
+    yield
+    release.set()
+
+
+@pytest.mark.parametrize('tier, result, reason', [
+    (Tier('t', fast), {'text': 'kısa'}, 'text too short (len=4)'),
+    (Tier('t', fast, min_length=3), {'text': 'kısa'}, None),
+    (Tier('t', fast, require_title=True), {'text': TEXT}, 'no title'),
+    (Tier('t', fast, accept=lambda result: 'haber' in result['text']), {'text': TEXT}, None),
+    (Tier('t', fast, accept=lambda result: False), {'text': TEXT}, 'rejected by accept()'),
+])
+def test_rejection(tier, result, reason):
+    assert tier.rejection(result, min_length=100) == reason
+
+
+def test_rejection_without_text_requires_a_title():
+    tier = Tier('t', fast)
+
+    assert tier.rejection({'text': ''}, 100, require_text=False) == 'no title'
+    assert tier.rejection({'text': '', 'title': 'Başlık'}, 100, require_text=False) is None
+
+
+def test_run_with_budget_returns_in_time():
+    assert run_with_budget(lambda: {'text': 'x'}, 1.0, 't') == (True, {'text': 'x'})
+
+
+def test_run_with_budget_gives_up_on_overrun():
+    started = time.monotonic()
+
+    assert run_with_budget(lambda: release.wait(5), 0.05, 't') == (False, None)
+    assert time.monotonic() - started < 1
+
+
+def test_run_with_budget_reraises():
+    with pytest.raises(ZeroDivisionError):
+        run_with_budget(lambda: 1 / 0, 1.0, 't')
+
+
+def test_chain_falls_back_to_the_next_accepted_tier():
+    extractor = ArticleExtractor(tiers=[Tier('first', untitled, require_title=True), Tier('second', fast)])
+
+    assert extractor.extract_from_html(URL, '<html></html>')['method'] == 'second'
+
+
+def test_budgeted_tier_is_abandoned():
+    extractor = ArticleExtractor(tiers=[Tier('slow', slow, budget=0.05), Tier('fast', fast)])
+    started = time.monotonic()
+
+    assert extractor.extract_from_html(URL, '<html></html>')['method'] == 'fast'
+    assert time.monotonic() - started < 1
+
+
+def test_deadline_abandons_a_tier_without_budget():
+    extractor = ArticleExtractor(tiers=[Tier('slow', slow), Tier('fast', fast)])
+    started = time.monotonic()
+
+    with pytest.raises(DeadlineExceeded) as raised:
+        extractor.extract_from_html(URL, '<html></html>', deadline=started + 0.1)
+    assert raised.value.stage == 'slow'
+    assert time.monotonic() - started < 1
+
+
+def test_race_returns_the_first_accepted_tier():
+    extractor = ArticleExtractor(tiers=[Tier('slow', slow), Tier('fast', fast)], race=True, max_workers=1)
+    started = time.monotonic()
+
+    # The first race's loser still holds a thread during the second race
+    for _ in range(2):
+        assert extractor.extract_from_html(URL, '<html></html>')['method'] == 'fast'
+    assert time.monotonic() - started < 1
+    extractor.close()
+
+
+def test_close_shuts_the_race_pool_down():
+    with ArticleExtractor(tiers=[Tier('slow', slow), Tier('fast', fast)], race=True) as extractor:
+        extractor.extract_from_html(URL, '<html></html>')
+        pool = extractor._race_pool
+
+    assert extractor._race_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(fast, extractor, URL, None)
+
+
+def test_close_leaves_a_given_fetcher_open():
+    class Fetcher:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    fetcher = Fetcher()
+    ArticleExtractor(fetcher=fetcher).close()
+    assert not fetcher.closed
+
+
+def test_parse_workers_match_the_serial_path(server):
+    paths = [f'/haber/{i}' for i in range(3)]
+    for path in paths:
+        server.serve(path, make_article().encode('utf-8'))
+    urls = [server.url(path) for path in paths] + [server.url('/yok')]
+    tiers = [Tier('first', untitled, require_title=True), Tier('second', fast)]
+
+    runs = []
+    for parse_workers in (0, 2):
+        router = TierRouter(explore=0, decay=1.0)
+        with ArticleExtractor(tiers=tiers, parse_workers=parse_workers, router=router) as extractor:
+            outcomes = extractor.extract_many(urls)
+            results = {url: result for url, (result, _) in zip(urls, outcomes)}
+            attempts = {
+                tier: entry['attempts'] for tier, entry in router.stats()['127.0.0.1'].items()
+            }
+            runs.append((outcomes, extractor.get_stats(results), attempts))
+
+    assert runs[1] == runs[0]
+    outcomes, stats, attempts = runs[0]
+    assert attempts == {'first': 3, 'second': 3}
+    assert [result['method'] for result, _ in outcomes[:3]] == ['second'] * 3
+    assert outcomes[3][1].startswith('http_status: ')
+    assert stats['fetch']['requests_saved'] == 3
+    assert stats['fetch']['bytes_saved'] == 3 * len(make_article().encode('utf-8'))
@@ -0,0 +1,55 @@
+"""The Trafilatura tier's in-memory Document against the old JSON output."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import trafilatura
+from conftest import make_article
+
+from news_extractor.article_extractor import TRAFILATURA_TIER, ArticleExtractor
+from news_extractor.document import as_document
+
+URL = 'https://www.example.com.tr/gundem/haber-1'
+
+TABLE_PAGE = (
+    '<html><head><meta charset="utf-8"><title>Seçim sonuçları açıklandı</title>'
+    '<meta property="og:image" content="https://www.example.com.tr/secim.jpg">'
+    '<meta name="author" content="Mehmet Demir">'
+    '<meta name="description" content="İl il sonuçlar">'
+    '<meta property="article:section" content="Gündem">'
+    '<meta property="article:published_time" content="2024-03-31T22:00:00+03:00">'
+    '</head><body><nav><a href="/">Anasayfa</a><a href="/spor">Spor</a></nav>'
+    '<article><h1>Seçim sonuçları açıklandı</h1>'
+    + ''.join(f'<p>Yerel seçimlerde {i}. ilçenin sonuçları kesinleşti.</p>' for i in range(15))
+    + '<table><tr><th>Parti</th><th>Oy</th></tr><tr><td>A</td><td>41</td></tr></table>'
+    '</article><footer>Tüm hakları saklıdır</footer></body></html>'
+)
+
+
+def json_output(html: str):
+    """The tier's previous implementation: trafilatura's JSON output, parsed back."""
+    data = json.loads(trafilatura.extract(
+        as_document(html).tree(),
+        output_format='json',
+        include_comments=False,
+        include_tables=True,
+        with_metadata=True,
+    ))
+    return {
+        'title': data.get('title'),
+        'authors': [data['author']] if data.get('author') else [],
+        'date': data.get('date'),
+        'text': data.get('text', ''),
+        'image': data.get('image'),
+        'description': data.get('excerpt'),
+        'categories': data.get('categories') or '',
+    }
+
+
+@pytest.mark.parametrize('html', [make_article(), TABLE_PAGE], ids=['article', 'table'])
+def test_matches_the_json_output(html):
+    result = TRAFILATURA_TIER.extract(ArticleExtractor(), URL, as_document(html))
+
+    assert {field: result[field] for field in json_output(html)} == json_output(html)
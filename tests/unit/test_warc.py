@@ -0,0 +1,140 @@
+"""WARC export, import and offline replay."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import socket
+
+import pytest
+from conftest import make_article
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.reprocess import reprocess_warc
+from news_extractor.warc import WarcWriter, iter_warc_responses
+
+URL = 'https://www.example.com.tr/gundem/haber-1'
+
+
+def raw_record(url: str, http_block: bytes) -> bytes:
+    """A WARC response record around an HTTP block as a crawler stored it."""
+    return (
+        b'WARC/1.0\r\nWARC-Type: response\r\n'
+        b'WARC-Target-URI: <' + url.encode() + b'>\r\n'
+        b'WARC-Date: 2024-05-01T10:00:00Z\r\n'
+        b'Content-Type: application/http; msgtype=response\r\n'
+        b'Content-Length: %d\r\n\r\n' % len(http_block) + http_block + b'\r\n\r\n'
+    )
+
+
+def test_writer_round_trip(tmp_path):
+    path = tmp_path / 'crawl.warc.gz'
+    body = 'Türkçe içerik'.encode('utf-8')
+    with WarcWriter(path) as warc:
+        warc.write_response(URL, body, content_type='text/html; charset=utf-8', fetched_at=1714557600)
+        warc.write_response(URL + '?p=2', b'gone', status_code=404)
+
+    first, second = iter_warc_responses(path)
+    assert (first.url, first.status_code, first.body) == (URL, 200, body)
+    assert first.content_type == 'text/html; charset=utf-8'
+    assert first.date == '2024-05-01T10:00:00Z'
+    assert (second.status_code, second.content_type, second.body) == (404, None, b'gone')
+
+
+def test_writer_appends_to_existing_file(tmp_path):
+    path = tmp_path / 'crawl.warc.gz'
+    for index in range(2):
+        with WarcWriter(path) as warc:
+            warc.write_response(f'{URL}?p={index}', b'x')
+
+    assert [record.url for record in iter_warc_responses(path)] == [URL + '?p=0', URL + '?p=1']
+
+
+@pytest.mark.parametrize('compress', [False, True], ids=['plain', 'gzip-file'])
+def test_reads_chunked_and_gzip_encoded_bodies(tmp_path, compress):
+    body = b'<html><body>' + b'a' * 5000 + b'</body></html>'
+    chunked = b'%x\r\n%s\r\n%x\r\n%s\r\n0\r\n\r\n' % (100, body[:100], len(body) - 100, body[100:])
+    encoded = gzip.compress(body)
+    data = raw_record(URL, (
+        b'HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n'
+        b'Transfer-Encoding: chunked\r\n\r\n' + chunked
+    )) + raw_record(URL + '?gz', (
+        b'HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\n'
+        b'Content-Length: %d\r\n\r\n' % len(encoded) + encoded
+    ))
+    path = tmp_path / ('crawl.warc.gz' if compress else 'crawl.warc')
+    path.write_bytes(gzip.compress(data) if compress else data)
+
+    records = list(iter_warc_responses(path))
+    assert [record.url for record in records] == [URL, URL + '?gz']
+    assert [record.body for record in records] == [body, body]
+
+
+def test_skips_non_response_records(tmp_path):
+    request = (
+        b'WARC/1.0\r\nWARC-Type: request\r\nWARC-Target-URI: <' + URL.encode() + b'>\r\n'
+        b'Content-Length: 18\r\n\r\nGET / HTTP/1.1\r\n\r\n\r\n\r\n'
+    )
+    path = tmp_path / 'crawl.warc'
+    path.write_bytes(request + raw_record(URL, b'HTTP/1.1 200 OK\r\n\r\nok'))
+
+    assert [record.body for record in iter_warc_responses(path)] == [b'ok']
+
+
+@pytest.fixture
+def crawl(tmp_path, server):
+    path = tmp_path / 'crawl.warc.gz'
+    with WarcWriter(path) as warc:
+        # Images point at the local server, so any download shows up in its hits
+        warc.write_response(URL, make_article(server.base).encode('utf-8'), content_type='text/html')
+        warc.write_response(URL + '?p=2', b'error', status_code=500)
+    return path
+
+
+def test_extract_warc_replays_offline(crawl, monkeypatch):
+    connections = []
+
+    def refuse(self, address):
+        connections.append(address)
+        raise OSError('network access during WARC replay')
+
+    monkeypatch.setattr(socket.socket, 'connect', refuse)
+    results = list(ArticleExtractor().extract_warc(crawl))
+
+    assert connections == []
+    assert [url for url, _ in results] == [URL]
+    assert results[0][1]['title'] == 'Büyük haber başlığı'
+
+
+def test_extract_warc_skips_non_html_records(tmp_path):
+    path = tmp_path / 'crawl.warc'
+    with WarcWriter(path) as warc:
+        warc.write_response(URL + '.pdf', b'%PDF-1.4', content_type='application/pdf')
+        warc.write_response(URL, make_article().encode('utf-8'), content_type='text/html')
+
+    results = list(ArticleExtractor().extract_warc(path))
+
+    assert [url for url, _ in results] == [URL]
+
+
+def test_reprocess_warc_makes_no_requests(crawl, server):
+    output = io.StringIO()
+    summary = reprocess_warc([crawl], output, workers=1)
+
+    assert summary['total'] == summary['successes'] == 1
+    assert server.hits == []
+    assert json.loads(output.getvalue())['warc_date']
+
+
+def test_reprocess_warc_skips_non_html_records(tmp_path):
+    path = tmp_path / 'crawl.warc'
+    with WarcWriter(path) as warc:
+        warc.write_response(URL + '.pdf', b'%PDF-1.4', content_type='application/pdf')
+        warc.write_response(URL, make_article().encode('utf-8'), content_type='text/html')
+
+    output = io.StringIO()
+    summary = reprocess_warc([path], output, workers=1)
+
+    assert summary['total'] == summary['successes'] == 1
+    assert json.loads(output.getvalue())['url'] == URL
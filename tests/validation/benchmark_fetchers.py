@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fetch backends: requests (HTTP/1.1), HTTP/2 and curl multi.
+
+Starts a local TLS server (hypercorn, self-signed certificate) that serves
+article-sized pages with a fixed per-response delay, then downloads the
+same URLs through every backend with the same number of threads. Reports
+wall time, throughput, negotiated protocol and the TCP connections the
+server saw. A second server restricted to HTTP/1.1 via ALPN checks the
+automatic fallback.
+
+Requires: pip install 'httpx[http2]' hypercorn (and the openssl CLI);
+the curl multi backend is included when pycurl is installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import subprocess
+import tempfile
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from news_extractor.curl_multi import CurlMultiFetcher, pycurl
+from news_extractor.fetch import Fetcher, RequestsFetcher, build_session
+from news_extractor.http2 import Http2Fetcher
+
+PAGE = (
+    "<html><head><meta charset='utf-8'><title>Deneme</title></head><body><article>"
+    + ''.join(
+        f"<p>Türkçe haber metni, paragraf {i}. Güncel gelişmeler sürüyor.</p>" for i in range(400)
+    )
+    + "</article></body></html>"
+).encode('utf-8')
+
+
+class ArticleServer:
+    """ASGI app serving PAGE after ``delay`` seconds; records client sockets."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.clients: Set[Tuple[str, int]] = set()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope['type'] != 'http':
+            return
+        self.clients.add(tuple(scope['client']))
+        await asyncio.sleep(self.delay)
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'content-type', b'text/html; charset=utf-8')],
+        })
+        await send({'type': 'http.response.body', 'body': PAGE})
+
+
+def make_certificate(directory: Path) -> Tuple[str, str]:
+    cert, key = directory / 'cert.pem', directory / 'key.pem'
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=localhost', '-keyout', str(key), '-out', str(cert)],
+        check=True,
+        capture_output=True,
+    )
+    return str(cert), str(key)
+
+
+def start_server(app: ArticleServer, port: int, cert: str, key: str, alpn: List[str]) -> None:
+    config = Config()
+    config.bind = [f'127.0.0.1:{port}']
+    config.certfile, config.keyfile = cert, key
+    config.alpn_protocols = alpn
+    config.loglevel = 'WARNING'
+    config.h2_max_concurrent_streams = 1000
+    ready = threading.Event()
+
+    async def never() -> None:
+        await asyncio.Event().wait()
+
+    def run() -> None:
+        loop = asyncio.new_event_loop()
+        loop.call_soon(ready.set)
+        # An explicit trigger keeps hypercorn off signal handlers (main thread only)
+        loop.run_until_complete(serve(app, config, shutdown_trigger=never))
+
+    threading.Thread(target=run, daemon=True).start()
+    ready.wait()
+    time.sleep(0.5)
+
+
+def run_backend(fetcher: Fetcher, urls: List[str], threads: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(fetcher.fetch, urls))
+    return time.perf_counter() - started
+
+
+def backends(threads: int) -> Dict[str, Callable[[], Fetcher]]:
+    def requests_fetcher() -> Fetcher:
+        session = build_session(pool_maxsize=threads)
+        session.verify = False
+        session.trust_env = False  # a CA bundle from the environment would override verify
+        return RequestsFetcher(session)
+
+    factories: Dict[str, Callable[[], Fetcher]] = {
+        'requests': requests_fetcher,
+        'httpx/http2': lambda: Http2Fetcher(verify=False),
+    }
+    if pycurl is not None:
+        factories['curl-multi'] = lambda: CurlMultiFetcher(verify=False, max_host_connections=threads)
+    return factories
+
+
+def bench(port: int, app: ArticleServer, requests_count: int, threads: int, label: str) -> None:
+    urls = [f'https://127.0.0.1:{port}/haber/{index}' for index in range(requests_count)]
+    for name, factory in backends(threads).items():
+        fetcher = factory()
+        app.clients.clear()
+        elapsed = run_backend(fetcher, urls, threads)
+        protocols = fetcher.protocol_counts() if isinstance(fetcher, Http2Fetcher) else ''
+        print(f"{label:<22} {name:<12} {elapsed:6.2f}s  {requests_count / elapsed:7.1f} req/s"
+              f"  connections={len(app.clients):<3} {protocols}")
+        fetcher.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--delay', type=float, default=0.05, help='Server think time per response')
+    args = parser.parse_args()
+
+    warnings.filterwarnings('ignore', message='Unverified HTTPS request')
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = make_certificate(Path(tmp))
+        h2_app, h1_app = ArticleServer(args.delay), ArticleServer(args.delay)
+        start_server(h2_app, 8443, cert, key, ['h2', 'http/1.1'])
+        start_server(h1_app, 8444, cert, key, ['http/1.1'])
+
+        print(f"{args.requests} pages of {len(PAGE)} bytes, {args.threads} threads, "
+              f"{args.delay * 1000:.0f} ms server delay\n")
+        bench(8443, h2_app, args.requests, args.threads, 'server h2 + http/1.1')
+        bench(8444, h1_app, args.requests, args.threads, 'server http/1.1 only')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-article cost of the extraction profiles.
+
+Builds news pages of increasing size whose meta-tag image and inline
+images are served by a local HTTP server, then runs each tier under every
+profile on the same parsed page. The server counts requests: the tiers
+must not make any (the top image is chosen without downloads). Reports the best wall and CPU time per article over several
+rounds, and which fields each profile filled.
+
+Requires: pip install newspaper4k trafilatura (Pillow comes with newspaper4k)
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.document import HtmlDocument
+from news_extractor.profiles import PROFILES
+
+URL = 'https://www.example.com.tr/gundem/haber-123'
+WORDS = (
+    "haber gündem ekonomi spor dünya siyaset kültür sanat teknoloji sağlık "
+    "eğitim yerel açıklama bakanlık toplantı karar yatırım ve bir bu için ile da "
+    "daha çok gibi olarak"
+).split()
+FIELDS = ('title', 'text', 'authors', 'date', 'description', 'image')
+
+
+def make_image() -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', (800, 450), (180, 40, 40)).save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    body = make_image()
+    requests = 0
+
+    def do_GET(self) -> None:
+        ImageHandler.requests += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/jpeg')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def start_image_server() -> str:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ImageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_port}'
+
+
+def make_page(paragraphs: int, images: str, seed: int = 1) -> str:
+    """A news page with navigation, metadata, body images and a table."""
+    rng = random.Random(seed)
+
+    def sentence(length: int) -> str:
+        return ' '.join(rng.choice(WORDS) for _ in range(length)).capitalize() + '.'
+
+    nav = ''.join(f'<li><a href="/kategori/{i}">{sentence(2)}</a></li>' for i in range(100))
+    body = ''.join(
+        f'<p>{sentence(25)} {sentence(30)}</p>'
+        + (f'<figure><img src="{images}/body/{i}.jpg"></figure>' if i % 20 == 0 else '')
+        for i in range(paragraphs)
+    )
+    rows = ''.join(f'<tr><td>{sentence(3)}</td><td>{i}</td></tr>' for i in range(20))
+    return (
+        '<html lang="tr"><head><meta charset="utf-8"><title>Büyük haber başlığı</title>'
+        '<meta property="og:title" content="Büyük haber başlığı">'
+        f'<meta property="og:image" content="{images}/top.jpg">'
+        '<meta name="author" content="Ayşe Yılmaz">'
+        '<meta name="description" content="Haberin kısa özeti">'
+        '<meta name="keywords" content="gündem, ekonomi">'
+        '<meta property="article:published_time" content="2024-05-01T10:00:00+03:00">'
+        f'</head><body><nav><ul>{nav}</ul></nav><main><article><h1>Büyük haber başlığı</h1>'
+        '<div class="byline">Yazar: Ayşe Yılmaz</div>'
+        f'{body}<table>{rows}</table></article></main>'
+        '<footer>Tüm hakları saklıdır</footer></body></html>'
+    )
+
+
+def measure(function: Callable[[], Any], rounds: int) -> Tuple[float, float]:
+    """Best (wall ms, CPU ms) over ``rounds`` runs."""
+    wall, cpu = float('inf'), float('inf')
+    for _ in range(rounds):
+        started, started_cpu = time.perf_counter(), time.process_time()
+        function()
+        wall = min(wall, time.perf_counter() - started)
+        cpu = min(cpu, time.process_time() - started_cpu)
+    return wall * 1000, cpu * 1000
+
+
+def filled(result: Optional[Dict[str, Any]]) -> str:
+    if result is None:
+        return 'no result'
+    return ','.join(field for field in FIELDS if result.get(field))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[40, 200, 800],
+                        help='Article paragraphs per page')
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    images = start_image_server()
+    extractors = {name: ArticleExtractor(profile=name) for name in PROFILES}
+    print(f"{'page':>7}  {'tier':<12} {'profile':<14} {'wall ms':>8} {'cpu ms':>8}  fields")
+    for paragraphs in args.sizes:
+        html = make_page(paragraphs, images)
+        rows: List[str] = []
+        for tier in ('newspaper4k', 'trafilatura'):
+            for name, extractor in extractors.items():
+                extract = (
+                    extractor._extract_newspaper4k if tier == 'newspaper4k'
+                    else extractor._extract_trafilatura
+                )
+                # Parsing is shared by the chain, so it is kept out of the timing
+                document = HtmlDocument(html)
+                document.tree()
+
+                def run() -> Optional[Dict[str, Any]]:
+                    return extract(URL, document)
+
+                wall, cpu = measure(run, args.rounds)
+                rows.append(f"{len(html) // 1024:>4} KB  {tier:<12} {name:<14} "
+                            f"{wall:8.1f} {cpu:8.1f}  {filled(run())}")
+        print('\n'.join(rows))
+    print(f"\nimage requests made by the tiers: {ImageHandler.requests}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Trafilatura tier: JSON round trip vs the in-memory Document.
+
+Builds article pages of increasing size, parses each once (as the tier
+chain does) and runs Trafilatura both ways on the same tree:
+
+- json:   ``trafilatura.extract(output_format='json')`` + ``json.loads``
+          (the previous implementation)
+- memory: ``ArticleExtractor._extract_trafilatura`` (``bare_extraction``)
+
+Reports the best CPU time per article over several rounds and the peak
+Python allocation during one extraction (tracemalloc), and checks that
+both paths return the same fields.
+
+Requires: pip install trafilatura newspaper4k
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+import trafilatura
+
+from news_extractor.article_extractor import ArticleExtractor
+from news_extractor.document import HtmlDocument
+
+URL = 'https://www.example.com.tr/gundem/haber-123'
+WORDS = (
+    "haber gündem ekonomi spor dünya siyaset kültür sanat teknoloji sağlık "
+    "eğitim yerel açıklama bakanlık toplantı karar yatırım"
+).split()
+FIELDS = ('title', 'text', 'authors', 'date', 'description', 'image', 'categories')
+
+
+def make_page(paragraphs: int, seed: int = 1) -> str:
+    """A news page with navigation, a long article body, a table and a sidebar."""
+    rng = random.Random(seed)
+
+    def sentence(length: int) -> str:
+        return ' '.join(rng.choice(WORDS) for _ in range(length)).capitalize() + '.'
+
+    nav = ''.join(f'<li><a href="/kategori/{i}">{sentence(2)}</a></li>' for i in range(200))
+    body = ''.join(f'<p>{sentence(25)} {sentence(30)}</p>' for _ in range(paragraphs))
+    rows = ''.join(f'<tr><td>{sentence(3)}</td><td>{i}</td></tr>' for i in range(20))
+    side = ''.join(f'<div class="card"><img src="/img/{i}.jpg"><a href="/n/{i}">{sentence(6)}</a></div>'
+                   for i in range(60))
+    return (
+        '<html><head><meta charset="utf-8"><title>Büyük haber başlığı</title>'
+        '<meta property="og:title" content="Büyük haber başlığı">'
+        '<meta property="og:image" content="https://www.example.com.tr/top.jpg">'
+        '<meta name="author" content="Ayşe Yılmaz">'
+        '<meta name="description" content="Haberin kısa özeti">'
+        '<meta property="article:published_time" content="2024-05-01T10:00:00+03:00">'
+        f'</head><body><nav><ul>{nav}</ul></nav><main><article><h1>Büyük haber başlığı</h1>'
+        f'{body}<table>{rows}</table></article></main><aside>{side}</aside>'
+        '<footer>Tüm hakları saklıdır</footer></body></html>'
+    )
+
+
+def extract_json(document: HtmlDocument) -> Optional[Dict[str, Any]]:
+    """The previous implementation: serialise to JSON, then parse it back."""
+    json_str = trafilatura.extract(
+        document.tree(),
+        output_format='json',
+        include_comments=False,
+        include_tables=True,
+        with_metadata=True
+    )
+    if not json_str:
+        return None
+    data = json.loads(json_str)
+    return {
+        'title': data.get('title'),
+        'text': data.get('text', ''),
+        'authors': [data.get('author')] if data.get('author') else [],
+        'date': data.get('date'),
+        'description': data.get('excerpt'),
+        'image': data.get('image'),
+        'categories': data.get('categories'),
+    }
+
+
+def cpu_ms(function: Callable[[], Any], rounds: int) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.process_time()
+        function()
+        best = min(best, time.process_time() - started)
+    return best * 1000
+
+
+def peak_kib(function: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200, 800, 2000],
+                        help='Article paragraphs per page')
+    parser.add_argument('--rounds', type=int, default=7)
+    args = parser.parse_args()
+
+    extractor = ArticleExtractor()
+    print(f"{'page':>9}  {'json ms':>8}  {'memory ms':>9}  {'saved':>6}  "
+          f"{'json peak KiB':>13}  {'memory peak KiB':>15}")
+    for paragraphs in args.sizes:
+        document = HtmlDocument(make_page(paragraphs))
+        document.tree()  # both paths start from the shared parse
+
+        def memory() -> Optional[Dict[str, Any]]:
+            return extractor._extract_trafilatura(URL, document)
+
+        def round_trip() -> Optional[Dict[str, Any]]:
+            return extract_json(document)
+
+        expected, actual = round_trip(), memory()
+        if expected is None or actual is None:
+            raise SystemExit(f"no result for a {paragraphs}-paragraph page")
+        mismatched = [field for field in FIELDS if expected[field] != actual[field]]
+        if mismatched:
+            raise SystemExit(f"results differ in {', '.join(mismatched)}")
+
+        json_time, memory_time = cpu_ms(round_trip, args.rounds), cpu_ms(memory, args.rounds)
+        print(f"{len(document) // 1024:>6} KB  {json_time:8.1f}  {memory_time:9.1f}  "
+              f"{(1 - memory_time / json_time) * 100:5.1f}%  "
+              f"{peak_kib(round_trip):13.0f}  {peak_kib(memory):15.0f}")
+
+
+if __name__ == '__main__':
+    main()